@@ -0,0 +1,170 @@
+"""
+벤치마크용 XML 응답 코퍼스 생성 스크립트
+실제 Work24 응답과 같은 구조(210L21/210L31/310L01/310L02)의 XML을 결정적으로 생성
+
+    python benchmarks/fixtures.py          # benchmarks/fixtures/*.xml 재생성
+
+같은 이름의 녹화된 실제 응답(.xml)으로 교체해도 벤치마크는 그대로 동작합니다 (재생성 시 덮어씀).
+"""
+
+import random
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+PAGE_SIZES = (10, 50, 100)
+
+_COMPANIES = ["한빛소프트", "대한정밀", "미래에너지", "서울바이오", "누리로지스", "가온데이터", "한결식품", "세움건설"]
+_TITLES = ["신입/경력 공개채용", "연구개발 부문 채용", "하반기 정규직 공채", "IT 개발자 수시채용", "생산관리 직원 모집"]
+_COURSES = ["빅데이터 분석 실무", "웹 풀스택 개발자 양성", "AI 서비스 기획", "클라우드 인프라 엔지니어", "전기기능사 취득과정"]
+_ADDRESSES = ["서울특별시 강남구 테헤란로", "경기도 성남시 분당구 판교로", "부산광역시 해운대구 센텀중앙로", "대전광역시 유성구 대학로"]
+
+
+def _element(tag: str, value) -> str:
+    return f"<{tag}>{escape(str(value))}</{tag}>"
+
+
+def _record(tag: str, fields: dict) -> str:
+    return f"<{tag}>" + "".join(_element(k, v) for k, v in fields.items()) + f"</{tag}>"
+
+
+def _date(rng: random.Random) -> str:
+    return f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+
+
+def recruit_list(n: int, rng: random.Random) -> str:
+    """210L21 callTp=L: dhsOpenEmpInfoList > dhsOpenEmpInfo"""
+    items = []
+    for i in range(n):
+        seq = 100000 + i
+        items.append(_record("dhsOpenEmpInfo", {
+            "empSeqno": seq,
+            "empWantedTitle": f"{rng.choice(_COMPANIES)} {rng.choice(_TITLES)}",
+            "empBusiNm": rng.choice(_COMPANIES),
+            "coClcd": rng.choice(["10", "20", "30"]),
+            "coClcdNm": rng.choice(["대기업", "중견기업", "공기업"]),
+            "empWantedStdt": _date(rng),
+            "empWantedEndt": _date(rng),
+            "empWantedTypeNm": rng.choice(["정규직", "계약직", "인턴"]),
+            "regLogImgNm": f"https://www.work24.go.kr/logo/{seq}.png",
+            "empWantedHomepgDetail": f"https://recruit.example.co.kr/notice/{seq}",
+            "empWantedMobileUrl": f"https://m.recruit.example.co.kr/notice/{seq}",
+        }))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><dhsOpenEmpInfoList>'
+        f"<total>{n * 37}</total><startPage>1</startPage><display>{n}</display>"
+        + "".join(items) + "</dhsOpenEmpInfoList>"
+    )
+
+
+def company_list(n: int, rng: random.Random) -> str:
+    """210L31 callTp=L: dhsOpenEmpHireInfoList > dhsOpenEmpHireInfo"""
+    items = []
+    for i in range(n):
+        name = f"{rng.choice(_COMPANIES)}{i}"
+        items.append(_record("dhsOpenEmpHireInfo", {
+            "empCoNo": f"E{200000 + i}",
+            "coNm": name,
+            "busino": f"{rng.randint(100, 999)}{rng.randint(10, 99)}{rng.randint(10000, 99999)}",
+            "coClcd": rng.choice(["10", "20", "40"]),
+            "coClcdNm": rng.choice(["강소기업", "일생활균형우수기업", "청년친화강소기업"]),
+            "coIntroSummaryCont": f"{name}은(는) 지속 성장하는 우수 강소기업입니다.",
+            "coIntroCont": f"{name} 소개. " * 8,
+            "mainBusiCont": "소프트웨어 개발 및 공급, 시스템 통합 구축",
+            "homepg": f"https://www.company{i}.co.kr",
+            "regLogImgNm": f"https://www.work24.go.kr/logo/co{i}.png",
+            "mapCoorX": f"{rng.uniform(126.5, 129.3):.6f}",
+            "mapCoorY": f"{rng.uniform(34.8, 37.9):.6f}",
+        }))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><dhsOpenEmpHireInfoList>'
+        f"<total>{n * 12}</total><startPage>1</startPage><display>{n}</display>"
+        + "".join(items) + "</dhsOpenEmpHireInfoList>"
+    )
+
+
+def training_list(n: int, rng: random.Random) -> str:
+    """310L01: HRDNet > srchList > scn_list"""
+    items = []
+    for i in range(n):
+        items.append(_record("scn_list", {
+            "trprId": f"AIG2026{300000 + i}",
+            "trprDegr": rng.randint(1, 5),
+            "title": rng.choice(_COURSES),
+            "subTitle": f"{rng.choice(_COMPANIES)}아카데미",
+            "address": f"{rng.choice(_ADDRESSES)} {rng.randint(1, 300)}",
+            "telNo": f"02-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}",
+            "traStartDate": f"2026-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d}",
+            "traEndDate": f"2026-{rng.randint(7, 12):02d}-{rng.randint(1, 28):02d}",
+            "ncsCd": f"20010{rng.randint(1, 9)}0{rng.randint(1, 9)}",
+            "courseMan": rng.randint(500, 12000) * 1000,
+            "realMan": rng.randint(0, 500) * 1000,
+            "eiEmplRate3": rng.randint(0, 100),
+            "stdgScor": rng.randint(0, 500),
+            "trainstCstId": f"5000{rng.randint(10000, 99999)}",
+            "trainTarget": rng.choice(["국민내일배움카드(일반)", "K-디지털 트레이닝"]),
+            "trainTargetCd": rng.choice(["C0061", "C0061S", "C0054"]),
+            "titleLink": f"https://www.work24.go.kr/hr/a/a/3100/selectTracseDetl.do?tracseId={i}",
+        }))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><HRDNet>'
+        f"<scn_cnt>{n * 21}</scn_cnt><pageNum>1</pageNum><pageSize>{n}</pageSize>"
+        "<srchList>" + "".join(items) + "</srchList></HRDNet>"
+    )
+
+
+def training_detail(rng: random.Random) -> str:
+    """310L02: HRDNet > inst_base_info / inst_detail_info"""
+    base = _record("inst_base_info", {
+        "trprId": "AIG20263000001",
+        "trprDegr": 1,
+        "trprNm": rng.choice(_COURSES),
+        "inoNm": f"{rng.choice(_COMPANIES)}아카데미",
+        "hpAddr": "https://academy.example.co.kr",
+        "addr": rng.choice(_ADDRESSES),
+        "telNo": "02-1234-5678",
+        "ncsCd": "20010201",
+        "ncsNm": "응용SW엔지니어링",
+        "crseTracseSe": "C0061S",
+    })
+    detail = _record("inst_detail_info", {
+        "trDcnt": 120,
+        "trtm": 960,
+        "courseMan": 9600000,
+        "realMan": 0,
+        "trgtCat": "구직자",
+        "trainGoal": "현업 수준의 데이터 분석 역량을 갖춘 실무 인재 양성. " * 10,
+    })
+    facilities = "".join(
+        _record("inst_facility_info", {"trafclNm": f"강의실{i}", "holdQy": rng.randint(20, 40)})
+        for i in range(5)
+    )
+    return '<?xml version="1.0" encoding="UTF-8"?><HRDNet>' + base + detail + facilities + "</HRDNet>"
+
+
+def fixture_name(short: str, kind: str, n: int | None = None) -> str:
+    return f"{short}_{kind}_{n}.xml" if n is not None else f"{short}_{kind}.xml"
+
+
+def build_corpus() -> dict[str, str]:
+    """All fixtures by file name (deterministic: fixed seeds)."""
+    corpus: dict[str, str] = {}
+    for n in PAGE_SIZES:
+        corpus[fixture_name("210L21", "list", n)] = recruit_list(n, random.Random(21 + n))
+        corpus[fixture_name("210L31", "list", n)] = company_list(n, random.Random(31 + n))
+        corpus[fixture_name("310L01", "list", n)] = training_list(n, random.Random(301 + n))
+    corpus[fixture_name("310L02", "detail")] = training_detail(random.Random(302))
+    return corpus
+
+
+def main() -> int:
+    FIXTURE_DIR.mkdir(exist_ok=True)
+    for name, text in build_corpus().items():
+        (FIXTURE_DIR / name).write_text(text, encoding="utf-8")
+        print(f"{name}: {len(text.encode('utf-8')):,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+"""
+파싱/매핑/청년 매칭 핫패스 마이크로벤치마크
+네트워크 없이 benchmarks/fixtures/*.xml 코퍼스로 측정하고 기준값(baseline.json)과 비교
+
+    python benchmarks/run.py                     # 측정 + 기준값 대비 회귀 검사
+    python benchmarks/run.py --filter parse/     # 이름에 'parse/'가 포함된 항목만
+    python benchmarks/run.py --update-baseline   # 현재 측정값을 기준값으로 저장
+
+회귀(기준값 대비 threshold 초과 느려짐)가 있거나 baseline.json이 없으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import FIXTURE_DIR, PAGE_SIZES, build_corpus, fixture_name
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# 기본 허용 회귀율 (20% 이상 느려지면 실패)
+DEFAULT_THRESHOLD = 0.20
+# 측정값이 작아 노이즈가 큰 항목은 허용 폭을 넓게
+THRESHOLDS = {
+    "map/training_detail": 0.35,
+    "parse/stream/310L02_detail": 0.35,
+    "parse/xmltodict/310L02_detail": 0.35,
+}
+
+# 스트리밍 파서에 넣을 청크 크기 (httpx aiter_bytes 기본 청크와 비슷하게)
+CHUNK_SIZE = 16 * 1024
+
+Benchmark = tuple[str, Callable[[], Any]]
+
+
+def load_corpus() -> dict[str, bytes]:
+    """Fixture bytes by file name; missing files are generated in memory."""
+    generated = None
+    corpus = {}
+    for name in _fixture_names():
+        path = FIXTURE_DIR / name
+        if path.exists():
+            corpus[name] = path.read_bytes()
+        else:
+            generated = generated or build_corpus()
+            corpus[name] = generated[name].encode("utf-8")
+    return corpus
+
+
+def _fixture_names() -> list[str]:
+    names = []
+    for short in ("210L21", "210L31", "310L01"):
+        names += [fixture_name(short, "list", n) for n in PAGE_SIZES]
+    names.append(fixture_name("310L02", "detail"))
+    return names
+
+
+def _endpoint_of(name: str) -> str:
+    return f"callOpenApiSvcInfo{name.split('_', 1)[0]}"
+
+
+def _stream_parse(item_path: tuple[str, ...], body: bytes) -> dict:
+    from utils.xml_stream import StreamingItemParser
+
+    parser = StreamingItemParser(item_path)
+    for i in range(0, len(body), CHUNK_SIZE):
+        parser.feed(body[i:i + CHUNK_SIZE])
+    return parser.close()
+
+
+def _items(doc: dict, item_path: tuple[str, ...]) -> list:
+    node: Any = doc
+    for key in item_path:
+        node = node.get(key) if isinstance(node, dict) else None
+    if node is None:
+        return []
+    return node if isinstance(node, list) else [node]
+
+
+# ------------------------------------------------------------
+# 벤치마크 그룹 (그룹별로 필요한 의존성만 import)
+# ------------------------------------------------------------
+def parse_xmltodict_benchmarks(corpus: dict[str, bytes]) -> list[Benchmark]:
+    import xmltodict
+
+    return [
+        (f"parse/xmltodict/{name[:-4]}", lambda text=body.decode("utf-8"): xmltodict.parse(text))
+        for name, body in corpus.items()
+    ]
+
+
+def parse_stream_benchmarks(corpus: dict[str, bytes]) -> list[Benchmark]:
+    from utils.endpoints import get_endpoint_spec
+
+    benchmarks = []
+    for name, body in corpus.items():
+        item_path = get_endpoint_spec(_endpoint_of(name)).item_path
+        benchmarks.append((
+            f"parse/stream/{name[:-4]}",
+            lambda item_path=item_path, body=body: _stream_parse(item_path, body),
+        ))
+    return benchmarks
+
+
+def map_benchmarks(corpus: dict[str, bytes]) -> list[Benchmark]:
+    from tools.company_tools import _map_company_item
+    from tools.recruit_tools import _map_recruit_item
+    from tools.training_tools import _map_training_detail, _map_training_item
+    from utils.endpoints import get_endpoint_spec
+
+    mappers = {"210L21": ("recruit_list", _map_recruit_item),
+               "210L31": ("company_list", _map_company_item),
+               "310L01": ("training_list", _map_training_item)}
+    benchmarks = []
+    for short, (label, mapper) in mappers.items():
+        item_path = get_endpoint_spec(_endpoint_of(short)).item_path
+        for n in PAGE_SIZES:
+            doc = _stream_parse(item_path, corpus[fixture_name(short, "list", n)])
+            items = _items(doc, item_path)
+            benchmarks.append((
+                f"map/{label}/{n}",
+                lambda mapper=mapper, items=items: [mapper(item) for item in items],
+            ))
+
+    detail_path = get_endpoint_spec(_endpoint_of("310L02")).item_path
+    root = _stream_parse(detail_path, corpus[fixture_name("310L02", "detail")])["HRDNet"]
+    benchmarks.append(("map/training_detail", lambda: _map_training_detail(root)))
+    return benchmarks
+
+
+def serialize_benchmarks(corpus: dict[str, bytes]) -> list[Benchmark]:
+    from tools.training_tools import TrainingRecord, _map_training_item
+    from utils.endpoints import get_endpoint_spec
+    from utils.serialization import encode_result
+
+    item_path = get_endpoint_spec(_endpoint_of("310L01")).item_path
+    benchmarks = []
+    for n in PAGE_SIZES:
+        doc = _stream_parse(item_path, corpus[fixture_name("310L01", "list", n)])
+        items = [_map_training_item(item) for item in _items(doc, item_path)]
+        result = {"total": n, "items": items}
+        benchmarks += [
+            (f"serialize/training_list/{n}", lambda result=result: encode_result(result)),
+            (f"record/training_list/{n}", lambda items=items: [TrainingRecord.from_dict(i) for i in items]),
+        ]
+    return benchmarks
+
+
+def youth_benchmarks(corpus: dict[str, bytes]) -> list[Benchmark]:
+    from tools.youth_program_tools import match_youth_programs
+
+    profiles = {
+        "job_seeker": dict(age=27, employment_status="구직자"),
+        "student_prefs": dict(age=23, employment_status="학생", education_status="재학",
+                              preferences=["employment", "allowance"]),
+        "worker_region": dict(age=31, employment_status="재직자", region="서울"),
+    }
+    return [
+        (f"youth/match/{label}", lambda kwargs=kwargs: _run_sync(match_youth_programs(**kwargs)))
+        for label, kwargs in profiles.items()
+    ]
+
+
+def _run_sync(coro):
+    """Drive a coroutine that never awaits (avoids event loop overhead per call)."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("benchmarked coroutine awaited unexpectedly")
+
+
+GROUPS = (
+    parse_xmltodict_benchmarks,
+    parse_stream_benchmarks,
+    map_benchmarks,
+    serialize_benchmarks,
+    youth_benchmarks,
+)
+
+
+# ------------------------------------------------------------
+# 측정 / 비교
+# ------------------------------------------------------------
+def measure(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Seconds per call: best and median of `repeat` autoranged runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(runs), "median": statistics.median(runs)}
+
+
+def threshold_for(name: str, default: float) -> float:
+    for prefix, value in THRESHOLDS.items():
+        if name.startswith(prefix):
+            return value
+    return default
+
+
+def _format_us(seconds: float) -> str:
+    return f"{seconds * 1e6:10.1f}us"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Work24 MCP hot path benchmarks")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (default: 5)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown vs baseline (default: 0.20 = 20%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="write results to baseline.json")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    benchmarks: list[Benchmark] = []
+    for group in GROUPS:
+        try:
+            benchmarks += group(corpus)
+        except ImportError as e:
+            print(f"skip {group.__name__}: {e}")
+    benchmarks = [(name, fn) for name, fn in benchmarks if args.filter in name]
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get("results", {})
+
+    results: dict[str, float] = {}
+    regressions = []
+    print(f"{'benchmark':45} {'best':>12} {'median':>12} {'baseline':>12} {'change':>8}")
+    for name, fn in benchmarks:
+        timing = measure(fn, args.repeat)
+        results[name] = timing["best"]
+        line = f"{name:45} {_format_us(timing['best'])} {_format_us(timing['median'])}"
+        base = baseline.get(name)
+        if base:
+            change = timing["best"] / base - 1
+            line += f" {_format_us(base)} {change:+7.1%}"
+            if change > threshold_for(name, args.threshold):
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.update_baseline:
+        merged = {**baseline, **results}
+        BASELINE_PATH.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+            "unit": "seconds per call (best of runs)",
+            "results": dict(sorted(merged.items())),
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline updated: {BASELINE_PATH} ({len(results)} results)")
+        return 0
+
+    if not baseline:
+        # 기준값 없이는 회귀를 검출할 수 없으므로 CI에서 통과시키지 않음
+        print(f"no baseline at {BASELINE_PATH}; run with --update-baseline to record one")
+        return 1
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"{len(missing)} benchmark(s) without baseline: {', '.join(missing)}")
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
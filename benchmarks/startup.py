@@ -0,0 +1,118 @@
+"""
+서버 시작 시간 벤치마크 + import 시간 프로파일
+MCP 클라이언트가 세션마다 `uv run python server.py`를 실행하므로 import 시간이 곧 사용자 대기 시간
+
+    python benchmarks/startup.py                   # 시작 시간 측정 + 예산(budget) 검사
+    python benchmarks/startup.py --profile         # -X importtime 상위 모듈 보고서
+    python benchmarks/startup.py --report out.txt  # 전체 -X importtime 출력 저장
+
+`import server` 중앙값이 --budget-ms(인터프리터 기동 시간 제외)를 넘으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 기본 시작 시간 예산 (ms, 인터프리터 기동 시간 제외)
+DEFAULT_BUDGET_MS = 600.0
+
+# 측정 대상: 이름 -> python -c 코드
+TARGETS = {
+    "interpreter": "pass",
+    "server": "import server",
+    # 첫 도구 호출 시 추가로 로드되는 모듈까지 포함 (lazy init으로 미뤄진 비용)
+    "server+tools": "import server; server._load_tools()",
+}
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+def measure(code: str, runs: int) -> list[float]:
+    """Wall-clock seconds of `python -c code` per run (after one warm-up run)."""
+    first = _run(code)
+    if first.returncode != 0:
+        raise RuntimeError(first.stderr.strip().splitlines()[-1] if first.stderr else "failed")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(code)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str, bool]]:
+    """(self us, cumulative us, module, top-level) per line of -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # 중첩 import는 이름 앞 공백으로 들여쓰기됨
+        name = name[1:].rstrip()
+        rows.append((int(self_us), int(cumulative_us), name.strip(), not name.startswith(" ")))
+    return rows
+
+
+def print_profile(rows: list[tuple[int, int, str, bool]], top: int) -> None:
+    total = sum(row[1] for row in rows if row[3])
+    print(f"\nimport time: {total / 1000:.1f}ms total, {len(rows)} modules")
+    print(f"\ntop {top} by cumulative time:")
+    for _, cumulative_us, name, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+    print(f"\ntop {top} by self time:")
+    for self_us, _, name, _ in sorted(rows, key=lambda r: r[0], reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Work24 MCP server startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="timed runs per target (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"budget for 'import server' minus interpreter start (default: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--profile", action="store_true", help="print -X importtime top modules")
+    parser.add_argument("--top", type=int, default=25, help="modules listed in the profile (default: 25)")
+    parser.add_argument("--report", type=Path, help="write the raw -X importtime output to this file")
+    args = parser.parse_args(argv)
+
+    medians: dict[str, float] = {}
+    print(f"{'target':15} {'best':>10} {'median':>10} {'- interp':>10}")
+    for name, code in TARGETS.items():
+        try:
+            timings = measure(code, args.runs)
+        except RuntimeError as e:
+            print(f"{name:15} failed: {e}")
+            return 2
+        medians[name] = statistics.median(timings)
+        overhead = medians[name] - medians.get("interpreter", 0.0)
+        print(f"{name:15} {min(timings) * 1000:8.1f}ms {medians[name] * 1000:8.1f}ms {overhead * 1000:8.1f}ms")
+
+    if args.profile or args.report:
+        stderr = _run(TARGETS["server"], "-X", "importtime").stderr
+        if args.profile:
+            print_profile(parse_importtime(stderr), args.top)
+        if args.report:
+            args.report.write_text(stderr, encoding="utf-8")
+            print(f"\nimporttime report written: {args.report}")
+
+    startup_ms = (medians["server"] - medians["interpreter"]) * 1000
+    if startup_ms > args.budget_ms:
+        print(f"\nOVER BUDGET: import server {startup_ms:.1f}ms > {args.budget_ms:.0f}ms")
+        return 1
+    print(f"\nimport server {startup_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,19 +17,19 @@ class CompanySearchRequest(BaseModel):
 
 
 class CompanyItem(BaseModel):
-    """Single company item."""
+    """Single company item (find_strong_company, 210L31)."""
     company_id: str = Field(description="Company ID")
     company_name: str = Field(description="Company name")
     company_type: Optional[str] = Field(default=None, description="Company type")
     business_no: Optional[str] = Field(default=None, description="Business registration number")
-    industry: Optional[str] = Field(default=None, description="Industry type")
-    address: Optional[str] = Field(default=None, description="Company address")
+    summary: Optional[str] = Field(default=None, description="One-line company introduction")
+    description: Optional[str] = Field(default=None, description="Company introduction")
     homepage: Optional[str] = Field(default=None, description="Company website")
     main_business: Optional[str] = Field(default=None, description="Main business description")
-    employee_count: Optional[int] = Field(default=None, description="Number of employees")
-    revenue: Optional[str] = Field(default=None, description="Annual revenue")
+    logo_url: Optional[str] = Field(default=None, description="Company logo URL")
     latitude: Optional[float] = Field(default=None, description="Latitude")
     longitude: Optional[float] = Field(default=None, description="Longitude")
+    distance_km: Optional[float] = Field(default=None, description="Distance from the search center (find_nearby_company only)")
 
 
 class CompanySearchResponse(BaseModel):
@@ -20,21 +20,16 @@ class RecruitSearchRequest(BaseModel):
 
 
 class RecruitItem(BaseModel):
-    """Single recruit notice item."""
-    wanted_auth_no: str = Field(description="Unique job posting ID")
+    """Single recruit notice item (find_recruit_notice, 210L21 callTp=L)."""
+    emp_seqno: str = Field(description="Unique job posting ID (empSeqno)")
     company: str = Field(description="Company name")
     title: str = Field(description="Job title")
-    region: str = Field(description="Work location")
-    industry: Optional[str] = Field(default=None, description="Industry type")
-    salary_type: Optional[str] = Field(default=None, description="Salary type code")
-    salary_text: Optional[str] = Field(default=None, description="Human-readable salary range")
-    min_salary: Optional[int] = Field(default=None, description="Minimum salary")
-    max_salary: Optional[int] = Field(default=None, description="Maximum salary")
+    company_type: Optional[str] = Field(default=None, description="Company type (대기업, 공기업, etc.)")
     employment_type: Optional[str] = Field(default=None, description="Employment type (정규직, 계약직, etc.)")
-    education: Optional[str] = Field(default=None, description="Required education")
-    career: Optional[str] = Field(default=None, description="Required career level")
-    close_date: Optional[str] = Field(default=None, description="Application deadline")
-    wanted_info_url: Optional[str] = Field(default=None, description="Job posting URL")
+    start_date: Optional[str] = Field(default=None, description="Application start date (YYYY-MM-DD)")
+    end_date: Optional[str] = Field(default=None, description="Application deadline (YYYY-MM-DD)")
+    logo_url: Optional[str] = Field(default=None, description="Company logo URL")
+    detail_url: Optional[str] = Field(default=None, description="Job posting URL")
     mobile_url: Optional[str] = Field(default=None, description="Mobile URL")
 
 
@@ -47,17 +42,14 @@ class RecruitSearchResponse(BaseModel):
 
 
 class RecruitDetailResponse(BaseModel):
-    """Response model for recruit notice detail."""
-    wanted_auth_no: str = Field(description="Unique job posting ID")
+    """Response model for recruit notice detail (get_recruit_detail, 210L21 callTp=D)."""
+    emp_seqno: str = Field(description="Unique job posting ID (empSeqno)")
     company: str = Field(description="Company name")
     title: str = Field(description="Job title")
-    main_duties: Optional[str] = Field(default=None, description="Main job duties")
-    requirements: Optional[str] = Field(default=None, description="Job requirements")
-    preferred: Optional[str] = Field(default=None, description="Preferred qualifications")
-    hiring_process: Optional[str] = Field(default=None, description="Hiring process description")
-    region: Optional[str] = Field(default=None, description="Work location")
-    work_type: Optional[str] = Field(default=None, description="Work schedule type")
+    company_type: Optional[str] = Field(default=None, description="Company type")
     employment_type: Optional[str] = Field(default=None, description="Employment type")
-    salary_text: Optional[str] = Field(default=None, description="Salary information")
-    company_info: Optional[str] = Field(default=None, description="Company description")
-    benefits: Optional[str] = Field(default=None, description="Benefits and perks")
+    start_date: Optional[str] = Field(default=None, description="Application start date (YYYY-MM-DD)")
+    end_date: Optional[str] = Field(default=None, description="Application deadline (YYYY-MM-DD)")
+    detail_url: Optional[str] = Field(default=None, description="Job posting URL")
+    mobile_url: Optional[str] = Field(default=None, description="Mobile URL")
+    raw_data: Optional[dict] = Field(default=None, description="Unmapped upstream record (include_raw=true only)")
@@ -22,23 +22,24 @@ class TrainingSearchRequest(BaseModel):
 
 
 class TrainingItem(BaseModel):
-    """Single training course item."""
+    """Single training course item (find_training_course, 310L01)."""
     course_id: str = Field(description="Course ID (TRPR_ID)")
     course_round: str = Field(description="Course round number")
     title: str = Field(description="Course title")
     provider_name: str = Field(description="Training provider name")
     address: Optional[str] = Field(default=None, description="Provider address")
     phone: Optional[str] = Field(default=None, description="Contact phone")
-    start_date: str = Field(description="Training start date")
-    end_date: str = Field(description="Training end date")
+    start_date: Optional[str] = Field(default=None, description="Training start date")
+    end_date: Optional[str] = Field(default=None, description="Training end date")
     ncs_code: Optional[str] = Field(default=None, description="NCS classification code")
-    ncs_name: Optional[str] = Field(default=None, description="NCS classification name")
     tuition: Optional[int] = Field(default=None, description="Total tuition (KRW)")
     support_amount: Optional[int] = Field(default=None, description="Government support amount (KRW)")
-    real_cost: Optional[int] = Field(default=None, description="Actual training cost (KRW)")
     employment_rate_3m: Optional[str] = Field(default=None, description="3-month employment rate (%)")
     satisfaction_score: Optional[str] = Field(default=None, description="Trainee satisfaction score")
     org_id: Optional[str] = Field(default=None, description="Training organization ID")
+    train_target: Optional[str] = Field(default=None, description="Training target (e.g. 국민내일배움카드(일반))")
+    title_link: Optional[str] = Field(default=None, description="Course page URL")
+    course_type: Optional[str] = Field(default=None, description="Training type code (e.g. C0061S)")
 
 
 class TrainingSearchResponse(BaseModel):
@@ -28,6 +28,7 @@ class YouthProgram(BaseModel):
     target_age_max: int = Field(description="Maximum age for eligibility")
     target_employment_status: list[str] = Field(description="Target employment status (구직자, 재직자, 창업자, etc.)")
     target_education_status: list[str] = Field(default=[], description="Target education status")
+    regions: list[str] = Field(default=[], description="Eligible regions (empty = nationwide)")
     benefits: list[str] = Field(description="Key benefits")
     apply_channel: str = Field(description="Application channel/method")
     apply_url: Optional[str] = Field(default=None, description="Application URL")
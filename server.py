@@ -5,22 +5,42 @@ FastMCP 기반 MCP 서버 - 고용24 OPEN API 도구 제공
 Local:
     uvicorn server:http_app --reload --port 8000
     # 또는: python server.py
+    # 멀티 워커: WORK24_WORKERS=4 python server.py
+    # stdio (MCP 클라이언트가 직접 실행): WORK24_TRANSPORT=stdio python server.py
+
+도구 모듈(httpx/xmltodict/로컬 스토어)은 첫 도구 호출 시 import 합니다 (시작 시간 단축).
 
 Public Endpoint 예:
     http://<host>:8000/mcp
 """
 
 import sys
+import asyncio
+import importlib
 import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from utils.config import env_bool, env_int, env_str
+from utils.deadline import with_deadline
+from utils.metrics import instrument_tool, render_metrics
+from utils.serialization import encode_result
+
+if TYPE_CHECKING:
+    from stores.sync import PeriodicSync
 
-# Tool imports
-from tools.recruit_tools import find_recruit_notice, get_recruit_detail
-from tools.training_tools import find_training_course, get_training_course_detail
-from tools.company_tools import find_strong_company
-from tools.youth_program_tools import list_youth_programs, match_youth_programs
+# Tool modules: 각 도구 함수 안에서 import (첫 호출 시 로드)
+TOOL_MODULES = (
+    "tools.recruit_tools",
+    "tools.training_tools",
+    "tools.company_tools",
+    "tools.youth_program_tools",
+    "tools.batch_tools",
+    "tools.snapshot_tools",
+)
 
 # ------------------------------------------------------------
 # Logging
@@ -32,11 +52,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger("work24_mcp_server")
 
+# ------------------------------------------------------------
+# Lifespan (프로세스 단위: 공유 HTTP 풀, 디스크 캐시 warm-load, 백그라운드 동기화)
+# ------------------------------------------------------------
+def background_syncs() -> dict[str, "PeriodicSync"]:
+    """Background sync jobs enabled by environment variables."""
+    from stores.company_index import company_index_enabled, company_index_sync
+    from stores.recruit_mirror import mirror_enabled, recruit_mirror_sync
+    from stores.training_catalog import catalog_enabled, training_catalog_sync
+
+    jobs: dict[str, PeriodicSync] = {}
+    if mirror_enabled():
+        jobs["recruit_mirror"] = recruit_mirror_sync
+    if catalog_enabled():
+        jobs["training_catalog"] = training_catalog_sync
+    if company_index_enabled():
+        jobs["company_index"] = company_index_sync
+    return jobs
+
+
+def lazy_init_enabled() -> bool:
+    """
+    Whether startup defers tool imports and cache warm-up (WORK24_LAZY_INIT).
+
+    Defaults to on for stdio, where the client spawns a process per session
+    and waits for it; HTTP servers load everything before serving instead.
+    """
+    return env_bool("WORK24_LAZY_INIT", transport() == "stdio")
+
+
+def transport() -> str:
+    return env_str("WORK24_TRANSPORT", "streamable-http")
+
+
+def _load_tools() -> None:
+    """Import every tool module (and httpx/xmltodict/stores through them)."""
+    for name in TOOL_MODULES:
+        importlib.import_module(name)
+
+
+@asynccontextmanager
+async def runtime():
+    """
+    Process-wide resources: shared HTTP pool, cache warm-up, background syncs.
+
+    Entered once per process (per worker) around the Starlette app lifespan
+    or the stdio run - not from the FastMCP lifespan, which runs once per
+    MCP session (every request with stateless_http=True).
+    """
+    from utils.cache import response_cache
+    from utils.http_pool import http_pool
+    from utils.prefetch import prefetcher
+
+    warm_task = None
+    if lazy_init_enabled():
+        # 첫 도구 호출을 막지 않도록 캐시 적재는 백그라운드로
+        warm_task = asyncio.create_task(asyncio.to_thread(response_cache.warm))
+    else:
+        _load_tools()
+        # 재시작 직후 콜드 캐시로 업스트림에 몰리지 않도록 자주 쓰인 응답을 미리 적재
+        await asyncio.to_thread(response_cache.warm)
+    await http_pool.acquire()
+    jobs = background_syncs()
+    for job in jobs.values():
+        job.start()
+    try:
+        yield
+    finally:
+        for job in jobs.values():
+            await job.stop()
+        await prefetcher.close()
+        if warm_task is not None:
+            await asyncio.gather(warm_task, return_exceptions=True)
+        await http_pool.release()
+        await asyncio.to_thread(response_cache.close)
+
+
+def _with_runtime(app):
+    """Run runtime() around a Starlette app's own lifespan (MCP session manager)."""
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with runtime(), app_lifespan(app) as state:
+            yield state
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
 # ------------------------------------------------------------
 # FastMCP 서버 인스턴스
 # ------------------------------------------------------------
 mcp = FastMCP(
     name="work24-mcp-server",
+    # 결과 텍스트는 들여쓰기 없는 compact JSON
+    tool_serializer=encode_result,
 )
 
 # ------------------------------------------------------------
@@ -54,10 +165,34 @@ async def root(request):
         }
     )
 
+
+@mcp.custom_route("/stats", methods=["GET"])
+async def stats(request):
+    """내부 상태 통계 (HTTP 커넥션 풀, 응답 캐시, 요청 병합, 로컬 동기화 등)."""
+    from stores.youth_programs import youth_program_catalog
+    from utils.http_client import client_stats
+
+    stats = client_stats()
+    for name, job in background_syncs().items():
+        stats[name] = job.stats()
+    stats["youth_programs"] = youth_program_catalog.stats()
+    return JSONResponse(stats)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request):
+    """Prometheus 메트릭 (도구/업스트림 지연, 에러, in-flight)."""
+    return PlainTextResponse(
+        render_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
 # ------------------------------------------------------------
 # 1. 채용 축 (Recruit / 공채속보)
 # ------------------------------------------------------------
 @mcp.tool()
+@instrument_tool
+@with_deadline
 async def find_recruit_notice_tool(
     page: int = 1,
     page_size: int = 10,
@@ -68,8 +203,15 @@ async def find_recruit_notice_tool(
     max_salary: int | None = None,
     education_code: str | None = None,
     career_type: str | None = None,
+    source: str = "live",
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
-    logger.info("find_recruit_notice_tool called page=%s, size=%s", page, page_size)
+    from tools.recruit_tools import find_recruit_notice
+
+    logger.info("find_recruit_notice_tool called page=%s, size=%s, source=%s", page, page_size, source)
     result = await find_recruit_notice(
         page=page,
         page_size=page_size,
@@ -80,19 +222,41 @@ async def find_recruit_notice_tool(
         max_salary=max_salary,
         education_code=education_code,
         career_type=career_type,
+        source=source,
+        fetch_all=fetch_all,
+        max_items=max_items,
+        fields=fields,
+        compact=compact,
+        prefetch=True,
     )
     logger.info("find_recruit_notice_tool returned %d items", len(result.get("items", [])))
     return result
 
 
 @mcp.tool()
-async def get_recruit_detail_tool(emp_seqno: str) -> dict:
-    return await get_recruit_detail(emp_seqno)
+@instrument_tool
+@with_deadline
+async def get_recruit_detail_tool(
+    emp_seqno: str,
+    fields: list[str] | None = None,
+    compact: bool = False,
+    include_raw: bool = False,
+) -> dict:
+    from tools.recruit_tools import get_recruit_detail
+
+    return await get_recruit_detail(
+        emp_seqno,
+        fields=fields,
+        compact=compact,
+        include_raw=include_raw,
+    )
 
 # ------------------------------------------------------------
 # 2. 훈련 축 (Training)
 # ------------------------------------------------------------
 @mcp.tool()
+@instrument_tool
+@with_deadline
 async def find_training_course_tool(
     start_date: str,
     end_date: str,
@@ -103,7 +267,14 @@ async def find_training_course_tool(
     course_type: str | None = None,
     keyword: str | None = None,
     provider_name: str | None = None,
+    source: str = "live",
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
+    from tools.training_tools import find_training_course
+
     return await find_training_course(
         start_date=start_date,
         end_date=end_date,
@@ -114,79 +285,255 @@ async def find_training_course_tool(
         course_type=course_type,
         keyword=keyword,
         provider_name=provider_name,
+        source=source,
+        fetch_all=fetch_all,
+        max_items=max_items,
+        fields=fields,
+        compact=compact,
+        prefetch=True,
     )
 
 
 @mcp.tool()
+@instrument_tool
+@with_deadline
 async def get_training_course_detail_tool(
     course_id: str,
     course_round: str = "1",
     org_id: str = "",
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
+    from tools.training_tools import get_training_course_detail
+
     return await get_training_course_detail(
         course_id=course_id,
         course_round=course_round,
         org_id=org_id,
+        fields=fields,
+        compact=compact,
     )
 
 # ------------------------------------------------------------
 # 3. 기업 축 (Company)
 # ------------------------------------------------------------
 @mcp.tool()
+@instrument_tool
+@with_deadline
 async def find_strong_company_tool(
     company_type_codes: list[str] | None = None,
     company_name: str | None = None,
     page: int = 1,
     page_size: int = 10,
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
+    from tools.company_tools import find_strong_company
+
     return await find_strong_company(
         company_type_codes=company_type_codes,
         company_name=company_name,
         page=page,
         page_size=page_size,
+        fetch_all=fetch_all,
+        max_items=max_items,
+        fields=fields,
+        compact=compact,
+    )
+
+
+@mcp.tool()
+@instrument_tool
+@with_deadline
+async def find_nearby_company_tool(
+    latitude: float,
+    longitude: float,
+    radius_km: float | None = None,
+    limit: int = 10,
+    company_type_codes: list[str] | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    from tools.company_tools import find_nearby_company
+
+    return await find_nearby_company(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        limit=limit,
+        company_type_codes=company_type_codes,
+        fields=fields,
+        compact=compact,
     )
 
 # ------------------------------------------------------------
 # 4. 청년 프로그램 축 (Youth Programs)
 # ------------------------------------------------------------
 @mcp.tool()
-async def list_youth_programs_tool() -> dict:
-    return await list_youth_programs()
+@instrument_tool
+@with_deadline
+async def list_youth_programs_tool(
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    from tools.youth_program_tools import list_youth_programs
+
+    return await list_youth_programs(fields=fields, compact=compact)
 
 
 @mcp.tool()
+@instrument_tool
+@with_deadline
 async def match_youth_programs_tool(
     age: int,
     employment_status: str,
     education_status: str | None = None,
     preferences: list[str] | None = None,
+    region: str | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
+    from tools.youth_program_tools import match_youth_programs
+
     return await match_youth_programs(
         age=age,
         employment_status=employment_status,
         education_status=education_status,
         preferences=preferences,
+        region=region,
+        fields=fields,
+        compact=compact,
+    )
+
+# ------------------------------------------------------------
+# 5. 일괄 조회 (Batch)
+# ------------------------------------------------------------
+@mcp.tool()
+@instrument_tool
+@with_deadline
+async def batch_get_details_tool(
+    emp_seqnos: list[str] | None = None,
+    training_courses: list[dict[str, str]] | None = None,
+    max_concurrency: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    from tools.batch_tools import batch_get_details
+
+    return await batch_get_details(
+        emp_seqnos=emp_seqnos,
+        training_courses=training_courses,
+        max_concurrency=max_concurrency,
+        fields=fields,
+        compact=compact,
     )
 
+# ------------------------------------------------------------
+# 6. 통합 조회 (Career Snapshot)
+# ------------------------------------------------------------
+@mcp.tool()
+@instrument_tool
+@with_deadline
+async def career_snapshot_tool(
+    age: int,
+    employment_status: str,
+    education_status: str | None = None,
+    region: str | None = None,
+    occupation_codes: list[str] | None = None,
+    ncs1: str | None = None,
+    keyword: str | None = None,
+    preferences: list[str] | None = None,
+    company_type_codes: list[str] | None = None,
+    latitude: float | None = None,
+    longitude: float | None = None,
+    axes: list[str] | None = None,
+    page_size: int = 5,
+    timeout: float | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    from tools.snapshot_tools import career_snapshot
+
+    result = await career_snapshot(
+        age=age,
+        employment_status=employment_status,
+        education_status=education_status,
+        region=region,
+        occupation_codes=occupation_codes,
+        ncs1=ncs1,
+        keyword=keyword,
+        preferences=preferences,
+        company_type_codes=company_type_codes,
+        latitude=latitude,
+        longitude=longitude,
+        axes=axes,
+        page_size=page_size,
+        timeout=timeout,
+        fields=fields,
+        compact=compact,
+    )
+    logger.info(
+        "career_snapshot_tool finished in %.0fms (%s)",
+        result["elapsed_ms"],
+        ", ".join(f"{axis}={r['status']}" for axis, r in result["axes"].items()),
+    )
+    return result
+
 # ------------------------------------------------------------
 # MCP HTTP/SSE 앱 생성 (/mcp)
 # ------------------------------------------------------------
-http_app = mcp.http_app(
-    "/mcp",
-    transport="sse",  # SSE MCP endpoint
-)
+def __getattr__(name: str):
+    # http_app은 uvicorn server:http_app 으로 참조될 때 생성 (stdio 시작 시 불필요)
+    if name == "http_app":
+        app = _with_runtime(mcp.http_app(
+            "/mcp",
+            transport="sse",  # SSE MCP endpoint
+        ))
+        globals()["http_app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def create_app():
+    """
+    Streamable HTTP app for multi-worker deployments (uvicorn factory).
+
+    stateless_http=True because MCP sessions live in worker memory and the
+    next request of a client may land on a different worker. That makes
+    every request its own MCP session, so per-worker setup (HTTP pool, cache
+    warm-up, background syncs, prefetch queue) runs in runtime() once at app
+    startup and is torn down at app shutdown, not in a FastMCP lifespan.
+    """
+    return _with_runtime(mcp.http_app(path="/mcp", transport="streamable-http", stateless_http=True))
 
 # ------------------------------------------------------------
 # Main Entry Point
 # ------------------------------------------------------------
 def main():
     """Run the MCP server."""
-    mcp.run(
-        transport="streamable-http",
-        host="0.0.0.0",
-        port=8001,
-        path="/mcp",
-    )
+    workers = env_int("WORK24_WORKERS", 1)
+    if workers > 1:
+        import uvicorn
+
+        from utils.cache import shared_cache_enabled
+
+        logger.info("Starting %d workers (shared cache: %s)", workers, shared_cache_enabled())
+        uvicorn.run("server:create_app", factory=True, workers=workers, host="0.0.0.0", port=8001)
+        return
+    if transport() == "stdio":
+        asyncio.run(_run_stdio())
+        return
+    import uvicorn
+
+    app = _with_runtime(mcp.http_app(path="/mcp", transport="streamable-http"))
+    uvicorn.run(app, host="0.0.0.0", port=8001)
+
+
+async def _run_stdio() -> None:
+    # stdio는 프로세스 하나가 세션 하나
+    async with runtime():
+        await mcp.run_async(transport="stdio")
 
 
 
@@ -0,0 +1,316 @@
+"""
+Company Spatial Index (기업 위치 색인)
+210L31 전체 수집 결과를 위경도 격자로 색인하여 반경/최근접 기업 검색
+"""
+
+import asyncio
+import heapq
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from stores.sync import PeriodicSync, iso_timestamp
+from utils.config import env_bool, env_float, env_int, env_str
+from utils.mapping import Record
+
+logger = logging.getLogger("work24_company_index")
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass(frozen=True)
+class _Entry:
+    company_id: str
+    latitude: float
+    longitude: float
+    type_codes: frozenset[str]
+
+
+class GridIndex:
+    """
+    Uniform latitude/longitude grid of companies.
+
+    Cells are cell_deg x cell_deg degrees. Radius queries scan only the
+    occupied cells overlapping the query's bounding box (clamped to the
+    bounds of the occupied cells, so a huge radius costs no more than a
+    full scan); k-nearest queries scan
+    rings of cells outwards and stop once no unscanned cell can contain a
+    closer company than the current k-th best. Both use great-circle
+    bounds (not km-per-degree at the query latitude), so results match a
+    full haversine scan at any distance.
+    """
+
+    def __init__(self, entries: list[_Entry], cell_deg: float = 0.05):
+        self.cell_deg = cell_deg
+        self._cells: dict[tuple[int, int], list[_Entry]] = {}
+        for entry in entries:
+            self._cells.setdefault(self._cell(entry.latitude, entry.longitude), []).append(entry)
+        self.size = len(entries)
+        # 점유 격자의 경계 (min_i, max_i, min_j, max_j)
+        self._bounds: tuple[int, int, int, int] | None = None
+        # 점유 격자의 최대 |위도| (경도 방향 거리 하한 계산용)
+        self._max_abs_lat = 0.0
+        if self._cells:
+            rows = [ci for ci, _ in self._cells]
+            cols = [cj for _, cj in self._cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+            self._max_abs_lat = max(abs(min(rows) * cell_deg), abs((max(rows) + 1) * cell_deg))
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return (math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg))
+
+    @staticmethod
+    def _accept(entry: _Entry, type_codes: frozenset[str] | None) -> bool:
+        return type_codes is None or not type_codes.isdisjoint(entry.type_codes)
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        type_codes: frozenset[str] | None = None,
+    ) -> list[tuple[float, _Entry]]:
+        """Companies within radius_km, nearest first."""
+        if self._bounds is None or radius_km < 0:
+            return []
+        # 반경 원을 감싸는 위경도 범위 (고위도 쪽으로 넓어지는 경도 폭 반영)
+        angle = radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angle)
+        cos_lat = math.cos(math.radians(lat))
+        if angle >= math.pi / 2 or math.sin(angle) >= cos_lat:
+            dlon = 360.0
+        else:
+            dlon = math.degrees(math.asin(math.sin(angle) / cos_lat))
+        lat_lo, lon_lo = self._cell(lat - dlat, lon - dlon)
+        lat_hi, lon_hi = self._cell(lat + dlat, lon + dlon)
+        # 검색 범위를 점유 격자 경계로 제한
+        min_i, max_i, min_j, max_j = self._bounds
+        lat_lo, lat_hi = max(lat_lo, min_i), min(lat_hi, max_i)
+        lon_lo, lon_hi = max(lon_lo, min_j), min(lon_hi, max_j)
+        if lat_lo > lat_hi or lon_lo > lon_hi:
+            return []
+        if (lat_hi - lat_lo + 1) * (lon_hi - lon_lo + 1) > len(self._cells):
+            # 범위가 점유 격자 수보다 넓으면 점유 격자만 확인
+            cells = [
+                bucket for (ci, cj), bucket in self._cells.items()
+                if lat_lo <= ci <= lat_hi and lon_lo <= cj <= lon_hi
+            ]
+        else:
+            cells = [
+                self._cells.get((ci, cj), ())
+                for ci in range(lat_lo, lat_hi + 1)
+                for cj in range(lon_lo, lon_hi + 1)
+            ]
+        found = []
+        for bucket in cells:
+            for entry in bucket:
+                if not self._accept(entry, type_codes):
+                    continue
+                d = haversine_km(lat, lon, entry.latitude, entry.longitude)
+                if d <= radius_km:
+                    found.append((d, entry))
+        found.sort(key=lambda x: x[0])
+        return found
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        type_codes: frozenset[str] | None = None,
+        max_radius_km: float | None = None,
+    ) -> list[tuple[float, _Entry]]:
+        """k nearest companies (optionally capped at max_radius_km), nearest first."""
+        if k <= 0 or not self._cells:
+            return []
+        center = self._cell(lat, lon)
+        # 경도 방향 거리는 두 지점 중 높은 위도에서 가장 짧아짐
+        cos_max = math.cos(math.radians(min(90.0, max(abs(lat), self._max_abs_lat))))
+        max_ring = self._max_ring(center)
+        heap: list[tuple[float, str, _Entry]] = []  # (-distance, id, entry) 최대 힙
+        for ring in range(max_ring + 1):
+            # ring 이후의 격자는 최소 (ring - 1) 격자만큼 떨어져 있음
+            bound = self._ring_bound_km(ring, cos_max)
+            if len(heap) >= k and bound > -heap[0][0]:
+                break
+            if max_radius_km is not None and bound > max_radius_km:
+                break
+            last = 8 * ring > len(self._cells)
+            if last:
+                # 남은 링이 점유 격자 수보다 넓으면 남은 점유 격자를 한 번에 확인
+                ci, cj = center
+                cells = [c for c in self._cells if max(abs(c[0] - ci), abs(c[1] - cj)) >= ring]
+            else:
+                cells = self._ring_cells(center, ring)
+            for cell in cells:
+                for entry in self._cells.get(cell, ()):
+                    if not self._accept(entry, type_codes):
+                        continue
+                    d = haversine_km(lat, lon, entry.latitude, entry.longitude)
+                    if max_radius_km is not None and d > max_radius_km:
+                        continue
+                    item = (-d, entry.company_id, entry)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif d < -heap[0][0]:
+                        heapq.heapreplace(heap, item)
+            if last:
+                break
+        return sorted(((-nd, entry) for nd, _, entry in heap), key=lambda x: x[0])
+
+    def _ring_bound_km(self, ring: int, cos_max: float) -> float:
+        """
+        Lower bound on the distance from a point in the center cell to any
+        cell of `ring` or beyond: a gap of (ring - 1) cells in latitude or
+        longitude; the longitude gap (haversine with cos(lat) <= cos_max)
+        is the smaller of the two.
+        """
+        gap = math.radians(max(ring - 1, 0) * self.cell_deg)
+        if gap >= math.pi:
+            return math.pi * EARTH_RADIUS_KM
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, cos_max * math.sin(gap / 2)))
+
+    def _max_ring(self, center: tuple[int, int]) -> int:
+        min_i, max_i, min_j, max_j = self._bounds
+        return max(
+            abs(min_i - center[0]), abs(max_i - center[0]),
+            abs(min_j - center[1]), abs(max_j - center[1]),
+        )
+
+    @staticmethod
+    def _ring_cells(center: tuple[int, int], ring: int):
+        ci, cj = center
+        if ring == 0:
+            yield center
+            return
+        for dj in range(-ring, ring + 1):
+            yield (ci - ring, cj + dj)
+            yield (ci + ring, cj + dj)
+        for di in range(-ring + 1, ring):
+            yield (ci + di, cj - ring)
+            yield (ci + di, cj + ring)
+
+
+class CompanyIndex:
+    """Company records plus a grid index, swapped atomically on rebuild."""
+
+    def __init__(self, cell_deg: float = 0.05):
+        self.cell_deg = cell_deg
+        self._records: dict[str, Record] = {}
+        self._grid = GridIndex([], cell_deg)
+        self.synced_at: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.synced_at is not None
+
+    def rebuild(self, records: dict[str, Record], type_codes: dict[str, set[str]]) -> None:
+        """Replace all companies; records without coordinates are kept but not indexed."""
+        entries = [
+            _Entry(cid, item["latitude"], item["longitude"], frozenset(type_codes.get(cid, ())))
+            for cid, item in records.items()
+            if item.get("latitude") is not None and item.get("longitude") is not None
+        ]
+        grid = GridIndex(entries, self.cell_deg)
+        self._records, self._grid = records, grid
+        self.synced_at = time.time()
+
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        limit: int = 10,
+        company_type_codes: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Radius search (nearest first, up to limit) or k-nearest when radius_km is None."""
+        records, grid = self._records, self._grid
+        codes = frozenset(company_type_codes) if company_type_codes else None
+        if radius_km is not None:
+            hits = grid.within(latitude, longitude, radius_km, codes)[:limit]
+        else:
+            hits = grid.nearest(latitude, longitude, limit, codes)
+        return [
+            {**records[entry.company_id], "distance_km": round(d, 3)}
+            for d, entry in hits
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "companies": len(self._records),
+            "indexed": self._grid.size,
+            "cell_deg": self.cell_deg,
+            "synced_at": iso_timestamp(self.synced_at),
+        }
+
+
+class CompanyIndexSync(PeriodicSync):
+    """
+    Crawl 210L31 once per company type code and rebuild the index.
+
+    Crawling per type code records which types each company belongs to,
+    so proximity queries can be combined with company_type_codes.
+    """
+
+    name = "company index sync"
+
+    def __init__(self, index: CompanyIndex):
+        super().__init__(
+            interval=env_float("WORK24_COMPANY_INDEX_INTERVAL", 86400.0),
+            retry_delay=env_float("WORK24_COMPANY_INDEX_RETRY_DELAY", 300.0),
+        )
+        self.index = index
+        codes = env_str("WORK24_COMPANY_INDEX_TYPE_CODES", "10,20,40")
+        self.type_codes = [c.strip() for c in codes.split(",") if c.strip()]
+        self.page_size = env_int("WORK24_COMPANY_INDEX_PAGE_SIZE", 100)
+        self.page_delay = env_float("WORK24_COMPANY_INDEX_PAGE_DELAY", 0.5)
+
+    async def sync_once(self) -> None:
+        # 순환 import 방지를 위해 지연 import
+        from tools.company_tools import CompanyRecord, find_strong_company
+
+        records: dict[str, Record] = {}
+        type_codes: dict[str, set[str]] = {}
+        for code in self.type_codes:
+            page = 1
+            while True:
+                result = await find_strong_company(
+                    company_type_codes=[code], page=page, page_size=self.page_size
+                )
+                items = result.get("items", [])
+                for item in items:
+                    cid = item.get("company_id")
+                    if not cid:
+                        continue
+                    # dict 대신 __slots__ 레코드로 보관 (항목당 메모리 절감)
+                    records[cid] = CompanyRecord.from_dict(item)
+                    type_codes.setdefault(cid, set()).add(code)
+                if not items or page * self.page_size >= result.get("total", 0):
+                    break
+                page += 1
+                await asyncio.sleep(self.page_delay)
+        self.index.rebuild(records, type_codes)
+        logger.info("Company index rebuilt (%d companies)", len(records))
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), **self.index.stats()}
+
+
+def company_index_enabled() -> bool:
+    """Whether the company spatial index is enabled (WORK24_COMPANY_INDEX)."""
+    return env_bool("WORK24_COMPANY_INDEX", False)
+
+
+company_index = CompanyIndex(env_float("WORK24_COMPANY_INDEX_CELL_DEG", 0.05))
+company_index_sync = CompanyIndexSync(company_index)
@@ -0,0 +1,242 @@
+"""
+Recruit Mirror (공채속보 로컬 미러)
+210L21 목록 전체를 주기적으로 수집하여 SQLite에 저장하고 로컬에서 조회
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from stores.sync import PeriodicSync, iso_timestamp
+from utils.config import env_bool, env_float, env_int, env_str
+
+logger = logging.getLogger("work24_recruit_mirror")
+
+_DEFAULT_PATH = Path(__file__).parent.parent / "data" / "recruit_mirror.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    emp_seqno  TEXT PRIMARY KEY,
+    position   INTEGER NOT NULL,
+    end_date   TEXT,
+    item       TEXT NOT NULL,
+    run_id     INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_postings_position ON postings (position);
+CREATE INDEX IF NOT EXISTS idx_postings_end_date ON postings (end_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    id                INTEGER PRIMARY KEY CHECK (id = 1),
+    run_id            INTEGER NOT NULL,
+    next_page         INTEGER,
+    total             INTEGER,
+    run_started_at    REAL,
+    last_page_at      REAL,
+    last_completed_at REAL
+);
+"""
+
+
+class RecruitMirror:
+    """
+    SQLite store of 공채속보 postings keyed by emp_seqno.
+
+    Postings keep the upstream list position of the sync run that last saw
+    them so that mirror pages follow the upstream ordering. Postings whose
+    end_date (empWantedEndt) has passed are never returned and are purged
+    after each completed run.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path or env_str("WORK24_RECRUIT_MIRROR_PATH", str(_DEFAULT_PATH)))
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------
+    # 동기화 상태 (체크포인트)
+    # ------------------------------------------------------------
+    def load_state(self) -> dict[str, Any]:
+        """Return the sync checkpoint row (run_id=0 when never synced)."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT run_id, next_page, total, run_started_at, last_page_at, last_completed_at "
+                "FROM sync_state WHERE id = 1"
+            ).fetchone()
+        if row is None:
+            return {"run_id": 0, "next_page": None, "total": None,
+                    "run_started_at": None, "last_page_at": None, "last_completed_at": None}
+        keys = ("run_id", "next_page", "total", "run_started_at", "last_page_at", "last_completed_at")
+        return dict(zip(keys, row))
+
+    def begin_run(self, run_id: int) -> None:
+        """Record the start of a new full pass."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO sync_state (id, run_id, next_page, run_started_at) VALUES (1, ?, 1, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET run_id = excluded.run_id, next_page = 1, "
+                    "run_started_at = excluded.run_started_at",
+                    (run_id, time.time()),
+                )
+
+    def save_page(self, run_id: int, page: int, page_size: int, items: list[dict], total: int) -> None:
+        """Upsert one page of postings and advance the checkpoint atomically."""
+        now = time.time()
+        offset = (page - 1) * page_size
+        rows = [
+            (item["emp_seqno"], offset + i, item.get("end_date"),
+             json.dumps(item, ensure_ascii=False), run_id, now)
+            for i, item in enumerate(items)
+            if item.get("emp_seqno")
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO postings (emp_seqno, position, end_date, item, run_id, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(emp_seqno) DO UPDATE SET position = excluded.position, "
+                    "end_date = excluded.end_date, item = excluded.item, "
+                    "run_id = excluded.run_id, updated_at = excluded.updated_at",
+                    rows,
+                )
+                conn.execute(
+                    "UPDATE sync_state SET next_page = ?, total = ?, last_page_at = ? WHERE id = 1",
+                    (page + 1, total, now),
+                )
+
+    def complete_run(self, run_id: int) -> int:
+        """
+        Finish a full pass: drop postings not seen in this run and expired
+        postings, then clear the checkpoint. Returns the number removed.
+        """
+        today = date.today().isoformat()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                removed = conn.execute("DELETE FROM postings WHERE run_id < ?", (run_id,)).rowcount
+                removed += conn.execute(
+                    "DELETE FROM postings WHERE end_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]' "
+                    "AND end_date < ?",
+                    (today,),
+                ).rowcount
+                conn.execute(
+                    "UPDATE sync_state SET next_page = NULL, last_completed_at = ? WHERE id = 1",
+                    (time.time(),),
+                )
+        return removed
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def query(self, page: int, page_size: int) -> dict[str, Any]:
+        """Return one page of unexpired postings in upstream order."""
+        today = date.today().isoformat()
+        # 날짜 형식이 아닌 마감일(예: 채용시까지)은 만료로 보지 않음
+        active = "(end_date IS NULL OR end_date NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]' OR end_date >= ?)"
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute(f"SELECT COUNT(*) FROM postings WHERE {active}", (today,)).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT item FROM postings WHERE {active} ORDER BY position LIMIT ? OFFSET ?",
+                (today, page_size, (page - 1) * page_size),
+            ).fetchall()
+        return {"total": total, "items": [json.loads(r[0]) for r in rows]}
+
+    def stats(self) -> dict[str, Any]:
+        state = self.load_state()
+        with self._lock:
+            count = self._connect().execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+        return {
+            "path": str(self.path),
+            "postings": count,
+            "run_id": state["run_id"],
+            "next_page": state["next_page"],
+            "upstream_total": state["total"],
+            "last_page_at": iso_timestamp(state["last_page_at"]),
+            "last_completed_at": iso_timestamp(state["last_completed_at"]),
+        }
+
+
+class RecruitMirrorSync(PeriodicSync):
+    """
+    Background job paging through the full 210L21 list (callTp=L).
+
+    Progress is checkpointed after every page; an interrupted run resumes
+    from the saved page on the next start instead of starting over.
+    """
+
+    name = "recruit mirror sync"
+    # 미러 DB는 모든 워커가 같은 파일을 사용: 리더 워커만 수집
+    exclusive = True
+
+    def __init__(self, mirror: RecruitMirror):
+        super().__init__(
+            interval=env_float("WORK24_RECRUIT_MIRROR_INTERVAL", 900.0),
+            retry_delay=env_float("WORK24_RECRUIT_MIRROR_RETRY_DELAY", 60.0),
+        )
+        self.mirror = mirror
+        self.page_size = env_int("WORK24_RECRUIT_MIRROR_PAGE_SIZE", 100)
+        self.page_delay = env_float("WORK24_RECRUIT_MIRROR_PAGE_DELAY", 0.5)
+
+    async def sync_once(self) -> None:
+        # 순환 import 방지를 위해 지연 import
+        from tools.recruit_tools import find_recruit_notice
+
+        state = await asyncio.to_thread(self.mirror.load_state)
+        if state["next_page"]:
+            run_id, page = state["run_id"], state["next_page"]
+            logger.info("Resuming recruit mirror run %d from page %d", run_id, page)
+        else:
+            run_id, page = state["run_id"] + 1, 1
+            await asyncio.to_thread(self.mirror.begin_run, run_id)
+            logger.info("Starting recruit mirror run %d", run_id)
+
+        while True:
+            result = await find_recruit_notice(page=page, page_size=self.page_size)
+            items = result.get("items", [])
+            total = result.get("total", 0)
+            await asyncio.to_thread(self.mirror.save_page, run_id, page, self.page_size, items, total)
+            if not items or page * self.page_size >= total:
+                break
+            page += 1
+            await asyncio.sleep(self.page_delay)
+
+        removed = await asyncio.to_thread(self.mirror.complete_run, run_id)
+        logger.info("Recruit mirror run %d complete (%d pages, %d removed)", run_id, page, removed)
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), **self.mirror.stats()}
+
+
+def mirror_enabled() -> bool:
+    """Whether the local 공채속보 mirror is enabled (WORK24_RECRUIT_MIRROR)."""
+    return env_bool("WORK24_RECRUIT_MIRROR", False)
+
+
+recruit_mirror = RecruitMirror()
+recruit_mirror_sync = RecruitMirrorSync(recruit_mirror)
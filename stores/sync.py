@@ -0,0 +1,174 @@
+"""
+Background Sync Base
+로컬 저장소를 주기적으로 업스트림과 동기화하는 백그라운드 작업 기반 클래스
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from utils.cache import response_cache, use_cache_policy
+from utils.config import env_float
+from utils.shared_cache import SharedCache
+
+logger = logging.getLogger("work24_sync")
+
+
+def iso_timestamp(ts: float | None) -> str | None:
+    """Format a unix timestamp as a local ISO-8601 string."""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts).astimezone().isoformat(timespec="seconds")
+
+
+class PeriodicSync:
+    """
+    Run sync_once() every interval seconds in a background task.
+
+    start()/stop() are reference counted so that the server runtime may be
+    entered more than once (e.g. by several apps) without starting duplicate
+    loops or stopping a loop that another user still needs.
+
+    With several workers (shared cache tier, see ResponseCache.peers()) the
+    workers elect one leader per job through a lease renewed every
+    WORK24_SYNC_LEASE_TTL / 3 seconds; another worker takes over once the
+    leader stops renewing it. Only the leader runs exclusive jobs (stores
+    that live in a shared file). For per-worker stores every worker runs
+    sync_once() right after the leader starts a run, so the crawl pages
+    are fetched upstream once and shared through the cache tier.
+    """
+
+    name = "sync"
+    # True: 저장소가 워커 간 공유 파일이라 리더 한 곳에서만 실행
+    exclusive = False
+
+    def __init__(self, interval: float, retry_delay: float = 60.0):
+        self.interval = interval
+        self.retry_delay = retry_delay
+        self._task: asyncio.Task | None = None
+        self._run: asyncio.Task | None = None
+        self._users = 0
+        self.leader = False
+        self._lost_lead = False
+        self._followed: float = 0.0
+        self.runs = 0
+        self.failures = 0
+        self.last_error: str | None = None
+
+    async def sync_once(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def lease_key(self) -> str:
+        return f"sync:{self.name}"
+
+    def _peers(self) -> SharedCache | None:
+        return response_cache.peers()
+
+    async def _run_forever(self) -> None:
+        peers = self._peers()
+        keeper = None
+        if peers is not None:
+            ttl = env_float("WORK24_SYNC_LEASE_TTL", 60.0)
+            await self._renew_lease(peers, ttl)
+            keeper = asyncio.get_running_loop().create_task(self._hold_lease(peers, ttl))
+        try:
+            while True:
+                await asyncio.sleep(await self._cycle(peers))
+        finally:
+            if keeper is not None:
+                keeper.cancel()
+                await asyncio.gather(keeper, return_exceptions=True)
+            if peers is not None and self.leader:
+                self.leader = False
+                await asyncio.to_thread(peers.release_lease, self.lease_key)
+
+    async def _renew_lease(self, peers: SharedCache, ttl: float) -> None:
+        won = await asyncio.to_thread(peers.try_lease, self.lease_key, ttl)
+        if won != self.leader:
+            logger.info("%s: %s leadership", self.name, "took" if won else "lost")
+        if self.leader and not won and self._run is not None:
+            # 다른 워커가 리더가 됨: 같은 수집을 중복 실행하지 않도록 중단
+            self._lost_lead = True
+            self._run.cancel()
+        self.leader = won
+
+    async def _hold_lease(self, peers: SharedCache, ttl: float) -> None:
+        while True:
+            await asyncio.sleep(ttl / 3)
+            await self._renew_lease(peers, ttl)
+
+    async def _cycle(self, peers: SharedCache | None) -> float:
+        """Run sync_once() if it is this worker's turn; return the delay until the next cycle."""
+        started = None
+        if peers is not None:
+            poll = env_float("WORK24_SYNC_LEASE_TTL", 60.0) / 3
+            if self.leader:
+                await asyncio.to_thread(peers.mark_sync_start, self.name)
+            elif self.exclusive:
+                return poll
+            else:
+                # 리더가 새 실행을 시작했을 때만 따라서 실행 (페이지는 공유 캐시에서)
+                started = await asyncio.to_thread(peers.sync_started_at, self.name)
+                if started is None or started <= self._followed:
+                    return poll
+        try:
+            # 로컬 저장소에는 만료된(stale) 캐시 응답 대신 업스트림 최신 응답만 반영하고
+            # 한 번 쓰고 마는 수집 페이지로 응답 캐시를 채우지 않음
+            with use_cache_policy(allow_stale=False, store=False):
+                self._run = asyncio.get_running_loop().create_task(self.sync_once())
+                await self._run
+            self.runs += 1
+            self.last_error = None
+            if started is not None:
+                # 팔로워는 다음 실행 시작을 바로 따라갈 수 있도록 계속 확인
+                self._followed = started
+                return poll
+            return self.interval
+        except asyncio.CancelledError:
+            if not self._lost_lead:
+                raise
+            self._lost_lead = False
+            logger.warning("%s interrupted: leadership moved to another worker", self.name)
+            return 0.0
+        except Exception as e:
+            self.failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.exception("%s failed, retrying in %.0fs", self.name, self.retry_delay)
+            return self.retry_delay
+        finally:
+            self._run = None
+
+    def start(self) -> None:
+        """Start the background loop (first user only)."""
+        self._users += 1
+        if self._task is None or self._task.done():
+            logger.info("Starting %s (interval=%.0fs)", self.name, self.interval)
+            self._task = asyncio.get_running_loop().create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Stop the background loop once the last user is gone."""
+        self._users = max(0, self._users - 1)
+        if self._users or self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Stopped %s", self.name)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "leader": self.leader,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
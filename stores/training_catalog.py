@@ -0,0 +1,307 @@
+"""
+Training Course Catalog (훈련과정 로컬 카탈로그)
+310L01 훈련과정 회차를 수집하여 시작일 인덱스와 보조 인덱스로 로컬 조회
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from stores.sync import PeriodicSync, iso_timestamp
+from utils.config import env_bool, env_float, env_int
+from utils.mapping import Record
+from utils.regions import sido_codes
+
+logger = logging.getLogger("work24_training_catalog")
+
+CourseKey = tuple[str, str]  # (trprId, trprDegr)
+
+
+def date_key(value: str | None) -> int | None:
+    """Convert 'YYYY-MM-DD' or 'YYYYMMDD' to an integer YYYYMMDD."""
+    if not value:
+        return None
+    digits = value.replace("-", "").replace(".", "").strip()
+    if len(digits) != 8 or not digits.isdigit():
+        return None
+    return int(digits)
+
+
+class StartDateIndex:
+    """
+    Round keys sorted by training start date (YYYYMMDD integers).
+
+    310L01 filters srchTraStDt/srchTraEndDt on the start date, so the
+    catalog answers the same range with two bisects over the sorted starts.
+    """
+
+    def __init__(self, starts: Iterable[tuple[int, CourseKey]]):
+        entries = sorted(starts)
+        self._starts = [e[0] for e in entries]
+        self._keys = [e[1] for e in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def starting(self, lo: int, hi: int) -> list[CourseKey]:
+        """Keys whose start lies in [lo, hi], ordered by start."""
+        return self._keys[bisect.bisect_left(self._starts, lo):bisect.bisect_right(self._starts, hi)]
+
+
+@dataclass
+class _Snapshot:
+    """Immutable catalog view swapped in atomically after each refresh."""
+    records: dict[CourseKey, Record]
+    starts: StartDateIndex
+    by_area: dict[str, set[CourseKey]]
+    by_ncs: dict[str, set[CourseKey]]
+    by_ncs1: dict[str, set[CourseKey]]
+    by_course_type: dict[str, set[CourseKey]]
+    by_org: dict[str, set[CourseKey]]
+
+
+def _build_snapshot(records: dict[CourseKey, Record]) -> _Snapshot:
+    by_area: dict[str, set[CourseKey]] = {}
+    by_ncs: dict[str, set[CourseKey]] = {}
+    by_ncs1: dict[str, set[CourseKey]] = {}
+    by_course_type: dict[str, set[CourseKey]] = {}
+    by_org: dict[str, set[CourseKey]] = {}
+    starts = []
+    for key, item in records.items():
+        start = date_key(item.get("start_date"))
+        if start is not None:
+            starts.append((start, key))
+        # 훈련지역 대분류 코드(srchTraArea1)는 시도 코드 (강원/전북은 전환 전후 코드 모두 색인)
+        for code in sido_codes(item.get("address")):
+            by_area.setdefault(code, set()).add(key)
+        ncs = item.get("ncs_code")
+        if ncs:
+            by_ncs.setdefault(ncs, set()).add(key)
+            by_ncs1.setdefault(ncs[:2], set()).add(key)
+        if item.get("course_type"):
+            by_course_type.setdefault(item["course_type"], set()).add(key)
+        if item.get("org_id"):
+            by_org.setdefault(item["org_id"], set()).add(key)
+    return _Snapshot(records, StartDateIndex(starts), by_area, by_ncs, by_ncs1, by_course_type, by_org)
+
+
+class TrainingCatalog:
+    """
+    In-memory catalog of 훈련과정 rounds keyed by (trprId, trprDegr).
+
+    Readers always see a complete snapshot; refreshes build a new snapshot
+    and swap the reference, so queries never observe a half-built index.
+    """
+
+    def __init__(self):
+        self._records: dict[CourseKey, Record] = {}
+        self._snapshot = _build_snapshot({})
+        # 수집된 시작일 구간 (YYYYMMDD 정수)
+        self.covered_from: int | None = None
+        self.covered_to: int | None = None
+        self.synced_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._snapshot.records)
+
+    @property
+    def ready(self) -> bool:
+        return self.synced_at is not None
+
+    def covers(self, start: int, end: int) -> bool:
+        """
+        Whether every round starting in [start, end] is in the catalog, i.e.
+        the range lies inside the synced start-date window (same rule as
+        search() and the live 310L01 srchTraStDt/srchTraEndDt filter).
+        """
+        return (
+            self.ready
+            and self.covered_from is not None
+            and self.covered_from <= start
+            and end <= self.covered_to
+        )
+
+    def replace_window(self, window_from: int, window_to: int, items: list[Record]) -> None:
+        """
+        Replace all rounds starting inside [window_from, window_to] with items
+        and publish a new snapshot.
+        """
+        records = {
+            key: item
+            for key, item in self._records.items()
+            if not (window_from <= (date_key(item.get("start_date")) or 0) <= window_to)
+        }
+        for item in items:
+            if item.get("course_id"):
+                records[(item["course_id"], str(item.get("course_round") or "1"))] = item
+        self._records = records
+        self._snapshot = _build_snapshot(records)
+        self.covered_from = window_from if self.covered_from is None else min(self.covered_from, window_from)
+        self.covered_to = window_to if self.covered_to is None else max(self.covered_to, window_to)
+        self.synced_at = time.time()
+
+    def prune(self, before: int) -> None:
+        """Drop rounds that ended before the given date and shrink coverage."""
+        records = {
+            key: item
+            for key, item in self._records.items()
+            if (date_key(item.get("end_date")) or date_key(item.get("start_date")) or before) >= before
+        }
+        if len(records) != len(self._records):
+            self._records = records
+            self._snapshot = _build_snapshot(records)
+        if self.covered_from is not None:
+            self.covered_from = max(self.covered_from, before)
+
+    def search(
+        self,
+        start_date: str,
+        end_date: str,
+        area1: str | None = None,
+        ncs1: str | None = None,
+        ncs_code: str | None = None,
+        course_type: str | None = None,
+        org_id: str | None = None,
+        keyword: str | None = None,
+        provider_name: str | None = None,
+    ) -> list[Record]:
+        """
+        Rounds starting in [start_date, end_date] matching all filters
+        (the live 310L01 date filter is on the training start date too).
+        """
+        snap = self._snapshot
+        lo, hi = date_key(start_date), date_key(end_date)
+        if lo is None or hi is None:
+            return []
+
+        # 보조 인덱스 교집합 (작은 집합부터)
+        filters = []
+        for index, value in (
+            (snap.by_area, area1),
+            (snap.by_ncs1, ncs1),
+            (snap.by_ncs, ncs_code),
+            (snap.by_org, org_id),
+        ):
+            if value:
+                filters.append(index.get(value, set()))
+        if course_type:
+            # 훈련유형 코드는 세부 접미사 유무가 다를 수 있음 (예: C0061 / C0061S)
+            matched: set[CourseKey] = set()
+            for code, keys in snap.by_course_type.items():
+                if code.startswith(course_type) or course_type.startswith(code):
+                    matched |= keys
+            filters.append(matched)
+        allowed: set[CourseKey] | None = None
+        if filters:
+            filters.sort(key=len)
+            allowed = set(filters[0])
+            for other in filters[1:]:
+                allowed &= other
+            if not allowed:
+                return []
+
+        results = []
+        for key in snap.starts.starting(lo, hi):
+            if allowed is not None and key not in allowed:
+                continue
+            item = snap.records[key]
+            if keyword and keyword not in (item.get("title") or ""):
+                continue
+            if provider_name and provider_name not in (item.get("provider_name") or ""):
+                continue
+            results.append(item)
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        snap = self._snapshot
+        return {
+            "rounds": len(snap.records),
+            "covered_from": self.covered_from,
+            "covered_to": self.covered_to,
+            "synced_at": iso_timestamp(self.synced_at),
+            "areas": len(snap.by_area),
+            "ncs_codes": len(snap.by_ncs),
+            "course_types": len(snap.by_course_type),
+            "orgs": len(snap.by_org),
+        }
+
+
+class TrainingCatalogSync(PeriodicSync):
+    """
+    Refresh the catalog from 310L01 over a rolling start-date window.
+
+    The window (today - lookback .. today + horizon) is fetched in monthly
+    chunks; each completed chunk replaces only the rounds starting inside
+    it, so the catalog is updated incrementally and stays queryable.
+    """
+
+    name = "training catalog sync"
+
+    def __init__(self, catalog: TrainingCatalog):
+        super().__init__(
+            interval=env_float("WORK24_TRAINING_CATALOG_INTERVAL", 3600.0),
+            retry_delay=env_float("WORK24_TRAINING_CATALOG_RETRY_DELAY", 120.0),
+        )
+        self.catalog = catalog
+        self.lookback_days = env_int("WORK24_TRAINING_CATALOG_LOOKBACK_DAYS", 90)
+        self.horizon_days = env_int("WORK24_TRAINING_CATALOG_HORIZON_DAYS", 180)
+        self.page_size = env_int("WORK24_TRAINING_CATALOG_PAGE_SIZE", 100)
+        self.page_delay = env_float("WORK24_TRAINING_CATALOG_PAGE_DELAY", 0.5)
+
+    def _windows(self) -> list[tuple[date, date]]:
+        today = date.today()
+        cursor = (today - timedelta(days=self.lookback_days)).replace(day=1)
+        last = today + timedelta(days=self.horizon_days)
+        windows = []
+        while cursor <= last:
+            next_month = (cursor.replace(day=28) + timedelta(days=4)).replace(day=1)
+            windows.append((cursor, min(next_month - timedelta(days=1), last)))
+            cursor = next_month
+        return windows
+
+    async def _fetch_window(self, window_from: date, window_to: date) -> list[Record]:
+        # 순환 import 방지를 위해 지연 import
+        from tools.training_tools import TrainingRecord, find_training_course
+
+        items: list[Record] = []
+        page = 1
+        while True:
+            result = await find_training_course(
+                start_date=window_from.strftime("%Y%m%d"),
+                end_date=window_to.strftime("%Y%m%d"),
+                page=page,
+                page_size=self.page_size,
+            )
+            page_items = result.get("items", [])
+            # dict 대신 __slots__ 레코드로 보관 (항목당 메모리 절감)
+            items.extend(TrainingRecord.from_dict(item) for item in page_items)
+            if not page_items or page * self.page_size >= result.get("total", 0):
+                return items
+            page += 1
+            await asyncio.sleep(self.page_delay)
+
+    async def sync_once(self) -> None:
+        windows = self._windows()
+        for window_from, window_to in windows:
+            items = await self._fetch_window(window_from, window_to)
+            self.catalog.replace_window(
+                int(window_from.strftime("%Y%m%d")), int(window_to.strftime("%Y%m%d")), items
+            )
+            logger.info("Training catalog window %s..%s refreshed (%d rounds)", window_from, window_to, len(items))
+        self.catalog.prune(int((date.today() - timedelta(days=self.lookback_days)).strftime("%Y%m%d")))
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), **self.catalog.stats()}
+
+
+def catalog_enabled() -> bool:
+    """Whether the local training catalog is enabled (WORK24_TRAINING_CATALOG)."""
+    return env_bool("WORK24_TRAINING_CATALOG", False)
+
+
+training_catalog = TrainingCatalog()
+training_catalog_sync = TrainingCatalogSync(training_catalog)
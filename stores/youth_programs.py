@@ -0,0 +1,164 @@
+"""
+Youth Program Catalog (청년 프로그램 카탈로그)
+로컬 JSON을 한 번만 읽어 검증된 모델과 비트셋 색인으로 보관, 파일 변경 시 원자적 재적재
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from models.youth_program import YouthProgram
+
+logger = logging.getLogger("work24_youth_programs")
+
+_DEFAULT_PATH = Path(__file__).parent.parent / "data" / "youth_programs.json"
+
+# 나이 색인 상한 (target_age_max가 이보다 크면 MAX_AGE로 간주)
+MAX_AGE = 120
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Indexes of set bits in ascending order (= catalog file order)."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """
+    Immutable view of one version of the catalog.
+
+    Every index is an int bitset over program positions: bit i is set when
+    programs[i] belongs to the bucket. An empty target list in the source
+    means "everyone", which is kept in the separate *_open masks.
+    """
+    mtime_ns: int
+    programs: tuple[YouthProgram, ...]
+    dumped: tuple[dict[str, Any], ...]
+    by_age: tuple[int, ...]
+    by_employment: dict[str, int]
+    employment_open: int
+    by_education: dict[str, int]
+    education_open: int
+    by_category: dict[str, int]
+    by_region: dict[str, int]
+    nationwide: int
+
+
+def _build_snapshot(programs: list[YouthProgram], mtime_ns: int) -> _Snapshot:
+    by_age = [0] * (MAX_AGE + 1)
+    by_employment: dict[str, int] = {}
+    by_education: dict[str, int] = {}
+    by_category: dict[str, int] = {}
+    by_region: dict[str, int] = {}
+    employment_open = education_open = nationwide = 0
+
+    for i, prog in enumerate(programs):
+        bit = 1 << i
+        for age in range(max(prog.target_age_min, 0), min(prog.target_age_max, MAX_AGE) + 1):
+            by_age[age] |= bit
+        if prog.target_employment_status:
+            for status in prog.target_employment_status:
+                by_employment[status] = by_employment.get(status, 0) | bit
+        else:
+            employment_open |= bit
+        if prog.target_education_status:
+            for status in prog.target_education_status:
+                by_education[status] = by_education.get(status, 0) | bit
+        else:
+            education_open |= bit
+        category = prog.category.value
+        by_category[category] = by_category.get(category, 0) | bit
+        if prog.regions:
+            for region in prog.regions:
+                by_region[region] = by_region.get(region, 0) | bit
+        else:
+            nationwide |= bit
+
+    return _Snapshot(
+        mtime_ns=mtime_ns,
+        programs=tuple(programs),
+        dumped=tuple(p.model_dump(mode="json") for p in programs),
+        by_age=tuple(by_age),
+        by_employment=by_employment,
+        employment_open=employment_open,
+        by_education=by_education,
+        education_open=education_open,
+        by_category=by_category,
+        by_region=by_region,
+        nationwide=nationwide,
+    )
+
+
+_EMPTY = _build_snapshot([], 0)
+
+
+class YouthProgramCatalog:
+    """
+    Youth programs loaded once from JSON and re-read only when the file's
+    mtime changes.
+
+    A reload builds a complete new snapshot and swaps it in with a single
+    assignment, so concurrent readers see either the old or the new
+    catalog, never a mix. A file that fails to parse or validate on reload
+    is logged and the previous snapshot stays in service.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path or _DEFAULT_PATH)
+        self._snapshot: _Snapshot | None = None
+        self._lock = threading.Lock()
+        # 검증 실패한 파일 버전 (같은 mtime이면 다시 읽지 않음)
+        self._failed_mtime_ns: int | None = None
+        self.reloads = 0
+
+    def snapshot(self) -> _Snapshot:
+        """Current snapshot, reloading first if the file changed."""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = 0
+        current = self._snapshot
+        if current is not None and mtime_ns in (current.mtime_ns, self._failed_mtime_ns):
+            return current
+        with self._lock:
+            current = self._snapshot
+            if current is not None and mtime_ns in (current.mtime_ns, self._failed_mtime_ns):
+                return current
+            try:
+                self._snapshot = self._load(mtime_ns)
+                self.reloads += 1
+            except (OSError, ValueError) as e:
+                # pydantic ValidationError도 ValueError의 하위 클래스
+                if current is None:
+                    raise
+                self._failed_mtime_ns = mtime_ns
+                logger.error("Failed to reload %s, keeping previous catalog: %s", self.path, e)
+                return current
+            return self._snapshot
+
+    def _load(self, mtime_ns: int) -> _Snapshot:
+        if not mtime_ns:
+            return _EMPTY
+        with open(self.path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        programs = [YouthProgram.model_validate(item) for item in raw]
+        logger.info("Loaded %d youth programs from %s", len(programs), self.path)
+        return _build_snapshot(programs, mtime_ns)
+
+    def stats(self) -> dict[str, Any]:
+        snap = self._snapshot
+        return {
+            "path": str(self.path),
+            "programs": len(snap.programs) if snap else 0,
+            "reloads": self.reloads,
+        }
+
+
+youth_program_catalog = YouthProgramCatalog()
@@ -4,16 +4,24 @@ MCP 서버 없이 직접 API 호출 테스트
 """
 
 import asyncio
+import logging
 import sys
 import os
 
 # 프로젝트 루트를 PYTHONPATH에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# stderr로 로깅 (도구 모듈은 로깅 설정을 하지 않음)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stderr)],
+)
+
 from tools.recruit_tools import find_recruit_notice
 from tools.training_tools import find_training_course
 from tools.company_tools import find_strong_company
-from tools.youth_program_tools import list_youth_programs, match_youth_programs
+from tools.youth_program_tools import list_youth_programs
 
 
 async def test_recruit():
@@ -0,0 +1,91 @@
+"""
+일괄 상세 조회 (batch_get_details) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import tools.batch_tools as batch_tools
+
+
+class _Details:
+    """Fake detail tools tracking concurrency and arguments."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list[tuple] = []
+
+    async def _call(self, key, delay: float, **kwargs) -> dict:
+        self.calls.append((key, kwargs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        if key == "bad":
+            raise RuntimeError("upstream down")
+        return {"id": key}
+
+    async def recruit(self, emp_seqno, **kwargs):
+        # 뒤 항목이 먼저 끝나도 결과는 요청 순서
+        return await self._call(emp_seqno, 0.01 / (1 + len(self.calls)), **kwargs)
+
+    async def training(self, course_id, course_round, org_id, **kwargs):
+        return await self._call(course_id, 0.001, course_round=course_round, org_id=org_id, **kwargs)
+
+
+@pytest.fixture
+def details(monkeypatch):
+    fake = _Details()
+    monkeypatch.setattr(batch_tools, "get_recruit_detail", fake.recruit)
+    monkeypatch.setattr(batch_tools, "get_training_course_detail", fake.training)
+    return fake
+
+
+def test_results_in_request_order_with_partial_failures(details):
+    result = asyncio.run(batch_tools.batch_get_details(
+        emp_seqnos=["1", "bad", "3"],
+        training_courses=[{"course_id": "C1"}, {"course_round": "2"}],
+    ))
+    assert (result["total"], result["succeeded"], result["failed"]) == (5, 3, 2)
+    items = result["items"]
+    assert [item["key"] for item in items] == [
+        {"emp_seqno": "1"}, {"emp_seqno": "bad"}, {"emp_seqno": "3"},
+        {"course_id": "C1", "course_round": "1", "org_id": ""},
+        {"course_id": "", "course_round": "2", "org_id": ""},
+    ]
+    assert items[0]["result"] == {"id": "1"}
+    assert items[1]["error"] == {"type": "RuntimeError", "message": "upstream down"}
+    assert items[4]["error"]["type"] == "ValueError"
+    # course_id가 없는 항목은 호출하지 않음
+    assert len(details.calls) == 4
+
+
+@pytest.mark.parametrize("setting, requested, expected", [("8", None, 8), ("8", 3, 3), ("2", 10, 2)])
+def test_concurrency_capped(details, monkeypatch, setting, requested, expected):
+    monkeypatch.setenv("WORK24_BATCH_CONCURRENCY", setting)
+    asyncio.run(batch_tools.batch_get_details(
+        emp_seqnos=[str(i) for i in range(20)], max_concurrency=requested,
+    ))
+    assert details.max_in_flight == expected
+
+
+def test_too_many_items_rejected(details, monkeypatch):
+    monkeypatch.setenv("WORK24_BATCH_MAX_ITEMS", "3")
+    with pytest.raises(ValueError):
+        asyncio.run(batch_tools.batch_get_details(emp_seqnos=["1", "2"], training_courses=[{"course_id": "C"}] * 2))
+    assert details.calls == []
+
+
+def test_projection_passed_to_detail_tools(details):
+    asyncio.run(batch_tools.batch_get_details(
+        emp_seqnos=["1"], training_courses=[{"course_id": "C", "org_id": "O"}],
+        fields=["title"], compact=True,
+    ))
+    assert details.calls == [
+        ("1", {"fields": ["title"], "compact": True}),
+        ("C", {"course_round": "1", "org_id": "O", "fields": ["title"], "compact": True}),
+    ]
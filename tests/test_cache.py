@@ -0,0 +1,100 @@
+"""
+응답 캐시 TTL / stale 구간 테스트
+"""
+
+import asyncio
+import time
+import types
+
+import pytest
+
+import utils.cache as cache_module
+from utils.cache import CachePolicy, ResponseCache, TTLCache, cache_policy, use_cache_policy
+
+ENDPOINT = "callOpenApiSvcInfo210L21"
+OK_RESULT = {"dhsOpenEmpInfoList": {"dhsOpenEmpInfo": [{"empSeqno": "1"}]}}
+EMPTY_RESULT = {"dhsOpenEmpInfoList": {"dhsOpenEmpInfo": []}}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=clock.monotonic, time=time.time))
+    return clock
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    for name in ("WORK24_PERSISTENT_CACHE", "WORK24_SHARED_CACHE"):
+        monkeypatch.setenv(name, "false")
+    monkeypatch.setenv("WORK24_CACHE_ENABLED", "true")
+    monkeypatch.setenv("WORK24_CACHE_STALE_TTL", "100")
+    monkeypatch.setenv("WORK24_CACHE_NEGATIVE_TTL", "5")
+    return ResponseCache()
+
+
+def test_entry_is_fresh_until_ttl(clock):
+    cache = TTLCache()
+    cache.set("k", "v", ttl=10)
+    clock.now += 9.9
+    assert cache.get("k") == "v"
+    clock.now += 0.1
+    assert cache.get("k") is None
+
+
+def test_expired_entry_served_as_stale_within_window(clock):
+    cache = TTLCache()
+    cache.set("k", "v", ttl=10, stale_ttl=20)
+    clock.now += 15
+    assert cache.get("k") is None
+    assert cache.get_stale("k") == ("v", 15)
+    clock.now += 15
+    assert cache.get_stale("k") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.get("a")
+    cache.set("c", 3, ttl=10)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_response_cache_windows(clock, response_cache):
+    async def scenario():
+        await response_cache.store("ok", ENDPOINT, OK_RESULT, ttl=60)
+        await response_cache.store("empty", ENDPOINT, EMPTY_RESULT, ttl=60)
+        await response_cache.store("error", ENDPOINT, {"error": "x"}, ttl=60)
+        fresh = [await response_cache.get(key) for key in ("ok", "empty", "error")]
+        clock.now += 61
+        expired = await response_cache.get("ok"), await response_cache.get_stale("ok")
+        # 빈 결과(negative)는 짧은 TTL, stale 구간 없음
+        negative = await response_cache.get_stale("empty")
+        clock.now += 100
+        gone = await response_cache.get_stale("ok")
+        return fresh, expired, negative, gone
+
+    fresh, expired, negative, gone = asyncio.run(scenario())
+    assert fresh == [OK_RESULT, EMPTY_RESULT, None]
+    assert expired == (None, (OK_RESULT, 61))
+    assert negative is None
+    assert gone is None
+
+
+def test_cache_policy_is_scoped():
+    assert cache_policy() == CachePolicy()
+    with use_cache_policy(allow_stale=False, store=False):
+        assert cache_policy() == CachePolicy(allow_stale=False, store=False)
+    assert cache_policy().allow_stale and cache_policy().store
@@ -0,0 +1,89 @@
+"""
+녹화/재생 카세트 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import utils.http_client as http_client
+from benchmarks.fixtures import FIXTURE_DIR
+from utils.cache import use_cache_policy
+from utils.cassette import Cassette, Work24CassetteMiss
+
+ENDPOINT = "callOpenApiSvcInfo210L21"
+BODY = (FIXTURE_DIR / "210L21_list_10.xml").read_bytes()
+
+
+def _cassette(tmp_path, mode: str) -> Cassette:
+    cassette = Cassette(tmp_path / "cassette.db")
+    cassette._mode = mode
+    return cassette
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve BODY through httpx.MockTransport and record every request."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=BODY)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_client(base_url):
+        return client
+
+    monkeypatch.setattr(http_client.http_pool, "get_client", get_client)
+    yield requests
+    asyncio.run(client.aclose())
+
+
+def _call(params: dict) -> dict:
+    async def scenario():
+        with use_cache_policy(allow_stale=False, store=False):
+            return await http_client.call_work24_api(ENDPOINT, params, http_client.ApiType.RECRUIT)
+
+    return asyncio.run(scenario())
+
+
+def test_record_then_replay_without_network_or_key(tmp_path, monkeypatch, upstream):
+    params = {"callTp": "L", "startPage": 1, "display": 10, "cassette_test": 1}
+    monkeypatch.setenv(http_client.ApiType.RECRUIT.value, "secret-key")
+    recorder = _cassette(tmp_path, "record")
+    monkeypatch.setattr(http_client, "cassette", recorder)
+    live = _call(params)
+    assert len(upstream) == 1
+    assert recorder.recorded == 1
+
+    # 녹화본에는 인증키가 없음
+    conn = recorder._connect()
+    (key,), = conn.execute("SELECT request_key FROM interactions").fetchall()
+    assert "secret-key" not in key
+    assert recorder.load(key)[0] == BODY
+
+    monkeypatch.delenv(http_client.ApiType.RECRUIT.value)
+    player = _cassette(tmp_path, "replay")
+    monkeypatch.setattr(http_client, "cassette", player)
+    assert _call(params) == live
+    assert len(upstream) == 1
+    assert player.replayed == 1
+
+    with pytest.raises(Work24CassetteMiss):
+        _call({**params, "startPage": 2})
+    assert player.misses == 1
+
+
+@pytest.mark.parametrize("setting, expected", [("0", 0.0), ("recorded", 0.25), ("0.1", 0.1), ("-1", 0.0), ("x", 0.0)])
+def test_replay_delay(monkeypatch, tmp_path, setting, expected):
+    monkeypatch.setenv("WORK24_CASSETTE_LATENCY", setting)
+    assert _cassette(tmp_path, "replay").replay_delay(0.25) == expected
+
+
+def test_invalid_mode_is_off(monkeypatch, tmp_path):
+    monkeypatch.setenv("WORK24_CASSETTE_MODE", "rewind")
+    cassette = Cassette(tmp_path / "cassette.db")
+    assert cassette.mode == "off"
+    assert cassette.stats() == {"mode": "off"}
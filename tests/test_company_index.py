@@ -0,0 +1,108 @@
+"""
+기업 위치 색인 (GridIndex / find_nearby_company) 테스트: 전수 비교
+"""
+
+import asyncio
+import random
+
+import pytest
+
+import tools.company_tools as company_tools
+from stores.company_index import CompanyIndex, GridIndex, _Entry, haversine_km
+from tools.company_tools import CompanyRecord
+
+TYPE_CODES = ("10", "20", "40")
+
+
+def _entries(n: int = 400, seed: int = 7) -> list[_Entry]:
+    rng = random.Random(seed)
+    entries = []
+    for i in range(n):
+        # 수도권에 밀집 + 전국 분포
+        if i % 2:
+            lat, lon = rng.uniform(37.3, 37.7), rng.uniform(126.8, 127.2)
+        else:
+            lat, lon = rng.uniform(33.2, 38.6), rng.uniform(125.0, 129.6)
+        codes = frozenset(rng.sample(TYPE_CODES, rng.randint(1, 2)))
+        entries.append(_Entry(f"c{i}", lat, lon, codes))
+    return entries
+
+
+def _brute(entries, lat, lon, type_codes=None) -> list[tuple[float, str]]:
+    found = [
+        (haversine_km(lat, lon, e.latitude, e.longitude), e.company_id)
+        for e in entries
+        if type_codes is None or not type_codes.isdisjoint(e.type_codes)
+    ]
+    return sorted(found)
+
+
+QUERIES = [
+    (37.5665, 126.9780),   # 서울 (밀집 지역)
+    (35.1796, 129.0756),   # 부산
+    (33.4996, 126.5312),   # 제주
+    (37.55, 127.0),        # 격자 경계 위
+    (35.6762, 139.6503),   # 색인 범위 밖 (도쿄)
+]
+
+
+@pytest.mark.parametrize("cell_deg", [0.01, 0.05, 0.5])
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("type_codes", [None, frozenset({"40"})])
+def test_within_matches_brute_force(cell_deg, lat, lon, type_codes):
+    entries = _entries()
+    grid = GridIndex(entries, cell_deg)
+    for radius in (0.0, 1.0, 7.5, 40.0, 5000.0):
+        got = [(round(d, 9), e.company_id) for d, e in grid.within(lat, lon, radius, type_codes)]
+        expected = [(round(d, 9), cid) for d, cid in _brute(entries, lat, lon, type_codes) if d <= radius]
+        assert sorted(got) == expected
+
+
+@pytest.mark.parametrize("cell_deg", [0.01, 0.05, 0.5])
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("type_codes", [None, frozenset({"20"})])
+def test_nearest_matches_brute_force(cell_deg, lat, lon, type_codes):
+    entries = _entries()
+    grid = GridIndex(entries, cell_deg)
+    brute = _brute(entries, lat, lon, type_codes)
+    for k in (1, 5, 50):
+        got = [d for d, _ in grid.nearest(lat, lon, k, type_codes)]
+        assert got == pytest.approx([d for d, _ in brute[:k]])
+    capped = [d for d, _ in grid.nearest(lat, lon, 50, type_codes, max_radius_km=20.0)]
+    assert capped == pytest.approx([d for d, _ in brute[:50] if d <= 20.0])
+
+
+def test_empty_index():
+    grid = GridIndex([])
+    assert grid.within(37.5, 127.0, 10) == []
+    assert grid.nearest(37.5, 127.0, 3) == []
+
+
+def test_find_nearby_company_matches_brute_force(monkeypatch):
+    entries = _entries(200, seed=11)
+    index = CompanyIndex(0.05)
+    records = {
+        e.company_id: CompanyRecord.from_dict({
+            "company_id": e.company_id, "company_name": e.company_id,
+            "latitude": e.latitude, "longitude": e.longitude,
+        })
+        for e in entries
+    }
+    # 좌표 없는 기업은 색인되지 않음
+    records["nowhere"] = CompanyRecord.from_dict({"company_id": "nowhere", "company_name": "nowhere"})
+    index.rebuild(records, {e.company_id: set(e.type_codes) for e in entries})
+    monkeypatch.setattr(company_tools, "company_index", index)
+
+    lat, lon = QUERIES[0]
+    result = asyncio.run(company_tools.find_nearby_company(lat, lon, radius_km=10.0, limit=500))
+    expected = [cid for d, cid in _brute(entries, lat, lon) if d <= 10.0]
+    assert [item["company_id"] for item in result["items"]] == expected
+    assert result["index_ready"]
+
+    codes = frozenset({"10"})
+    result = asyncio.run(company_tools.find_nearby_company(
+        lat, lon, limit=5, company_type_codes=["10"], fields=["company_id", "distance_km"],
+    ))
+    brute = _brute(entries, lat, lon, codes)[:5]
+    assert [item["distance_km"] for item in result["items"]] == [round(d, 3) for d, _ in brute]
+    assert all(set(item) == {"company_id", "distance_km"} for item in result["items"])
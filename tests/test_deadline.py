@@ -0,0 +1,130 @@
+"""
+도구 호출 마감 시간(deadline) / 취소 전파 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import tools.snapshot_tools as snapshot_tools
+import utils.http_client as http_client
+from utils.deadline import (
+    Work24DeadlineExceeded,
+    _deadline,
+    check_deadline,
+    detached_context,
+    remaining,
+    with_deadline,
+)
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    monkeypatch.setenv("WORK24_TOOL_TIMEOUT", "0.05")
+
+
+class _BlockingUpstream:
+    """Replaces _fetch_work24: blocks forever and records cancellation."""
+
+    def __init__(self):
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.started += 1
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def test_deadline_exceeded(budget):
+    @with_deadline
+    async def slow_tool():
+        await asyncio.sleep(1)
+
+    with pytest.raises(Work24DeadlineExceeded) as info:
+        asyncio.run(slow_tool())
+    assert info.value.where == "slow_tool"
+
+
+def test_remaining_visible_inside_tool(budget):
+    @with_deadline
+    async def tool():
+        return remaining()
+
+    left = asyncio.run(tool())
+    assert 0 < left <= 0.05
+
+
+def test_nested_deadline_keeps_earlier_outer(budget):
+    @with_deadline
+    async def inner():
+        return remaining()
+
+    @with_deadline
+    async def outer():
+        await asyncio.sleep(0.03)
+        # 안쪽 호출이 새 예산(0.05s)을 받아도 바깥 마감 시간을 넘지 않음
+        return await inner()
+
+    assert asyncio.run(outer()) < 0.03
+
+
+def test_check_deadline_and_detached_context():
+    async def scenario():
+        _deadline.set(asyncio.get_running_loop().time() - 1)
+        with pytest.raises(Work24DeadlineExceeded):
+            check_deadline("test")
+        assert detached_context().run(remaining) is None
+
+    asyncio.run(scenario())
+
+
+def test_deadline_cancels_abandoned_upstream_call(monkeypatch, budget):
+    upstream = _BlockingUpstream()
+    monkeypatch.setattr(http_client, "_fetch_work24", upstream)
+    abandoned = http_client._single_flight.abandoned
+
+    @with_deadline
+    async def tool():
+        return await http_client.call_work24_api(
+            "callOpenApiSvcInfo210L21", {"deadline_test": 1}, http_client.ApiType.RECRUIT,
+        )
+
+    async def scenario():
+        with pytest.raises(Work24DeadlineExceeded):
+            await tool()
+        # 공유 task의 취소가 처리될 때까지 진행
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert upstream.started == 1
+    assert upstream.cancelled == 1
+    assert http_client._single_flight.abandoned == abandoned + 1
+
+
+def test_snapshot_cancels_axes_past_budget(monkeypatch):
+    cancelled = []
+
+    async def slow_axis(**kwargs):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append("recruit")
+            raise
+
+    async def fast_axis(**kwargs):
+        return {"total": 0, "items": []}
+
+    monkeypatch.setattr(snapshot_tools, "find_recruit_notice", slow_axis)
+    monkeypatch.setattr(snapshot_tools, "find_training_course", fast_axis)
+
+    result = asyncio.run(snapshot_tools.career_snapshot(
+        25, "구직자", axes=["recruit", "training"], timeout=0.05,
+    ))
+    assert result["axes"]["recruit"]["status"] == "timeout"
+    assert result["axes"]["training"]["status"] == "ok"
+    assert not result["complete"]
+    assert cancelled == ["recruit"]
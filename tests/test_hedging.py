@@ -0,0 +1,152 @@
+"""
+Hedged request (지연 분위수 초과 시 중복 요청) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import utils.http_client as http_client
+from utils.hedging import HedgeBudget, Hedger, LatencyWindow
+
+ENDPOINT = "callOpenApiSvcInfo310L01"
+
+
+def test_latency_window_quantile():
+    window = LatencyWindow(size=100)
+    assert window.quantile(0.95) is None
+    for i in range(1, 201):
+        window.observe(float(i))
+    # 최근 100개(101..200)만 유지
+    assert len(window) == 100
+    assert window.quantile(0.0) == 101.0
+    assert window.quantile(0.5) == 150.0
+    assert window.quantile(0.95) == 195.0
+    assert window.quantile(1.0) == 200.0
+
+
+def test_budget_caps_hedge_ratio():
+    budget = HedgeBudget(ratio=0.25, burst=2.0)
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    # 기본 요청 4건당 hedge 1건
+    for _ in range(3):
+        budget.credit()
+    assert not budget.try_spend()
+    budget.credit()
+    assert budget.try_spend()
+    for _ in range(100):
+        budget.credit()
+    assert budget.tokens == 2.0
+
+
+def test_default_budget_allows_one_hedge_per_twenty_requests():
+    budget = HedgeBudget(ratio=0.05, burst=1.0)
+    assert budget.try_spend()
+    for _ in range(20):
+        budget.credit()
+    assert budget.try_spend()
+
+
+@pytest.fixture
+def hedger(monkeypatch):
+    monkeypatch.setenv("WORK24_HEDGE_ENABLED", "true")
+    monkeypatch.setenv("WORK24_HEDGE_MIN_SAMPLES", "3")
+    monkeypatch.setenv("WORK24_HEDGE_MIN_DELAY", "0.01")
+    hedger = Hedger()
+    monkeypatch.setattr(http_client, "_hedger", hedger)
+    return hedger
+
+
+def test_delay_needs_samples_and_respects_floor(hedger, monkeypatch):
+    assert hedger.delay(ENDPOINT) is None
+    for seconds in (0.001, 0.002, 0.003):
+        hedger.observe(ENDPOINT, seconds)
+    assert hedger.delay(ENDPOINT) == 0.01
+    for seconds in (0.5,) * 10:
+        hedger.observe(ENDPOINT, seconds)
+    assert hedger.delay(ENDPOINT) == 0.5
+
+    monkeypatch.setenv("WORK24_HEDGE_ENABLED", "false")
+    assert hedger.delay(ENDPOINT) is None
+
+
+def test_endpoint_filter(hedger, monkeypatch):
+    monkeypatch.setenv("WORK24_HEDGE_ENDPOINTS", "210L21")
+    for _ in range(3):
+        hedger.observe(ENDPOINT, 0.001)
+    assert hedger.delay(ENDPOINT) is None
+
+
+class _Sends:
+    """send() whose n-th call takes delays[n] seconds (or raises if an exception)."""
+
+    def __init__(self, *delays):
+        self.delays = list(delays)
+        self.calls = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self):
+        n = self.calls
+        self.calls += 1
+        outcome = self.delays[n]
+        try:
+            await asyncio.sleep(0.05 if isinstance(outcome, BaseException) else outcome)
+        except asyncio.CancelledError:
+            self.cancelled.append(n)
+            raise
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return {"call": n}, outcome, None
+
+
+def _send_hedged(send) -> dict:
+    async def scenario():
+        result, _, _ = await http_client._send_hedged(ENDPOINT, http_client.ApiType.TRAINING, send)
+        return result
+
+    return asyncio.run(scenario())
+
+
+def _warm(hedger: Hedger) -> None:
+    for _ in range(3):
+        hedger.observe(ENDPOINT, 0.001)
+
+
+def test_slow_primary_is_hedged_and_cancelled(hedger):
+    _warm(hedger)
+    send = _Sends(1.0, 0.001)
+    assert _send_hedged(send) == {"call": 1}
+    assert send.cancelled == [0]
+    assert hedger.hedged == {ENDPOINT: 1}
+    assert hedger.won == {ENDPOINT: 1}
+
+
+def test_fast_primary_not_hedged(hedger):
+    _warm(hedger)
+    send = _Sends(0.001)
+    assert _send_hedged(send) == {"call": 0}
+    assert send.calls == 1
+    assert hedger.hedged == {}
+
+
+def test_hedge_covers_failed_primary(hedger):
+    _warm(hedger)
+    send = _Sends(ConnectionError("reset"), 0.1)
+    assert _send_hedged(send) == {"call": 1}
+
+
+def test_both_failing_raises_first_error(hedger):
+    _warm(hedger)
+    send = _Sends(ConnectionError("first"), RuntimeError("second"))
+    with pytest.raises(ConnectionError):
+        _send_hedged(send)
+
+
+def test_no_hedge_without_budget(hedger, monkeypatch):
+    monkeypatch.setenv("WORK24_HEDGE_BURST", "0")
+    _warm(hedger)
+    send = _Sends(0.05)
+    assert _send_hedged(send) == {"call": 0}
+    assert send.calls == 1
+    assert hedger.denied == 1
@@ -0,0 +1,135 @@
+"""
+선언적 필드 매핑 컴파일러 / projection(fields, compact) 테스트
+"""
+
+import asyncio
+
+import pytest
+import xmltodict
+
+import tools.recruit_tools as recruit_tools
+
+from benchmarks.fixtures import FIXTURE_DIR
+from models.recruit import RecruitItem
+from tools.company_tools import COMPANY_LIST_FIELDS, _map_company_item
+from tools.recruit_tools import RECRUIT_LIST_FIELDS, _map_recruit_item
+from tools.training_tools import (
+    TRAINING_DETAIL_FIELDS,
+    TRAINING_LIST_FIELDS,
+    _map_training_detail,
+    _map_training_item,
+)
+from utils.http_client import ensure_list, safe_get
+from utils.mapping import Field, compile_mapper, compile_picker, format_date, parse_int, projected, wants
+
+
+def _reference(fields, item) -> dict:
+    """Field-by-field safe_get() mapping the compiled mappers replace."""
+    out = {}
+    for field in fields:
+        value = safe_get(item, *field.path)
+        if value is None:
+            value = field.default
+        out[field.name] = field.convert(value) if field.convert else value
+    return out
+
+
+def _fixture_items(name: str, *item_path: str) -> list:
+    doc = xmltodict.parse((FIXTURE_DIR / name).read_bytes())
+    return ensure_list(safe_get(doc, *item_path))
+
+
+@pytest.mark.parametrize("fields, mapper, fixture, item_path", [
+    (RECRUIT_LIST_FIELDS, _map_recruit_item, "210L21_list_50.xml", ("dhsOpenEmpInfoList", "dhsOpenEmpInfo")),
+    (COMPANY_LIST_FIELDS, _map_company_item, "210L31_list_50.xml", ("dhsOpenEmpHireInfoList", "dhsOpenEmpHireInfo")),
+    (TRAINING_LIST_FIELDS, _map_training_item, "310L01_list_50.xml", ("HRDNet", "srchList", "scn_list")),
+    (TRAINING_DETAIL_FIELDS, _map_training_detail, "310L02_detail.xml", ("HRDNet",)),
+])
+def test_compiled_mapper_matches_reference(fields, mapper, fixture, item_path):
+    items = _fixture_items(fixture, *item_path)
+    assert items
+    for item in items:
+        assert mapper(item) == _reference(fields, item)
+
+
+def test_defaults_converters_and_nested_sections():
+    mapper = compile_mapper((
+        Field("name", "nm", default=""),
+        Field("date", "dt", convert=format_date),
+        Field("count", ("info", "cnt"), default="0", convert=parse_int),
+        Field("addr", ("info", "addr")),
+    ), "test_mapper")
+    assert mapper({"nm": "a", "dt": "20260105", "info": {"cnt": "3", "addr": "서울"}}) == {
+        "name": "a", "date": "2026-01-05", "count": 3, "addr": "서울",
+    }
+    # 누락/잘못된 섹션은 기본값
+    assert mapper({"info": "not a dict"}) == {"name": "", "date": None, "count": 0, "addr": None}
+
+
+@pytest.mark.parametrize("rec", [None, "text", ["list"], 3])
+def test_non_dict_input_maps_to_defaults(rec):
+    assert _map_recruit_item(rec) == _reference(RECRUIT_LIST_FIELDS, {})
+
+
+def test_spec_validated_against_model():
+    with pytest.raises(TypeError, match="undeclared_field"):
+        compile_mapper(RECRUIT_LIST_FIELDS + (Field("undeclared_field", "x"),), model=RecruitItem)
+
+
+# ------------------------------------------------------------
+# projection / compact
+# ------------------------------------------------------------
+RECRUIT_ITEM = {
+    "empSeqno": "1", "empBusiNm": "한빛소프트", "empWantedTitle": "공채",
+    "coClcdNm": "", "empWantedStdt": "20260105", "regLogImgNm": "logo.png",
+}
+
+
+def test_projection_keeps_requested_fields_in_spec_order():
+    mapper = projected(_map_recruit_item, ["title", "emp_seqno", "unknown"])
+    assert list(mapper(RECRUIT_ITEM)) == ["emp_seqno", "title"]
+    assert mapper(RECRUIT_ITEM) == {"emp_seqno": "1", "title": "공채"}
+
+
+def test_compact_drops_empty_and_verbose_fields():
+    full = _map_recruit_item(RECRUIT_ITEM)
+    assert full["logo_url"] == "logo.png" and full["company_type"] == ""
+    compact = projected(_map_recruit_item, compact=True)(RECRUIT_ITEM)
+    assert compact == {"emp_seqno": "1", "company": "한빛소프트", "title": "공채", "start_date": "2026-01-05"}
+    # 이름으로 요청한 verbose 필드는 compact에서도 포함
+    named = projected(_map_recruit_item, ["title", "logo_url", "company_type"], compact=True)(RECRUIT_ITEM)
+    assert named == {"title": "공채", "logo_url": "logo.png"}
+
+
+def test_projection_variants_are_cached():
+    assert projected(_map_recruit_item) is _map_recruit_item
+    first = projected(_map_recruit_item, ["title"], compact=True)
+    assert projected(_map_recruit_item, ("title",), compact=True) is first
+    assert projected(_map_recruit_item, ["title"]) is not first
+
+
+def test_picker_projects_stored_records():
+    stored = _map_recruit_item(RECRUIT_ITEM)
+    picker = compile_picker(RECRUIT_LIST_FIELDS, "pick")
+    assert picker(stored) == stored
+    assert projected(picker, ["title"])(stored) == {"title": "공채"}
+    assert "logo_url" not in projected(picker, compact=True)(stored)
+
+
+def test_wants():
+    assert wants(None, "emp_seqno")
+    assert wants(["emp_seqno"], "emp_seqno")
+    assert not wants(["title"], "emp_seqno")
+
+
+def test_detail_tool_projection_and_raw_data(monkeypatch):
+    async def fake_api(endpoint, params, api_type):
+        return {"dhsOpenEmpInfoList": {"dhsOpenEmpInfo": RECRUIT_ITEM}}
+
+    monkeypatch.setattr(recruit_tools, "call_work24_api", fake_api)
+    detail = asyncio.run(recruit_tools.get_recruit_detail("1", fields=["title"]))
+    assert detail == {"title": "공채"}
+    detail = asyncio.run(recruit_tools.get_recruit_detail("1", compact=True, include_raw=True))
+    assert detail["emp_seqno"] == "1"
+    assert detail["raw_data"] == RECRUIT_ITEM
+    assert "company_type" not in detail
@@ -0,0 +1,81 @@
+"""
+전체 페이지 조회 (collect_all / iter_items) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from tools.pagination import collect_all, iter_items
+
+
+class _Pages:
+    """Fake list tool over `total` numbered items."""
+
+    def __init__(self, total: int, page_size: int):
+        self.total = total
+        self.page_size = page_size
+        self.requested: list[int] = []
+
+    async def __call__(self, page: int) -> dict:
+        self.requested.append(page)
+        await asyncio.sleep(0.001 * (5 - page % 5))  # 페이지마다 다른 지연
+        start = (page - 1) * self.page_size
+        items = list(range(start, min(start + self.page_size, self.total)))
+        return {"total": self.total, "items": items, "source": "fake"}
+
+
+def test_collect_all_keeps_page_order():
+    pages = _Pages(total=23, page_size=5)
+    result = asyncio.run(collect_all(pages, 5, max_items=100, concurrency=3))
+    assert result["items"] == list(range(23))
+    assert result["truncated"] is False
+    assert result["source"] == "fake"
+    assert sorted(pages.requested) == [1, 2, 3, 4, 5]
+
+
+def test_collect_all_stops_at_max_items():
+    pages = _Pages(total=50, page_size=10)
+    result = asyncio.run(collect_all(pages, 10, max_items=15))
+    assert result["items"] == list(range(15))
+    assert result["truncated"] is True
+    assert sorted(pages.requested) == [1, 2]
+
+
+def test_max_items_is_capped_by_setting(monkeypatch):
+    monkeypatch.setenv("WORK24_FETCH_ALL_MAX_ITEMS", "12")
+    pages = _Pages(total=1000, page_size=10)
+    result = asyncio.run(collect_all(pages, 10, max_items=100000))
+    assert len(result["items"]) == 12
+    assert sorted(pages.requested) == [1, 2]
+
+
+@pytest.mark.parametrize("page_size", [0, -1, 101])
+def test_invalid_page_size(page_size):
+    pages = _Pages(total=10, page_size=10)
+    with pytest.raises(ValueError):
+        asyncio.run(collect_all(pages, page_size))
+    assert pages.requested == []
+
+
+def test_closing_iterator_cancels_prefetched_pages():
+    cancelled = []
+
+    async def fetch(page: int) -> dict:
+        if page > 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        return {"total": 40, "items": list(range(10))}
+
+    async def scenario():
+        items = iter_items(fetch, 10, concurrency=2)
+        first = [await items.__anext__() for _ in range(3)]
+        await asyncio.sleep(0.01)  # 선조회 페이지가 시작되도록
+        await items.aclose()
+        return first
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    assert sorted(cancelled) == [2, 3]
@@ -0,0 +1,182 @@
+"""
+예측 prefetch (다음 페이지/상세 미리 조회) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import tools.recruit_tools as recruit_tools
+import utils.prefetch as prefetch
+from utils.prefetch import Prefetcher
+
+
+@pytest.fixture
+def prefetcher(monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_ENABLED", "true")
+    monkeypatch.setenv("WORK24_PREFETCH_RPS", "1000")
+    monkeypatch.setattr(prefetch, "_HEADROOM_POLL", 0.01)
+    return Prefetcher()
+
+
+class _Fetches:
+    """Fake fetch factory recording completed and cancelled keys."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.done: list[str] = []
+        self.cancelled: list[str] = []
+
+    def __call__(self, key: str, error: BaseException | None = None):
+        async def fetch():
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(key)
+                raise
+            if error is not None:
+                raise error
+            self.done.append(key)
+
+        return fetch
+
+
+async def _drain(prefetcher: Prefetcher) -> None:
+    while prefetcher._jobs or prefetcher._running:
+        await asyncio.sleep(0.005)
+
+
+def test_disabled_schedules_nothing(prefetcher, monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_ENABLED", "false")
+    fetches = _Fetches()
+
+    async def scenario():
+        return prefetcher.schedule("a", fetches("a"))
+
+    assert asyncio.run(scenario()) is False
+    assert prefetcher.stats()["scheduled"] == 0
+
+
+def test_same_key_deduplicated_until_done(prefetcher):
+    fetches = _Fetches()
+
+    async def scenario():
+        assert prefetcher.schedule("a", fetches("a"))
+        assert not prefetcher.schedule("a", fetches("a"))
+        await _drain(prefetcher)
+        # 완료 후에는 다시 예약 가능
+        assert prefetcher.schedule("a", fetches("a"))
+        await _drain(prefetcher)
+
+    asyncio.run(scenario())
+    assert fetches.done == ["a", "a"]
+    assert prefetcher.completed == 2
+
+
+def test_waits_for_headroom(prefetcher):
+    fetches = _Fetches()
+    headroom = {"ok": False}
+
+    async def scenario():
+        prefetcher.schedule("a", fetches("a"), lambda: headroom["ok"])
+        await asyncio.sleep(0.05)
+        assert fetches.done == []
+        assert prefetcher.stats()["pending"] == 1
+        headroom["ok"] = True
+        await _drain(prefetcher)
+
+    asyncio.run(scenario())
+    assert fetches.done == ["a"]
+
+
+def test_newest_first_and_oldest_dropped_when_full(prefetcher, monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_MAX_PENDING", "2")
+    monkeypatch.setenv("WORK24_PREFETCH_CONCURRENCY", "1")
+    fetches = _Fetches()
+
+    async def scenario():
+        for key in ("a", "b", "c"):
+            prefetcher.schedule(key, fetches(key))
+        await _drain(prefetcher)
+
+    asyncio.run(scenario())
+    assert fetches.done == ["c", "b"]
+    assert prefetcher.dropped == 1
+
+
+def test_expired_jobs_dropped(prefetcher, monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_MAX_AGE", "0.02")
+    fetches = _Fetches()
+    headroom = {"ok": False}
+
+    async def scenario():
+        prefetcher.schedule("a", fetches("a"), lambda: headroom["ok"])
+        await asyncio.sleep(0.05)
+        headroom["ok"] = True
+        await _drain(prefetcher)
+
+    asyncio.run(scenario())
+    assert fetches.done == []
+    assert prefetcher.expired == 1
+
+
+def test_failures_counted(prefetcher):
+    fetches = _Fetches()
+
+    async def scenario():
+        prefetcher.schedule("a", fetches("a", RuntimeError("upstream down")))
+        await _drain(prefetcher)
+
+    asyncio.run(scenario())
+    assert prefetcher.failed == 1
+    assert prefetcher.completed == 0
+
+
+def test_close_cancels_running_and_pending(prefetcher, monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_CONCURRENCY", "1")
+    fetches = _Fetches(delay=10.0)
+
+    async def scenario():
+        prefetcher.schedule("a", fetches("a"))
+        prefetcher.schedule("b", fetches("b"))
+        await asyncio.sleep(0.05)
+        await prefetcher.close()
+
+    asyncio.run(scenario())
+    # 가장 최근 예약(b)이 먼저 실행되다 취소되고, a는 실행되지 않음
+    assert fetches.cancelled == ["b"]
+    assert fetches.done == []
+    stats = prefetcher.stats()
+    assert (stats["pending"], stats["running"]) == (0, 0)
+
+
+# ------------------------------------------------------------
+# find_recruit_notice 연동
+# ------------------------------------------------------------
+def test_recruit_listing_schedules_next_page_and_details(prefetcher, monkeypatch):
+    monkeypatch.setenv("WORK24_PREFETCH_DETAILS", "2")
+    monkeypatch.setattr(recruit_tools, "prefetcher", prefetcher)
+    scheduled: list[str] = []
+    monkeypatch.setattr(prefetcher, "schedule", lambda key, fetch, ready: scheduled.append(key))
+
+    async def call_work24_api(endpoint, params, api_type):
+        return {"dhsOpenEmpInfoList": {
+            "total": "25",
+            "dhsOpenEmpInfo": [{"empSeqno": str(i)} for i in range(1, 4)],
+        }}
+
+    monkeypatch.setattr(recruit_tools, "call_work24_api", call_work24_api)
+
+    asyncio.run(recruit_tools.find_recruit_notice(page=1, page_size=10, region="11", prefetch=True))
+    assert len(scheduled) == 3
+    assert scheduled[0].startswith("210L21:list:2:10:")
+    assert "'region': '11'" in scheduled[0]
+    assert scheduled[1:] == ["210L21:detail:1", "210L21:detail:2"]
+
+    # 마지막 페이지에서는 다음 페이지를 예약하지 않음, prefetch=False면 아무것도 예약하지 않음
+    scheduled.clear()
+    asyncio.run(recruit_tools.find_recruit_notice(page=3, page_size=10, prefetch=True))
+    assert scheduled == ["210L21:detail:1", "210L21:detail:2"]
+    scheduled.clear()
+    asyncio.run(recruit_tools.find_recruit_notice(page=1, page_size=10))
+    assert scheduled == []
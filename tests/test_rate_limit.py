@@ -0,0 +1,170 @@
+"""
+호출량 제한 (토큰 버킷 / 적응형 동시성) 테스트
+"""
+
+import asyncio
+import types
+
+import pytest
+
+import utils.rate_limit as rate_limit
+from utils.rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket
+
+
+@pytest.mark.parametrize("workers, rate, burst", [("1", 10.0, 20.0), ("4", 2.5, 5.0)])
+def test_server_quota_split_across_workers(monkeypatch, workers, rate, burst):
+    monkeypatch.setenv("WORK24_WORKERS", workers)
+    monkeypatch.setenv("WORK24_RATE_LIMIT_RPS", "10")
+    monkeypatch.setenv("WORK24_RATE_LIMIT_BURST", "20")
+    limiter = RateLimiter()
+
+    async def scenario():
+        async with limiter.limit("RECRUIT"):
+            pass
+
+    asyncio.run(scenario())
+    stats = limiter.stats()["RECRUIT"]
+    assert stats["rate"] == rate
+    assert limiter._limiters["RECRUIT"].bucket.burst == burst
+
+
+# ------------------------------------------------------------
+# 토큰 버킷
+# ------------------------------------------------------------
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=100.0, burst=3.0)
+
+    async def scenario():
+        waits = [await bucket.acquire() for _ in range(5)]
+        return waits
+
+    waits = asyncio.run(scenario())
+    assert all(w < 0.005 for w in waits[:3])
+    # 버스트 소진 후에는 1/rate 간격
+    assert all(0.005 < w < 0.05 for w in waits[3:])
+
+
+def test_bucket_serves_waiters_in_arrival_order():
+    bucket = TokenBucket(rate=200.0, burst=1.0)
+    order = []
+
+    async def take(i):
+        await bucket.acquire()
+        order.append(i)
+
+    async def scenario():
+        await asyncio.gather(*(take(i) for i in range(6)))
+
+    asyncio.run(scenario())
+    assert order == list(range(6))
+
+
+def test_zero_rate_is_unlimited():
+    bucket = TokenBucket(rate=0.0, burst=1.0)
+
+    async def scenario():
+        return [await bucket.acquire() for _ in range(100)]
+
+    assert max(asyncio.run(scenario())) == 0.0
+
+
+# ------------------------------------------------------------
+# 적응형(AIMD) 동시성
+# ------------------------------------------------------------
+def test_additive_increase_up_to_max():
+    limiter = AdaptiveConcurrency(initial=2, max_limit=3)
+
+    async def scenario():
+        for _ in range(20):
+            await limiter.acquire()
+            limiter.release(0.1, overloaded=False)
+
+    asyncio.run(scenario())
+    assert limiter.limit == 3
+    assert limiter.decreases == 0
+
+
+def test_overload_halves_limit_once_per_baseline_latency(monkeypatch):
+    limiter = AdaptiveConcurrency(initial=16, min_limit=2)
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit, "time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+
+    async def scenario():
+        await limiter.acquire()
+        limiter.release(1.0, overloaded=False)  # 기준 지연 1s
+        for _ in range(3):
+            await limiter.acquire()
+            limiter.release(-1.0, overloaded=True)
+        first = limiter.limit
+        clock[0] += 1.5
+        for _ in range(5):
+            clock[0] += 1.5
+            await limiter.acquire()
+            limiter.release(-1.0, overloaded=True)
+        return first
+
+    first = asyncio.run(scenario())
+    # 같은 기준 지연 안의 연속 실패는 한 번만 반영
+    assert first == pytest.approx(16 / 2 + 1 / 16, abs=0.1)
+    assert limiter.limit == 2
+
+
+def test_latency_spike_decreases_limit():
+    limiter = AdaptiveConcurrency(initial=8, latency_tolerance=2.0)
+
+    async def scenario():
+        for latency in [0.1] * 5 + [5.0] * 3:
+            await limiter.acquire()
+            limiter.release(latency, overloaded=False)
+
+    asyncio.run(scenario())
+    assert limiter.decreases >= 1
+    assert limiter.limit < 8
+
+
+def test_waiters_admitted_fifo_and_cancel_frees_slot():
+    limiter = AdaptiveConcurrency(initial=1, min_limit=1, max_limit=1)
+    order = []
+
+    async def worker(i):
+        await limiter.acquire()
+        order.append(i)
+        await asyncio.sleep(0.001)
+        limiter.release(-1.0, overloaded=False)
+
+    async def scenario():
+        await limiter.acquire()
+        tasks = [asyncio.create_task(worker(i)) for i in range(4)]
+        await asyncio.sleep(0)
+        assert not limiter.has_headroom()
+        tasks[1].cancel()
+        limiter.release(-1.0, overloaded=False)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert order == [0, 2, 3]
+    assert limiter.in_flight == 0
+    assert limiter.stats()["waiting"] == 0
+
+
+def test_limit_releases_slot_on_error_and_cancel():
+    limiter = RateLimiter(is_overload=lambda e: isinstance(e, TimeoutError))
+
+    async def scenario():
+        with pytest.raises(TimeoutError):
+            async with limiter.limit("RECRUIT"):
+                raise TimeoutError
+        task = asyncio.create_task(_hold(limiter))
+        await asyncio.sleep(0.001)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    concurrency = limiter._limiters["RECRUIT"].concurrency
+    assert concurrency.in_flight == 0
+    assert concurrency.decreases == 1
+
+
+async def _hold(limiter: RateLimiter) -> None:
+    async with limiter.limit("RECRUIT"):
+        await asyncio.sleep(1)
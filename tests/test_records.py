@@ -0,0 +1,65 @@
+"""
+__slots__ 레코드 / 결과 직렬화 (encode_result) 테스트
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from tools.company_tools import CompanyRecord
+from tools.training_tools import TRAINING_LIST_FIELDS, TrainingRecord
+from utils.mapping import Field, compile_record
+from utils.serialization import encode_result
+
+ITEM = {name: f"v-{name}" for name in TrainingRecord._fields}
+
+
+def test_record_behaves_like_mapped_dict():
+    record = TrainingRecord.from_dict(ITEM)
+    assert record.keys() == tuple(f.name for f in TRAINING_LIST_FIELDS)
+    assert record.to_dict() == ITEM
+    assert dict(record) == ITEM
+    assert {**record} == ITEM
+    assert record["course_id"] == ITEM["course_id"]
+    assert record.get("course_id") == ITEM["course_id"]
+    assert record.get("missing", 1) == 1
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+def test_record_has_no_instance_dict():
+    record = TrainingRecord.from_dict(ITEM)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_missing_fields_are_none_and_equality_by_type():
+    record = compile_record((Field("a", "x"), Field("b", "y")), "Pair").from_dict({"a": 1})
+    assert record.to_dict() == {"a": 1, "b": None}
+    assert TrainingRecord.from_dict(ITEM) == TrainingRecord.from_dict(dict(ITEM))
+    assert TrainingRecord.from_dict(ITEM) != TrainingRecord.from_dict({**ITEM, "course_id": "other"})
+    # 필드가 같아도 다른 레코드 타입과는 같지 않음
+    assert CompanyRecord.from_dict({}) != TrainingRecord.from_dict({})
+
+
+def test_encode_result_is_compact_json():
+    data = {"total": 2, "items": [{"name": "한빛", "n": 1.5, "none": None}], "ok": True}
+    text = encode_result(data)
+    assert "\n" not in text and ": " not in text
+    assert "한빛" in text
+    assert json.loads(text) == data
+
+
+def test_encode_result_records_and_fallbacks():
+    record = TrainingRecord.from_dict(ITEM)
+    text = encode_result({"items": [record], "day": date(2026, 1, 5), "other": object})
+    decoded = json.loads(text)
+    assert decoded["items"] == [ITEM]
+    assert decoded["day"] == "2026-01-05"
+    assert decoded["other"] == str(object)
+
+
+def test_encode_result_passes_strings_through():
+    assert encode_result("already text") == "already text"
@@ -0,0 +1,165 @@
+"""
+재시도 정책 / 서킷 브레이커 테스트
+"""
+
+import asyncio
+import types
+import uuid
+
+import httpx
+import pytest
+
+import utils.http_client as http_client
+import utils.resilience as resilience
+from utils.cache import use_cache_policy
+from utils.resilience import CircuitBreaker, CircuitBreakers, RetryPolicy, Work24CircuitOpen
+
+ENDPOINT = "callOpenApiSvcInfo210L21"
+OK_RESULT = {"dhsOpenEmpInfoList": {"total": "0"}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(resilience, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(attempts=5, base_delay=0.2, max_delay=1.0)
+    for attempt, cap in enumerate((0.2, 0.4, 0.8, 1.0, 1.0)):
+        delays = [policy.backoff(attempt) for _ in range(200)]
+        assert all(0 <= d <= cap for d in delays)
+        assert len(set(delays)) > 1
+
+
+def test_policy_from_env(monkeypatch):
+    monkeypatch.setenv("WORK24_RETRY_ATTEMPTS", "0")
+    assert RetryPolicy.from_env().attempts == 1
+
+
+def test_breaker_state_transitions(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    # 성공하면 연속 실패 수 초기화
+    breaker.record_success()
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10.0
+
+    # reset_timeout 후 half_open: 탐색 요청 하나만 허용
+    clock.now += 10.0
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    # 탐색 실패 시 다시 open
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.times_opened == 2
+
+    clock.now += 10.0
+    assert breaker.allow()
+    # 건강 상태와 무관한 결과(취소/4xx)는 탐색 기회만 반납
+    breaker.release_probe()
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    assert breaker.rejected == 2
+
+
+def test_breakers_per_endpoint(monkeypatch):
+    monkeypatch.setenv("WORK24_CIRCUIT_FAILURE_THRESHOLD", "1")
+    breakers = CircuitBreakers()
+    breakers.get("a").record_failure()
+    assert breakers.get("a").state == "open"
+    assert breakers.get("b").state == "closed"
+    assert set(breakers.stats()) == {"a", "b"}
+
+
+# ------------------------------------------------------------
+# call_work24_api 연동
+# ------------------------------------------------------------
+class _Upstream:
+    """Replaces _send_hedged: fails with the queued errors, then succeeds."""
+
+    def __init__(self, errors: list[BaseException]):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self, endpoint, api_type, send):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return OK_RESULT, 0.01, None
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    monkeypatch.setenv(http_client.ApiType.RECRUIT.value, "test-key")
+    monkeypatch.setenv("WORK24_RETRY_BASE_DELAY", "0")
+    monkeypatch.setenv("WORK24_CIRCUIT_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("WORK24_STREAM_PARSE", "false")
+    monkeypatch.setattr(http_client, "_breakers", CircuitBreakers())
+
+    async def get_client(base_url):
+        return None
+
+    monkeypatch.setattr(http_client.http_pool, "get_client", get_client)
+
+    def install(*errors: BaseException) -> _Upstream:
+        fake = _Upstream(list(errors))
+        monkeypatch.setattr(http_client, "_send_hedged", fake)
+        return fake
+
+    return install
+
+
+def _call() -> dict:
+    async def scenario():
+        # 매 호출 새 파라미터 + 캐시 미저장 (다른 테스트와 캐시 공유 방지)
+        with use_cache_policy(allow_stale=False, store=False):
+            return await http_client.call_work24_api(
+                ENDPOINT, {"callTp": "L", "test": uuid.uuid4().hex}, http_client.ApiType.RECRUIT,
+            )
+
+    return asyncio.run(scenario())
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.invalid")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+def test_transient_failures_retried(upstream):
+    fake = upstream(httpx.ConnectError("reset"), _status_error(503))
+    assert _call() == OK_RESULT
+    assert fake.calls == 3
+    assert http_client._breakers.get(ENDPOINT).state == "closed"
+
+
+def test_client_errors_not_retried_and_not_counted(upstream):
+    fake = upstream(_status_error(400))
+    with pytest.raises(httpx.HTTPStatusError):
+        _call()
+    assert fake.calls == 1
+    assert http_client._breakers.get(ENDPOINT).failures == 0
+
+
+def test_circuit_opens_after_exhausted_retries(upstream, monkeypatch):
+    monkeypatch.setenv("WORK24_RETRY_ATTEMPTS", "1")
+    fake = upstream(*[_status_error(502)] * 2)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            _call()
+    with pytest.raises(Work24CircuitOpen) as info:
+        _call()
+    assert info.value.endpoint == ENDPOINT
+    assert fake.calls == 2
@@ -0,0 +1,53 @@
+"""
+서버 lifespan / 공유 HTTP 풀 수명 테스트
+"""
+
+import pytest
+from starlette.testclient import TestClient
+
+import server
+from utils.http_pool import http_pool
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.fixture
+def pool_calls(monkeypatch):
+    for name in ("WORK24_RECRUIT_MIRROR", "WORK24_TRAINING_CATALOG", "WORK24_COMPANY_INDEX",
+                 "WORK24_PERSISTENT_CACHE", "WORK24_SHARED_CACHE"):
+        monkeypatch.setenv(name, "false")
+    calls = {"acquire": 0, "release": 0}
+    acquire, release = http_pool.acquire, http_pool.release
+
+    async def counting_acquire():
+        calls["acquire"] += 1
+        await acquire()
+
+    async def counting_release():
+        calls["release"] += 1
+        await release()
+
+    monkeypatch.setattr(http_pool, "acquire", counting_acquire)
+    monkeypatch.setattr(http_pool, "release", counting_release)
+    return calls
+
+
+def test_stateless_requests_share_one_pool(pool_calls):
+    with TestClient(server.create_app()) as client:
+        for request_id in (1, 2):
+            response = client.post(
+                "/mcp",
+                json={"jsonrpc": "2.0", "id": request_id, "method": "tools/list"},
+                headers=MCP_HEADERS,
+            )
+            assert response.status_code == 200
+            assert "career_snapshot_tool" in response.text
+        assert pool_calls == {"acquire": 1, "release": 0}
+    assert pool_calls == {"acquire": 1, "release": 1}
+
+
+def test_status_route_runs_inside_runtime(pool_calls):
+    with TestClient(server.create_app()) as client:
+        assert client.get("/").status_code == 200
+        assert client.get("/stats").status_code == 200
+    assert pool_calls == {"acquire": 1, "release": 1}
@@ -0,0 +1,235 @@
+"""
+워커 간 공유 캐시 리스 / 백그라운드 동기화 리더 선출 테스트
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from stores.sync import PeriodicSync
+from utils.cache import ResponseCache, use_cache_policy
+from utils.shared_cache import SharedCache
+
+ENDPOINT = "callOpenApiSvcInfo210L21"
+OK_RESULT = {"dhsOpenEmpInfoList": {"dhsOpenEmpInfo": [{"empSeqno": "1"}]}}
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two SharedCache handles on one file, as two worker processes would open it."""
+    path = tmp_path / "shared.db"
+    caches = [SharedCache(path), SharedCache(path)]
+    yield caches
+    for cache in caches:
+        cache.close()
+
+
+def test_concurrent_workers_migrate_old_db_once(tmp_path):
+    path = tmp_path / "shared.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries (key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, value BLOB NOT NULL,"
+        " negative INTEGER NOT NULL, stored_at REAL NOT NULL, expires_at REAL NOT NULL,"
+        " stale_until REAL NOT NULL)"
+    )
+    conn.close()
+    caches = [SharedCache(path) for _ in range(8)]
+    barrier = threading.Barrier(len(caches))
+    errors: list[BaseException] = []
+
+    def open_cache(cache: SharedCache) -> None:
+        barrier.wait()
+        try:
+            cache._connect()
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=open_cache, args=(cache,)) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert errors == []
+        columns = {row[1] for row in caches[0]._connect().execute("PRAGMA table_info(entries)")}
+        assert {"hits", "last_used", "size"} <= columns
+    finally:
+        for cache in caches:
+            cache.close()
+
+
+def test_lease_contention(workers):
+    a, b = workers
+    assert a.try_lease("k")
+    assert not b.try_lease("k")
+    assert b.lease_held("k")
+    assert not a.lease_held("k")
+    assert (a.leases_won, b.leases_lost) == (1, 1)
+
+    a.release_lease("k")
+    assert not b.lease_held("k")
+    assert b.try_lease("k")
+    assert not a.try_lease("k")
+
+
+def test_release_only_by_owner(workers):
+    a, b = workers
+    assert a.try_lease("k")
+    b.release_lease("k")
+    assert b.lease_held("k")
+
+
+def test_expired_lease_taken_over(workers):
+    a, b = workers
+    assert a.try_lease("k", ttl=0.05)
+    assert not b.try_lease("k")
+    time.sleep(0.06)
+    assert b.try_lease("k")
+    assert a.lease_held("k")
+
+
+def test_owner_renews_lease(workers):
+    a, b = workers
+    assert a.try_lease("k", ttl=0.05)
+    time.sleep(0.03)
+    assert a.try_lease("k", ttl=0.05)
+    time.sleep(0.03)
+    # 갱신 없이는 만료됐을 시점이지만 갱신으로 유지
+    assert not b.try_lease("k")
+
+
+def test_sync_runs_visible_to_peers(workers):
+    a, b = workers
+    assert b.sync_started_at("job") is None
+    a.mark_sync_start("job")
+    started = b.sync_started_at("job")
+    assert started is not None and started <= time.time()
+
+
+def test_crawl_pages_shared_but_not_kept_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORK24_CACHE_ENABLED", "true")
+    monkeypatch.setenv("WORK24_SHARED_CACHE", "true")
+    monkeypatch.setenv("WORK24_SHARED_CACHE_PATH", str(tmp_path / "shared.db"))
+    writer, reader = ResponseCache(), ResponseCache()
+
+    async def scenario():
+        assert writer.peers() is not None
+        await writer.store("page", ENDPOINT, OK_RESULT, 60, memory=False)
+        assert writer._ensure().get("page") is None
+        # 동기화 중인 다른 워커는 공유 계층에서 읽되 메모리에 올리지 않음
+        with use_cache_policy(allow_stale=False, store=False):
+            assert await reader.get("page") == OK_RESULT
+        assert reader._ensure().get("page") is None
+        assert await reader.get("page") == OK_RESULT
+        assert reader._ensure().get("page") == OK_RESULT
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        writer.close()
+        reader.close()
+
+
+class _Job(PeriodicSync):
+    name = "test sync"
+
+    def __init__(self, peers: SharedCache, exclusive: bool, duration: float = 0.0):
+        super().__init__(interval=60.0, retry_delay=60.0)
+        self.peers = peers
+        self.exclusive = exclusive
+        self.duration = duration
+        self.synced = 0
+
+    def _peers(self) -> SharedCache:
+        return self.peers
+
+    async def sync_once(self) -> None:
+        await asyncio.sleep(self.duration)
+        self.synced += 1
+
+
+@pytest.fixture
+def lease_ttl(monkeypatch):
+    monkeypatch.setenv("WORK24_SYNC_LEASE_TTL", "0.3")
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    """Wait for condition() instead of fixed sleeps (slow CI workers)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+def test_exclusive_sync_runs_on_leader_only(workers, lease_ttl):
+    leader, follower = (_Job(cache, exclusive=True) for cache in workers)
+
+    async def scenario():
+        leader.start()
+        await _until(lambda: leader.synced)
+        follower.start()
+        # 팔로워가 리스 확인 주기(ttl/3)를 몇 번 돌 동안 실행하지 않음
+        await asyncio.sleep(0.25)
+        await follower.stop()
+        await leader.stop()
+
+    asyncio.run(scenario())
+    assert (leader.synced, follower.synced) == (1, 0)
+    assert not follower.leader
+
+
+def test_followers_run_after_leader(workers, lease_ttl):
+    leader, follower = (_Job(cache, exclusive=False) for cache in workers)
+
+    async def scenario():
+        leader.start()
+        await _until(lambda: leader.synced)
+        follower.start()
+        await _until(lambda: follower.synced)
+        await asyncio.sleep(0.25)
+        await follower.stop()
+        await leader.stop()
+
+    asyncio.run(scenario())
+    # 팔로워는 리더의 실행 한 번당 한 번만 따라 실행
+    assert (leader.synced, follower.synced) == (1, 1)
+
+
+def test_leadership_moves_when_leader_stops(workers, lease_ttl):
+    leader, follower = (_Job(cache, exclusive=True) for cache in workers)
+
+    async def scenario():
+        leader.start()
+        await _until(lambda: leader.synced)
+        follower.start()
+        await _until(lambda: follower.running)
+        assert (leader.leader, follower.leader) == (True, False)
+        await leader.stop()
+        await _until(lambda: follower.synced)
+        assert follower.leader
+        await follower.stop()
+
+    asyncio.run(scenario())
+    assert (leader.synced, follower.synced) == (1, 1)
+
+
+def test_run_cancelled_when_leadership_lost(workers, lease_ttl):
+    a, b = workers
+    job = _Job(a, exclusive=True, duration=10.0)
+
+    async def scenario():
+        job.start()
+        await _until(lambda: job.leader and job._run is not None)
+        # 리스 갱신이 늦어 다른 워커가 리더가 된 상황
+        a.release_lease(job.lease_key)
+        assert b.try_lease(job.lease_key, ttl=10)
+        await _until(lambda: not job.leader)
+        await _until(lambda: job._run is None)
+        assert job.running
+        await job.stop()
+
+    asyncio.run(scenario())
+    assert (job.synced, job.runs, job.failures) == (0, 0, 0)
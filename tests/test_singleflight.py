@@ -0,0 +1,109 @@
+"""
+SingleFlight 요청 병합/취소 테스트
+"""
+
+import asyncio
+
+from utils.singleflight import SingleFlight
+
+
+class _Upstream:
+    """Fake upstream call that blocks until released and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        call = self.calls
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return call
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        flight, upstream = SingleFlight(), _Upstream()
+        callers = [asyncio.create_task(flight.do("k", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*callers), upstream, flight
+
+    results, upstream, flight = asyncio.run(scenario())
+    assert results == [1, 1, 1]
+    assert upstream.calls == 1
+    assert flight.stats()["coalesced"] == 2
+
+
+def test_cancelling_one_waiter_keeps_call_for_others():
+    async def scenario():
+        flight, upstream = SingleFlight(), _Upstream()
+        first = asyncio.create_task(flight.do("k", upstream))
+        second = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        upstream.release.set()
+        return await second, upstream, flight
+
+    result, upstream, flight = asyncio.run(scenario())
+    assert result == 1
+    assert upstream.cancelled == 0
+    assert flight.abandoned == 0
+
+
+def test_last_waiter_leaving_cancels_upstream_call():
+    async def scenario():
+        flight, upstream = SingleFlight(), _Upstream()
+        caller = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        # 취소된 공유 task가 정리될 때까지 진행
+        await asyncio.sleep(0)
+        return upstream, flight
+
+    upstream, flight = asyncio.run(scenario())
+    assert upstream.cancelled == 1
+    assert flight.abandoned == 1
+    assert not flight.in_flight("k")
+
+
+def test_caller_joining_after_cancel_starts_fresh_call():
+    async def scenario():
+        flight, upstream = SingleFlight(), _Upstream()
+        caller = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        caller.cancel()
+        # 마지막 호출자가 빠지며 공유 task를 취소한 직후 (task 종료 전)
+        await asyncio.sleep(0)
+        # 같은 키로 합류해도 취소된 task가 아닌 새 호출을 받아야 함
+        late = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await late, upstream
+
+    result, upstream = asyncio.run(scenario())
+    assert result == 2
+    assert upstream.calls == 2
+
+
+def test_detached_call_survives_without_waiters():
+    async def scenario():
+        flight, upstream = SingleFlight(), _Upstream()
+        task = flight.start("k", upstream, detached=True)
+        caller = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        upstream.release.set()
+        return await task, upstream
+
+    result, upstream = asyncio.run(scenario())
+    assert result == 1
+    assert upstream.cancelled == 0
@@ -0,0 +1,67 @@
+"""
+career_snapshot 통합 조회 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import tools.snapshot_tools as snapshot_tools
+from utils.regions import recruit_region_code, sido_codes, training_area_code
+
+
+@pytest.fixture
+def axes(monkeypatch):
+    """Replace every axis with a fake that records its arguments."""
+    calls: dict[str, dict] = {}
+
+    def fake(axis: str):
+        async def tool(*args, **kwargs):
+            calls[axis] = kwargs
+            if axis == "company":
+                raise RuntimeError("upstream down")
+            return {"total": 1, "items": [{"axis": axis}]}
+        return tool
+
+    monkeypatch.setattr(snapshot_tools, "match_youth_programs", fake("youth"))
+    monkeypatch.setattr(snapshot_tools, "find_recruit_notice", fake("recruit"))
+    monkeypatch.setattr(snapshot_tools, "find_training_course", fake("training"))
+    monkeypatch.setattr(snapshot_tools, "find_strong_company", fake("company"))
+    return calls
+
+
+def test_region_resolved_per_api(axes):
+    result = asyncio.run(snapshot_tools.career_snapshot(25, "구직자", region="강원"))
+    assert axes["youth"]["region"] == "강원"
+    assert axes["recruit"]["region"] == recruit_region_code("강원") == "51"
+    assert axes["training"]["area1"] == training_area_code("강원") == "51"
+    assert result["profile"]["region_codes"] == {"recruit": "51", "training": "51"}
+
+
+def test_failed_axis_reported_without_failing_others(axes):
+    result = asyncio.run(snapshot_tools.career_snapshot(25, "구직자", page_size=500))
+    statuses = {axis: r["status"] for axis, r in result["axes"].items()}
+    assert statuses == {"youth": "ok", "recruit": "ok", "training": "ok", "company": "error"}
+    assert result["axes"]["company"]["error"] == {"type": "RuntimeError", "message": "upstream down"}
+    assert not result["complete"]
+    # page_size는 1..100으로 제한
+    assert axes["recruit"]["page_size"] == 100
+
+
+def test_selected_axes_only(axes):
+    result = asyncio.run(snapshot_tools.career_snapshot(25, "구직자", axes=["youth"]))
+    assert list(result["axes"]) == ["youth"]
+    assert result["complete"]
+    assert list(axes) == ["youth"]
+
+
+def test_unknown_axis_rejected(axes):
+    with pytest.raises(ValueError):
+        asyncio.run(snapshot_tools.career_snapshot(25, "구직자", axes=["weather"]))
+
+
+def test_sido_codes():
+    assert sido_codes("서울특별시 강남구") == ("11",)
+    assert sido_codes("전라북도 전주시") == ("45", "52")
+    assert sido_codes("") == ()
+    assert recruit_region_code("알 수 없음") is None
@@ -0,0 +1,78 @@
+"""
+훈련과정 카탈로그 covers() / search() 일관성 테스트
+"""
+
+from stores.training_catalog import StartDateIndex, TrainingCatalog
+from tools.training_tools import TrainingRecord
+
+
+def _round(course_id: str, start: str, end: str, address: str = "서울 강남구") -> TrainingRecord:
+    return TrainingRecord.from_dict({
+        "course_id": course_id,
+        "course_round": "1",
+        "title": f"{course_id} 과정",
+        "start_date": start,
+        "end_date": end,
+        "address": address,
+    })
+
+
+def _catalog() -> TrainingCatalog:
+    catalog = TrainingCatalog()
+    catalog.replace_window(20260201, 20260228, [
+        _round("A", "2026-02-02", "2026-07-31"),
+        _round("B", "2026-02-20", "2026-02-27", address="경기 성남시"),
+    ])
+    catalog.replace_window(20260301, 20260331, [
+        _round("C", "2026-03-10", "2026-03-20"),
+    ])
+    return catalog
+
+
+def _ids(records) -> list[str]:
+    return [record.get("course_id") for record in records]
+
+
+def test_search_matches_start_date_range():
+    catalog = _catalog()
+    # A는 3월에도 진행 중이지만 시작일 기준이므로 제외 (310L01과 동일)
+    assert _ids(catalog.search("20260301", "20260331")) == ["C"]
+    assert _ids(catalog.search("20260215", "20260315")) == ["B", "C"]
+    assert _ids(catalog.search("20260201", "20260228", area1="41")) == ["B"]
+
+
+def test_covers_agrees_with_search_window():
+    catalog = _catalog()
+    assert catalog.covers(20260201, 20260331)
+    assert catalog.covers(20260215, 20260305)
+    # 수집 구간 밖에서 시작하는 회차는 카탈로그가 알 수 없음
+    assert not catalog.covers(20260115, 20260215)
+    assert not catalog.covers(20260320, 20260410)
+
+
+def test_replace_window_keeps_other_windows():
+    catalog = _catalog()
+    catalog.replace_window(20260201, 20260228, [_round("D", "2026-02-05", "2026-02-06")])
+    assert _ids(catalog.search("20260201", "20260331")) == ["D", "C"]
+
+
+def test_not_ready_before_first_window():
+    catalog = TrainingCatalog()
+    assert not catalog.covers(20260101, 20260131)
+    assert catalog.search("20260101", "20260131") == []
+
+
+def test_start_date_index_bounds_are_inclusive():
+    index = StartDateIndex([(20260310, ("C", "1")), (20260301, ("A", "1")), (20260331, ("B", "1"))])
+    assert index.starting(20260301, 20260331) == [("A", "1"), ("C", "1"), ("B", "1")]
+    assert index.starting(20260302, 20260330) == [("C", "1")]
+    assert index.starting(20260401, 20260430) == []
+
+
+def test_prune_drops_finished_rounds_and_shrinks_coverage():
+    catalog = _catalog()
+    catalog.prune(20260301)
+    # A(7월 종료)는 남고 B(2월 종료)는 삭제, 수집 구간은 3월부터
+    assert _ids(catalog.search("20260201", "20260331")) == ["A", "C"]
+    assert not catalog.covers(20260215, 20260310)
+    assert catalog.covers(20260301, 20260331)
@@ -0,0 +1,54 @@
+"""
+스트리밍 XML 파서 (StreamingItemParser) 테스트: xmltodict와 같은 결과인지 확인
+"""
+
+import pytest
+import xmltodict
+
+from benchmarks.fixtures import FIXTURE_DIR
+from utils.endpoints import ENDPOINTS
+from utils.xml_stream import StreamingItemParser
+
+RECRUIT_PATH = ("dhsOpenEmpInfoList", "dhsOpenEmpInfo")
+_SPECS = {spec.short_name: spec for spec in ENDPOINTS.values()}
+
+
+def _stream(item_path: tuple[str, ...], body: bytes, chunk: int) -> dict:
+    parser = StreamingItemParser(item_path)
+    for i in range(0, len(body), chunk):
+        parser.feed(body[i:i + chunk])
+    return parser.close()
+
+
+@pytest.mark.parametrize("fixture", sorted(p.name for p in FIXTURE_DIR.glob("*.xml")))
+@pytest.mark.parametrize("chunk", [7, 1024, 1 << 20])
+def test_matches_xmltodict_on_fixtures(fixture, chunk):
+    body = (FIXTURE_DIR / fixture).read_bytes()
+    item_path = _SPECS[fixture.split("_")[0]].item_path
+    # 청크 7바이트: 한글(UTF-8 3바이트)과 태그가 청크 경계에서 잘림
+    assert _stream(item_path, body, chunk) == xmltodict.parse(body)
+
+
+@pytest.mark.parametrize("doc", [
+    # 항목 1개: 리스트가 아닌 dict
+    "<dhsOpenEmpInfoList><total>1</total><dhsOpenEmpInfo><a>1</a></dhsOpenEmpInfo></dhsOpenEmpInfoList>",
+    # 항목 없음
+    "<dhsOpenEmpInfoList><total>0</total></dhsOpenEmpInfoList>",
+    # 속성, 빈 요소, 반복 태그, 공백 텍스트
+    '<dhsOpenEmpInfoList x="1"><total> 2 </total>'
+    '<dhsOpenEmpInfo id="a"><a/><b>t</b><b>u</b></dhsOpenEmpInfo>'
+    "<dhsOpenEmpInfo><a>x</a></dhsOpenEmpInfo></dhsOpenEmpInfoList>",
+])
+def test_matches_xmltodict_on_edge_cases(doc):
+    assert _stream(RECRUIT_PATH, doc.encode(), 5) == xmltodict.parse(doc)
+
+
+def test_items_counted_and_released():
+    body = (FIXTURE_DIR / "210L21_list_50.xml").read_bytes()
+    parser = StreamingItemParser(RECRUIT_PATH)
+    parser.feed(body[: len(body) // 2])
+    assert 0 < parser.items_parsed < 50
+    parser.feed(body[len(body) // 2:])
+    parser.close()
+    assert parser.items_parsed == 50
+    assert parser._stack == []
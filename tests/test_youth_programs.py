@@ -0,0 +1,112 @@
+"""
+청년 프로그램 카탈로그 (비트셋 색인 / 파일 변경 시 재적재) 테스트
+"""
+
+import asyncio
+import itertools
+import json
+import os
+
+import pytest
+
+import tools.youth_program_tools as youth_tools
+from stores.youth_programs import YouthProgramCatalog, iter_bits, youth_program_catalog
+
+EMPLOYMENT = ("구직자", "재직자", "창업자", "학생", "기타")
+EDUCATION = (None, "재학", "휴학", "졸업", "중퇴")
+PREFERENCES = (None, ["employment"], ["training", "allowance"], ["housing", "finance", "startup"])
+REGIONS = (None, "서울", "부산", "제주")
+
+
+def _brute_match(programs, age, employment, education, preferences, region) -> list[tuple[str, float]]:
+    """Linear scan over validated programs with the tool's scoring rules."""
+    matched = []
+    for prog in programs:
+        if not prog.target_age_min <= age <= prog.target_age_max:
+            continue
+        if prog.target_employment_status and employment not in prog.target_employment_status:
+            continue
+        if region and prog.regions and region not in prog.regions:
+            continue
+        score = 0.3 + 0.25
+        if education and (not prog.target_education_status or education in prog.target_education_status):
+            score += 0.15
+        if preferences and prog.category.value in preferences:
+            score += 0.3
+        matched.append((prog.program_id, round(score, 2)))
+    matched.sort(key=lambda x: x[1], reverse=True)
+    return matched
+
+
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(1 << 200)) == [200]
+
+
+def test_matching_equals_linear_scan():
+    programs = youth_program_catalog.snapshot().programs
+    assert programs
+    for age, employment, education, preferences, region in itertools.product(
+        (14, 15, 19, 24, 29, 34, 39, 45), EMPLOYMENT, EDUCATION, PREFERENCES, REGIONS,
+    ):
+        result = asyncio.run(youth_tools.match_youth_programs(
+            age, employment, education, preferences, region, compact=True,
+        ))
+        expected = _brute_match(programs, age, employment, education, preferences, region)
+        got = [(item["program"]["program_id"], item["match_score"]) for item in result["items"]]
+        assert got == expected[:10]
+        assert result["matched_count"] == len(expected)
+
+
+def _write(path, programs) -> None:
+    path.write_text(json.dumps(programs, ensure_ascii=False), encoding="utf-8")
+
+
+def _program(program_id: str, **overrides) -> dict:
+    program = {
+        "program_id": program_id, "name": program_id, "category": "employment",
+        "description": "", "target_age_min": 15, "target_age_max": 34,
+        "target_employment_status": [], "benefits": [], "apply_channel": "",
+    }
+    program.update(overrides)
+    return program
+
+
+def _bump_mtime(path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_reload_on_change_and_keep_previous_on_error(tmp_path):
+    path = tmp_path / "programs.json"
+    _write(path, [_program("A")])
+    catalog = YouthProgramCatalog(path)
+    first = catalog.snapshot()
+    assert [p.program_id for p in first.programs] == ["A"]
+    assert catalog.snapshot() is first
+
+    _write(path, [_program("A"), _program("B", regions=["서울"])])
+    _bump_mtime(path)
+    second = catalog.snapshot()
+    assert [p.program_id for p in second.programs] == ["A", "B"]
+    assert second.by_region == {"서울": 0b10}
+    assert second.nationwide == 0b01
+
+    # 검증 실패한 파일은 무시하고 이전 스냅샷 유지
+    _write(path, [{"program_id": "broken"}])
+    _bump_mtime(path)
+    assert catalog.snapshot() is second
+    assert catalog.reloads == 2
+
+
+def test_missing_file_is_empty(tmp_path):
+    catalog = YouthProgramCatalog(tmp_path / "missing.json")
+    assert catalog.snapshot().programs == ()
+
+
+def test_invalid_file_on_first_load_raises(tmp_path):
+    path = tmp_path / "programs.json"
+    _write(path, [{"program_id": "broken"}])
+    with pytest.raises(ValueError):
+        YouthProgramCatalog(path).snapshot()
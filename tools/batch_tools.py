@@ -0,0 +1,102 @@
+"""
+Batch (일괄 조회) MCP Tools
+여러 건의 채용/훈련 상세 조회를 한 번의 호출로 동시에 실행
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from tools.recruit_tools import get_recruit_detail
+from tools.training_tools import get_training_course_detail
+from utils.config import env_int
+from utils.http_client import error_info
+
+logger = logging.getLogger("work24_batch")
+
+
+async def _run_one(
+    sem: asyncio.Semaphore,
+    kind: str,
+    key: dict[str, Any],
+    fetch: Callable[[], Awaitable[dict]],
+) -> dict[str, Any]:
+    async with sem:
+        try:
+            result = await fetch()
+        except Exception as e:
+            logger.warning("Batch %s lookup failed for %s: %s", kind, key, e)
+            return {"kind": kind, "key": key, "ok": False, "error": error_info(e)}
+    return {"kind": kind, "key": key, "ok": True, "result": result}
+
+
+async def batch_get_details(
+    emp_seqnos: list[str] | None = None,
+    training_courses: list[dict[str, str]] | None = None,
+    max_concurrency: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    """
+    Run many detail lookups concurrently and return them in one response.
+
+    Args:
+        emp_seqnos: 공채속보 posting IDs (same as get_recruit_detail)
+        training_courses: Training courses as dicts with course_id and
+            optional course_round (default '1') and org_id
+            (same as get_training_course_detail)
+        max_concurrency: Maximum lookups in flight at once
+            (capped by WORK24_BATCH_CONCURRENCY, default 8)
+        fields: Only return these fields in each result
+            (names from get_recruit_detail / get_training_course_detail)
+        compact: Omit empty values and long/secondary fields in each result
+
+    Returns:
+        Dictionary with per-item results in request order; each item has
+        ok=True and result, or ok=False and error (type, message)
+    """
+    emp_seqnos = emp_seqnos or []
+    training_courses = training_courses or []
+
+    max_items = env_int("WORK24_BATCH_MAX_ITEMS", 50)
+    requested = len(emp_seqnos) + len(training_courses)
+    if requested > max_items:
+        raise ValueError(f"Too many lookups in one batch: {requested} (max {max_items})")
+
+    limit = env_int("WORK24_BATCH_CONCURRENCY", 8)
+    if max_concurrency:
+        limit = min(limit, max_concurrency)
+    sem = asyncio.Semaphore(max(limit, 1))
+
+    jobs = []
+    for emp_seqno in emp_seqnos:
+        jobs.append(_run_one(
+            sem, "recruit", {"emp_seqno": emp_seqno},
+            lambda emp_seqno=emp_seqno: get_recruit_detail(emp_seqno, fields=fields, compact=compact),
+        ))
+    for course in training_courses:
+        key = {
+            "course_id": course.get("course_id", ""),
+            "course_round": course.get("course_round") or "1",
+            "org_id": course.get("org_id") or "",
+        }
+        if not key["course_id"]:
+            jobs.append(_invalid("training", key, "course_id is required"))
+            continue
+        jobs.append(_run_one(
+            sem, "training", key,
+            lambda key=key: get_training_course_detail(**key, fields=fields, compact=compact),
+        ))
+
+    items = await asyncio.gather(*jobs)
+    succeeded = sum(1 for item in items if item["ok"])
+    return {
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "items": items,
+    }
+
+
+async def _invalid(kind: str, key: dict[str, Any], message: str) -> dict[str, Any]:
+    return {"kind": kind, "key": key, "ok": False, "error": {"type": "ValueError", "message": message}}
@@ -4,7 +4,40 @@ Company (기업정보) MCP Tools
 API: callOpenApiSvcInfo210L31
 """
 
-from utils.http_client import call_work24_api, safe_get, ensure_list, ApiType
+from models.company import CompanyItem
+from stores.company_index import company_index
+from stores.sync import iso_timestamp
+from tools.pagination import collect_all
+from utils.http_client import call_work24_api, safe_get, ensure_list, stale_info, ApiType
+from utils.mapping import Field, compile_mapper, compile_picker, compile_record, parse_float, projected, validate_spec
+from utils.metrics import observe_phase
+
+
+# 기업 목록 항목 매핑 (210L31)
+COMPANY_LIST_FIELDS = (
+    Field("company_id", "empCoNo", default=""),
+    Field("company_name", "coNm", default=""),
+    Field("company_type", "coClcdNm"),
+    Field("business_no", "busino", verbose=True),
+    Field("summary", "coIntroSummaryCont"),
+    Field("description", "coIntroCont", verbose=True),
+    Field("homepage", "homepg"),
+    Field("main_business", "mainBusiCont"),
+    Field("logo_url", "regLogImgNm", verbose=True),
+    Field("latitude", "mapCoorY", convert=parse_float),
+    Field("longitude", "mapCoorX", convert=parse_float),
+)
+
+# 출력 필드는 models/의 스키마와 import 시점에 한 번 대조
+_map_company_item = compile_mapper(COMPANY_LIST_FIELDS, "map_company_item", model=CompanyItem)
+# 위치 색인 보관용 레코드
+CompanyRecord = compile_record(COMPANY_LIST_FIELDS, "CompanyRecord")
+# 위치 색인 검색 결과(이미 매핑된 항목 + distance_km) projection용
+_pick_nearby_company = compile_picker(
+    COMPANY_LIST_FIELDS + (Field("distance_km", "distance_km"),),
+    "pick_nearby_company",
+)
+validate_spec(_pick_nearby_company.fields, CompanyItem)
 
 
 async def find_strong_company(
@@ -14,6 +47,10 @@ async def find_strong_company(
     page_size: int = 10,
     sort_field: str | None = None,
     sort_order: str = "DESC",
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
     """
     Search strong/hiring companies from Work24.
@@ -28,10 +65,27 @@ async def find_strong_company(
         page_size: Number of results per page
         sort_field: Sort field name
         sort_order: Sort order ('ASC' or 'DESC')
+        fetch_all: Fetch every page from page 1 (page is ignored) and return
+            all items in one response, prefetching pages concurrently
+        max_items: With fetch_all, stop after this many items
+            (default and maximum WORK24_FETCH_ALL_MAX_ITEMS)
+        fields: Only return these item fields (e.g. ['company_id', 'company_name'])
+        compact: Omit empty values and long/secondary fields (description,
+            business_no, logo_url) unless named in fields
     
     Returns:
         Dictionary with total count and list of companies
     """
+    if fetch_all:
+        return await collect_all(
+            lambda p: find_strong_company(
+                company_type_codes, company_name, p, page_size, sort_field, sort_order,
+                fields=fields, compact=compact,
+            ),
+            page_size,
+            max_items,
+        )
+
     params = {
         "startPage": page,
         "display": page_size,
@@ -57,46 +111,58 @@ async def find_strong_company(
     total = int(safe_get(root, "total", default="0"))
     company_list = ensure_list(safe_get(root, "dhsOpenEmpHireInfo", default=[]))
     
-    items = []
-    for co in company_list:
-        item = {
-            "company_id": safe_get(co, "empCoNo", default=""),
-            "company_name": safe_get(co, "coNm", default=""),
-            "company_type": safe_get(co, "coClcdNm", default=None),
-            "business_no": safe_get(co, "busino", default=None),
-            "summary": safe_get(co, "coIntroSummaryCont", default=None),
-            "description": safe_get(co, "coIntroCont", default=None),
-            "homepage": safe_get(co, "homepg", default=None),
-            "main_business": safe_get(co, "mainBusiCont", default=None),
-            "logo_url": safe_get(co, "regLogImgNm", default=None),
-            "latitude": _parse_float(safe_get(co, "mapCoorY")),
-            "longitude": _parse_float(safe_get(co, "mapCoorX")),
-        }
-        items.append(item)
-    
+    map_item = projected(_map_company_item, fields, compact)
+    with observe_phase("callOpenApiSvcInfo210L31", "map"):
+        items = [map_item(co) for co in company_list]
+
     return {
         "total": total,
         "page": page,
         "page_size": page_size,
         "items": items,
+        **stale_info(data),
     }
 
 
-def _parse_int(value) -> int | None:
-    """Parse integer from string, return None if not possible."""
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        return None
+async def find_nearby_company(
+    latitude: float,
+    longitude: float,
+    radius_km: float | None = None,
+    limit: int = 10,
+    company_type_codes: list[str] | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    """
+    Find strong/hiring companies near a location from the local spatial index.
 
+    Args:
+        latitude: Latitude of the search center (WGS84)
+        longitude: Longitude of the search center (WGS84)
+        radius_km: Search radius in km; when omitted the nearest
+            `limit` companies are returned regardless of distance
+        limit: Maximum number of companies to return
+        company_type_codes: Only companies of these type codes
+            ('10', '20', '40'; same codes as find_strong_company)
+        fields: Only return these item fields (same names as
+            find_strong_company, plus distance_km)
+        compact: Omit empty values and long/secondary fields
 
-def _parse_float(value) -> float | None:
-    """Parse float from string, return None if not possible."""
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
+    Returns:
+        Dictionary with companies ordered by distance (distance_km)
+    """
+    # 위치 색인은 WORK24_COMPANY_INDEX=true일 때 백그라운드에서 구축됨
+    items = company_index.search(
+        latitude,
+        longitude,
+        radius_km=radius_km,
+        limit=limit,
+        company_type_codes=company_type_codes,
+    )
+    pick = projected(_pick_nearby_company, fields, compact)
+    return {
+        "total": len(items),
+        "items": [pick(item) for item in items],
+        "index_ready": company_index.ready,
+        "synced_at": iso_timestamp(company_index.synced_at),
+    }
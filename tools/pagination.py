@@ -0,0 +1,124 @@
+"""
+Auto Pagination (전체 페이지 조회)
+1페이지의 total로 남은 페이지를 계산하고 동시에 선조회하면서 순서대로 항목을 전달
+"""
+
+import asyncio
+import math
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from utils.config import env_int
+
+PageFetcher = Callable[[int], Awaitable[dict[str, Any]]]
+
+# 고용24 목록 API의 페이지당 최대 건수
+MAX_PAGE_SIZE = 100
+
+
+def _check_page_size(page_size: int) -> None:
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}")
+
+
+def _page_count(total: int, page_size: int, max_items: int | None) -> int:
+    wanted = total if max_items is None else min(total, max_items)
+    return max(math.ceil(wanted / page_size), 1)
+
+
+async def iter_items(
+    fetch_page: PageFetcher,
+    page_size: int,
+    max_items: int | None = None,
+    concurrency: int | None = None,
+    first_page: dict[str, Any] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield items of every page in order, fetching pages ahead concurrently.
+
+    Page 1 is fetched first to learn `total`; pages 2..N are then requested
+    with at most `concurrency` pages in flight while items are yielded in
+    page order. Stops after max_items items or at the first empty page.
+    Closing the generator early cancels the prefetched pages.
+
+    Args:
+        fetch_page: Coroutine function returning one page dict with
+            'total' and 'items' (e.g. a find_* tool bound to its filters)
+        page_size: Page size used for every page
+        max_items: Stop after this many items
+        concurrency: Pages in flight at once (WORK24_FETCH_ALL_CONCURRENCY)
+        first_page: Already fetched page 1, if the caller has it
+
+    Raises:
+        ValueError: page_size is outside 1..100
+    """
+    _check_page_size(page_size)
+    if concurrency is None:
+        concurrency = env_int("WORK24_FETCH_ALL_CONCURRENCY", 4)
+    concurrency = max(concurrency, 1)
+
+    first = first_page if first_page is not None else await fetch_page(1)
+    last_page = _page_count(int(first.get("total") or 0), page_size, max_items)
+    remaining = max_items
+
+    pending: dict[int, asyncio.Task] = {}
+    next_page = 2
+    try:
+        page_no, page = 1, first
+        while True:
+            # 순서를 유지하며 앞쪽 페이지를 최대 concurrency개까지 미리 요청
+            while next_page <= last_page and len(pending) < concurrency:
+                pending[next_page] = asyncio.ensure_future(fetch_page(next_page))
+                next_page += 1
+
+            items = page.get("items", [])
+            for item in items:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+
+            page_no += 1
+            if not items or page_no > last_page:
+                return
+            page = await pending.pop(page_no)
+    finally:
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+
+async def collect_all(
+    fetch_page: PageFetcher,
+    page_size: int,
+    max_items: int | None = None,
+    concurrency: int | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch every page (up to max_items items) into one list-tool response.
+
+    max_items defaults to and is capped at WORK24_FETCH_ALL_MAX_ITEMS (1000),
+    so one tool call cannot crawl a whole upstream result set. The response
+    keeps page 1's metadata (total, source, ...) and adds 'truncated' when
+    more items exist upstream than were returned. Raises ValueError when
+    page_size is outside 1..100.
+    """
+    _check_page_size(page_size)
+    limit = env_int("WORK24_FETCH_ALL_MAX_ITEMS", 1000)
+    max_items = limit if max_items is None else min(max_items, limit)
+
+    first = await fetch_page(1)
+    items = [
+        item async for item in iter_items(
+            fetch_page, page_size, max_items, concurrency, first_page=first,
+        )
+    ]
+    total = int(first.get("total") or 0)
+    return {
+        **first,
+        "page": 1,
+        "page_size": page_size,
+        "items": items,
+        "truncated": len(items) < total,
+    }
@@ -4,7 +4,50 @@ Work24 공채속보 검색 및 상세 조회 도구
 API: callOpenApiSvcInfo210L21
 """
 
-from utils.http_client import call_work24_api, safe_get, ensure_list, ApiType
+import asyncio
+from typing import Any
+
+from models.recruit import RecruitDetailResponse, RecruitItem
+from stores.recruit_mirror import recruit_mirror
+from stores.sync import iso_timestamp
+from tools.pagination import collect_all
+from utils.http_client import call_work24_api, safe_get, ensure_list, stale_info, upstream_headroom, ApiType
+from utils.mapping import Field, compile_mapper, compile_picker, format_date, projected, wants
+from utils.metrics import observe_phase
+from utils.prefetch import prefetcher
+
+
+# 공채속보 목록 항목 매핑 (210L21, callTp=L)
+RECRUIT_LIST_FIELDS = (
+    Field("emp_seqno", "empSeqno", default=""),
+    Field("company", "empBusiNm", default=""),
+    Field("title", "empWantedTitle", default=""),
+    Field("company_type", "coClcdNm"),
+    Field("employment_type", "empWantedTypeNm"),
+    Field("start_date", "empWantedStdt", convert=format_date),
+    Field("end_date", "empWantedEndt", convert=format_date),
+    Field("logo_url", "regLogImgNm", verbose=True),
+    Field("detail_url", "empWantedHomepgDetail"),
+    Field("mobile_url", "empWantedMobileUrl", verbose=True),
+)
+
+# 공채속보 상세 매핑 (210L21, callTp=D)
+RECRUIT_DETAIL_FIELDS = (
+    Field("company", "empBusiNm", default=""),
+    Field("title", "empWantedTitle", default=""),
+    Field("company_type", "coClcdNm"),
+    Field("employment_type", "empWantedTypeNm"),
+    Field("start_date", "empWantedStdt", convert=format_date),
+    Field("end_date", "empWantedEndt", convert=format_date),
+    Field("detail_url", "empWantedHomepgDetail"),
+    Field("mobile_url", "empWantedMobileUrl", verbose=True),
+)
+
+# 출력 필드는 models/의 스키마와 import 시점에 한 번 대조
+_map_recruit_item = compile_mapper(RECRUIT_LIST_FIELDS, "map_recruit_item", model=RecruitItem)
+_map_recruit_detail = compile_mapper(RECRUIT_DETAIL_FIELDS, "map_recruit_detail", model=RecruitDetailResponse)
+# 미러에 저장된(이미 매핑된) 항목 projection용
+_pick_recruit_item = compile_picker(RECRUIT_LIST_FIELDS, "pick_recruit_item")
 
 
 async def find_recruit_notice(
@@ -17,6 +60,12 @@ async def find_recruit_notice(
     max_salary: int | None = None,
     education_code: str | None = None,
     career_type: str | None = None,
+    source: str = "live",
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+    prefetch: bool = False,
 ) -> dict:
     """
     Search job postings from Work24 공채속보 (Open Recruitment News).
@@ -31,10 +80,42 @@ async def find_recruit_notice(
         max_salary: Maximum salary in 10,000 KRW units
         education_code: Education level code
         career_type: 'N'=entry level, 'E'=experienced, 'Z'=no preference
+        source: 'live' (upstream 210L21) or 'mirror' (local synced copy).
+            The mirror answers unfiltered listings only; filtered queries and
+            a never-synced mirror fall back to the live API.
+        fetch_all: Fetch every page from page 1 (page is ignored) and return
+            all items in one response, prefetching pages concurrently
+        max_items: With fetch_all, stop after this many items
+            (default and maximum WORK24_FETCH_ALL_MAX_ITEMS)
+        fields: Only return these item fields (e.g. ['emp_seqno', 'title'])
+        compact: Omit empty values and long/secondary fields (logo_url,
+            mobile_url) unless named in fields
+        prefetch: After a live page, warm the cache in the background with
+            the next page and the first postings' details
+            (WORK24_PREFETCH_ENABLED)
     
     Returns:
         Dictionary with total count and list of job postings
+        (mirror mode adds 'source' and 'synced_at')
     """
+    if fetch_all:
+        return await collect_all(
+            lambda p: find_recruit_notice(
+                p, page_size, region, occupation_codes, salary_type,
+                min_salary, max_salary, education_code, career_type, source,
+                fields=fields, compact=compact,
+            ),
+            page_size,
+            max_items,
+        )
+
+    if source == "mirror":
+        filters = (region, occupation_codes, salary_type, min_salary, max_salary, education_code, career_type)
+        if not any(filters):
+            mirrored = await _find_in_mirror(page, page_size, fields, compact)
+            if mirrored is not None:
+                return mirrored
+
     params = {
         "callTp": "L",
         "startPage": page,
@@ -68,36 +149,98 @@ async def find_recruit_notice(
     total = int(safe_get(root, "total", default="0"))
     emp_list = ensure_list(safe_get(root, "dhsOpenEmpInfo", default=[]))
     
-    items = []
-    for emp in emp_list:
-        item = {
-            "emp_seqno": safe_get(emp, "empSeqno", default=""),
-            "company": safe_get(emp, "empBusiNm", default=""),
-            "title": safe_get(emp, "empWantedTitle", default=""),
-            "company_type": safe_get(emp, "coClcdNm", default=None),
-            "employment_type": safe_get(emp, "empWantedTypeNm", default=None),
-            "start_date": _format_date(safe_get(emp, "empWantedStdt")),
-            "end_date": _format_date(safe_get(emp, "empWantedEndt")),
-            "logo_url": safe_get(emp, "regLogImgNm", default=None),
-            "detail_url": safe_get(emp, "empWantedHomepgDetail", default=None),
-            "mobile_url": safe_get(emp, "empWantedMobileUrl", default=None),
+    # projection은 매핑 단계에서 (요청 필드만 추출하는 매퍼 변형 사용)
+    map_item = projected(_map_recruit_item, fields, compact)
+    with observe_phase("callOpenApiSvcInfo210L21", "map"):
+        items = [map_item(emp) for emp in emp_list]
+
+    if prefetch and prefetcher.enabled:
+        filters = {
+            "region": region, "occupation_codes": occupation_codes, "salary_type": salary_type,
+            "min_salary": min_salary, "max_salary": max_salary,
+            "education_code": education_code, "career_type": career_type,
         }
-        items.append(item)
-    
-    return {
+        _prefetch_followups(page, page_size, total, filters, emp_list)
+
+    result = {
         "total": total,
         "page": page,
         "page_size": page_size,
         "items": items,
+        **stale_info(data),
+    }
+    if source == "mirror":
+        result["source"] = "live"
+    return result
+
+
+def _prefetch_followups(
+    page: int,
+    page_size: int,
+    total: int,
+    filters: dict[str, Any],
+    emp_list: list[dict],
+) -> None:
+    """Schedule the next page and the first details of a live listing."""
+    def ready() -> bool:
+        return upstream_headroom(ApiType.RECRUIT, prefetcher.reserve_tokens())
+
+    if page * page_size < total:
+        prefetcher.schedule(
+            f"210L21:list:{page + 1}:{page_size}:{filters!r}",
+            lambda: find_recruit_notice(page + 1, page_size, **filters),
+            ready,
+        )
+    for emp in emp_list[:prefetcher.detail_count()]:
+        emp_seqno = emp.get("empSeqno")
+        if emp_seqno:
+            prefetcher.schedule(
+                f"210L21:detail:{emp_seqno}",
+                lambda emp_seqno=emp_seqno: get_recruit_detail(emp_seqno),
+                ready,
+            )
+
+
+async def _find_in_mirror(
+    page: int,
+    page_size: int,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict | None:
+    """Answer a listing from the local mirror, or None if it was never synced."""
+    # SQLite 조회는 이벤트 루프 밖(스레드)에서 실행
+    state = await asyncio.to_thread(recruit_mirror.load_state)
+    synced_at = state["last_completed_at"] or state["last_page_at"]
+    if synced_at is None:
+        return None
+    result = await asyncio.to_thread(recruit_mirror.query, page, page_size)
+    pick = projected(_pick_recruit_item, fields, compact)
+    return {
+        "total": result["total"],
+        "page": page,
+        "page_size": page_size,
+        "items": [pick(item) for item in result["items"]],
+        "source": "mirror",
+        "synced_at": iso_timestamp(synced_at),
+        "sync_in_progress": state["next_page"] is not None,
     }
 
 
-async def get_recruit_detail(emp_seqno: str) -> dict:
+async def get_recruit_detail(
+    emp_seqno: str,
+    fields: list[str] | None = None,
+    compact: bool = False,
+    include_raw: bool = False,
+) -> dict:
     """
     Get detailed information for a specific job posting from 공채속보.
     
     Args:
         emp_seqno: Unique job posting ID from find_recruit_notice results
+        fields: Only return these fields (e.g. ['title', 'end_date'])
+        compact: Omit empty values and secondary fields (mobile_url)
+            unless named in fields
+        include_raw: Also return the unmapped upstream record as raw_data
     
     Returns:
         Detailed job posting information
@@ -122,33 +265,11 @@ async def get_recruit_detail(emp_seqno: str) -> dict:
     if isinstance(emp, list) and len(emp) > 0:
         emp = emp[0]
     
-    return {
-        "emp_seqno": emp_seqno,
-        "company": safe_get(emp, "empBusiNm", default=""),
-        "title": safe_get(emp, "empWantedTitle", default=""),
-        "company_type": safe_get(emp, "coClcdNm", default=None),
-        "employment_type": safe_get(emp, "empWantedTypeNm", default=None),
-        "start_date": _format_date(safe_get(emp, "empWantedStdt")),
-        "end_date": _format_date(safe_get(emp, "empWantedEndt")),
-        "detail_url": safe_get(emp, "empWantedHomepgDetail", default=None),
-        "mobile_url": safe_get(emp, "empWantedMobileUrl", default=None),
-        # 상세 필드들 (API 문서 확인 후 추가 가능)
-        "raw_data": emp,  # 디버깅용
-    }
-
-
-def _format_date(date_str: str | None) -> str | None:
-    """Format date string from YYYYMMDD to YYYY-MM-DD."""
-    if not date_str or len(date_str) != 8:
-        return date_str
-    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-
-
-def _parse_int(value) -> int | None:
-    """Parse integer from string, return None if not possible."""
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        return None
+    with observe_phase("callOpenApiSvcInfo210L21", "map"):
+        detail = {"emp_seqno": emp_seqno} if wants(fields, "emp_seqno") else {}
+        detail.update(projected(_map_recruit_detail, fields, compact)(emp))
+        # 원본 레코드는 요청 시에만 (응답 크기/직렬화 비용)
+        if include_raw:
+            detail["raw_data"] = emp
+        detail.update(stale_info(data))
+    return detail
@@ -0,0 +1,201 @@
+"""
+Career Snapshot (통합 조회) MCP Tool
+사용자 프로필 하나로 청년 프로그램/채용/훈련/기업 네 축을 동시에 조회하고
+지연 예산(timeout) 안에 끝난 축의 결과만 모아서 반환
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, timedelta
+from typing import Any, Awaitable
+
+from stores.company_index import company_index
+from tools.company_tools import find_nearby_company, find_strong_company
+from tools.recruit_tools import find_recruit_notice
+from tools.training_tools import find_training_course
+from tools.youth_program_tools import match_youth_programs
+from utils.config import env_float
+from utils.deadline import remaining
+from utils.http_client import error_info
+from utils.regions import recruit_region_code, training_area_code
+
+logger = logging.getLogger("work24_snapshot")
+
+AXES = ("youth", "recruit", "training", "company")
+
+# 훈련 축 기본 조회 기간 (오늘부터 개강 예정 과정)
+_TRAINING_WINDOW_DAYS = 60
+
+
+async def _run_axis(axis: str, job: Awaitable[dict]) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        result = await job
+    except Exception as e:
+        logger.warning("Snapshot %s axis failed: %s", axis, e)
+        return {"status": "error", "elapsed_ms": _elapsed_ms(started), "error": error_info(e)}
+    return {"status": "ok", "elapsed_ms": _elapsed_ms(started), "result": result}
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def career_snapshot(
+    age: int,
+    employment_status: str,
+    education_status: str | None = None,
+    region: str | None = None,
+    occupation_codes: list[str] | None = None,
+    ncs1: str | None = None,
+    keyword: str | None = None,
+    preferences: list[str] | None = None,
+    company_type_codes: list[str] | None = None,
+    latitude: float | None = None,
+    longitude: float | None = None,
+    axes: list[str] | None = None,
+    page_size: int = 5,
+    timeout: float | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    """
+    Look up youth programs, job postings, training courses and companies
+    for one user profile concurrently, in a single call.
+
+    Args:
+        age: User's age (15-50)
+        employment_status: '구직자', '재직자', '창업자', '학생'
+            (same as match_youth_programs)
+        education_status: '재학', '휴학', '졸업', '중퇴'
+        region: Region name (e.g. '서울', '경기'); filters youth programs and
+            is converted to each API's region code for postings (210L21
+            region) and training (310L01 srchTraArea1)
+        occupation_codes: Occupation codes for job postings (e.g. ['023100'])
+        ncs1: NCS major category code for training (e.g. '20' for IT)
+        keyword: Training course name keyword
+        preferences: Youth program categories (same as match_youth_programs)
+        company_type_codes: Company type codes ('10', '20', '40')
+        latitude: With longitude, list companies near this location from the
+            local spatial index (when it is ready) instead of by type only
+        longitude: See latitude
+        axes: Axes to query - 'youth', 'recruit', 'training', 'company'
+            (default: all)
+        page_size: Items per axis (max 100)
+        timeout: Latency budget in seconds for the whole call
+            (default WORK24_SNAPSHOT_TIMEOUT, 5s)
+        fields: Only return these fields in each axis' items; names are
+            matched per axis (same names as the underlying tools), so names
+            from several tools can be mixed
+        compact: Omit empty values and long/secondary fields in every axis
+
+    Returns:
+        Dictionary with one entry per axis under 'axes', each with status
+        ('ok', 'error' or 'timeout'), elapsed_ms and result or error.
+        Axes that miss the budget are reported as 'timeout' and the others
+        are returned as they are; 'complete' is True when every axis is ok.
+    """
+    selected = list(axes) if axes else list(AXES)
+    unknown = [axis for axis in selected if axis not in AXES]
+    if unknown:
+        raise ValueError(f"Unknown axes: {unknown} (choose from {list(AXES)})")
+    budget = timeout if timeout and timeout > 0 else env_float("WORK24_SNAPSHOT_TIMEOUT", 5.0)
+    # 도구 호출 마감 시간(WORK24_TOOL_TIMEOUT)보다 길게 기다리지 않음
+    left = remaining()
+    if left is not None:
+        budget = max(min(budget, left), 0.0)
+    page_size = max(1, min(page_size, 100))
+
+    # 청년 프로그램은 지역명, 채용/훈련 API는 각 API의 지역 코드로 변환
+    recruit_region = recruit_region_code(region)
+    training_area = training_area_code(region)
+
+    jobs: dict[str, Awaitable[dict]] = {}
+    if "youth" in selected:
+        jobs["youth"] = match_youth_programs(
+            age=age,
+            employment_status=employment_status,
+            education_status=education_status,
+            preferences=preferences,
+            region=region,
+            fields=fields,
+            compact=compact,
+        )
+    if "recruit" in selected:
+        jobs["recruit"] = find_recruit_notice(
+            page_size=page_size,
+            region=recruit_region,
+            occupation_codes=occupation_codes,
+            source="mirror",
+            fields=fields,
+            compact=compact,
+            prefetch=True,
+        )
+    if "training" in selected:
+        today = date.today()
+        jobs["training"] = find_training_course(
+            start_date=today.strftime("%Y%m%d"),
+            end_date=(today + timedelta(days=_TRAINING_WINDOW_DAYS)).strftime("%Y%m%d"),
+            page_size=page_size,
+            area1=training_area,
+            ncs1=ncs1,
+            keyword=keyword,
+            source="catalog",
+            fields=fields,
+            compact=compact,
+            prefetch=True,
+        )
+    if "company" in selected:
+        if latitude is not None and longitude is not None and company_index.ready:
+            jobs["company"] = find_nearby_company(
+                latitude,
+                longitude,
+                limit=page_size,
+                company_type_codes=company_type_codes,
+                fields=fields,
+                compact=compact,
+            )
+        else:
+            jobs["company"] = find_strong_company(
+                company_type_codes=company_type_codes,
+                page_size=page_size,
+                fields=fields,
+                compact=compact,
+            )
+
+    started = time.perf_counter()
+    tasks = {
+        axis: asyncio.create_task(_run_axis(axis, job), name=f"snapshot:{axis}")
+        for axis, job in jobs.items()
+    }
+    try:
+        await asyncio.wait(tasks.values(), timeout=budget)
+    finally:
+        # 예산 초과/호출 취소 시 남은 축은 모두 취소: 업스트림 호출은 single-flight로
+        # 같은 요청을 기다리는 다른 호출자가 있을 때만 계속되고 없으면 중단됨
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    results: dict[str, dict[str, Any]] = {}
+    for axis, task in tasks.items():
+        if task.cancelled():
+            logger.warning("Snapshot %s axis missed the %.1fs budget", axis, budget)
+            results[axis] = {"status": "timeout", "elapsed_ms": round(budget * 1000, 1)}
+        else:
+            results[axis] = task.result()
+    return {
+        "profile": {
+            "age": age,
+            "employment_status": employment_status,
+            "region": region,
+            "region_codes": {"recruit": recruit_region, "training": training_area},
+        },
+        "timeout": budget,
+        "elapsed_ms": _elapsed_ms(started),
+        "complete": all(r["status"] == "ok" for r in results.values()),
+        "axes": results,
+    }
@@ -3,7 +3,70 @@ Training Course (훈련과정) MCP Tools
 내일배움카드 훈련과정 검색 및 상세 조회 도구
 """
 
-from utils.http_client import call_work24_api, safe_get, ensure_list, WORK24_HR_BASE, ApiType
+from typing import Any
+
+from models.training import TrainingDetailResponse, TrainingItem
+from stores.sync import iso_timestamp
+from stores.training_catalog import date_key, training_catalog
+from tools.pagination import collect_all
+from utils.http_client import (
+    call_work24_api, safe_get, ensure_list, stale_info, upstream_headroom, WORK24_HR_BASE, ApiType,
+)
+from utils.mapping import Field, compile_mapper, compile_picker, compile_record, parse_int, projected, wants
+from utils.metrics import observe_phase
+from utils.prefetch import prefetcher
+
+
+def _is_k_digital(course_type) -> bool:
+    """K-Digital Training 여부 (훈련유형 코드 C0061*)."""
+    return "C0061" in str(course_type) if course_type else False
+
+
+# 훈련과정 목록 항목 매핑 (310L01)
+TRAINING_LIST_FIELDS = (
+    Field("course_id", "trprId", default=""),
+    Field("course_round", "trprDegr", default="1"),
+    Field("title", "title", default=""),
+    Field("provider_name", "subTitle", default=""),
+    Field("address", "address"),
+    Field("phone", "telNo", verbose=True),
+    Field("start_date", "traStartDate"),  # 이미 포맷됨
+    Field("end_date", "traEndDate"),
+    Field("ncs_code", "ncsCd"),
+    Field("tuition", "courseMan", convert=parse_int),
+    Field("support_amount", "realMan", convert=parse_int),
+    Field("employment_rate_3m", "eiEmplRate3"),
+    Field("satisfaction_score", "stdgScor"),
+    Field("org_id", "trainstCstId"),
+    Field("train_target", "trainTarget"),
+    Field("title_link", "titleLink", verbose=True),
+    Field("course_type", "trainTargetCd"),
+)
+
+# 훈련과정 상세 매핑 (310L02, HRDNet 하위 inst_base_info / inst_detail_info)
+TRAINING_DETAIL_FIELDS = (
+    Field("course_name", ("inst_base_info", "trprNm"), default=""),
+    Field("org_name", ("inst_base_info", "inoNm"), default=""),
+    Field("org_homepage", ("inst_base_info", "hpAddr"), verbose=True),
+    Field("org_address", ("inst_base_info", "addr")),
+    Field("org_tel", ("inst_base_info", "telNo"), verbose=True),
+    Field("ncs_code", ("inst_base_info", "ncsCd")),
+    Field("ncs_name", ("inst_base_info", "ncsNm")),
+    Field("total_days", ("inst_detail_info", "trDcnt"), convert=parse_int),
+    Field("total_hours", ("inst_detail_info", "trtm"), convert=parse_int),
+    Field("tuition", ("inst_detail_info", "courseMan"), convert=parse_int),
+    Field("support_amount", ("inst_detail_info", "realMan"), convert=parse_int),
+    Field("target", ("inst_detail_info", "trgtCat")),
+    Field("is_k_digital", ("inst_base_info", "crseTracseSe"), default="", convert=_is_k_digital),
+    Field("curriculum", ("inst_detail_info", "trainGoal"), verbose=True),
+)
+
+# 출력 필드는 models/의 스키마와 import 시점에 한 번 대조
+_map_training_item = compile_mapper(TRAINING_LIST_FIELDS, "map_training_item", model=TrainingItem)
+_map_training_detail = compile_mapper(TRAINING_DETAIL_FIELDS, "map_training_detail", model=TrainingDetailResponse)
+# 로컬 카탈로그 보관용 레코드 / 카탈로그 항목 projection용
+TrainingRecord = compile_record(TRAINING_LIST_FIELDS, "TrainingRecord")
+_pick_training_item = compile_picker(TRAINING_LIST_FIELDS, "pick_training_item")
 
 
 async def find_training_course(
@@ -18,6 +81,12 @@ async def find_training_course(
     course_type: str | None = None,
     keyword: str | None = None,
     provider_name: str | None = None,
+    source: str = "live",
+    fetch_all: bool = False,
+    max_items: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+    prefetch: bool = False,
 ) -> dict:
     """
     Search training courses (내일배움카드, K-Digital Training, etc.).
@@ -34,10 +103,46 @@ async def find_training_course(
         course_type: Training type code (e.g., 'C0061S' for K-Digital Training)
         keyword: Course name keyword search
         provider_name: Training provider name search
+        source: 'live' (upstream 310L01) or 'catalog' (local synced catalog).
+            Like the live API, the catalog returns rounds whose training start
+            date is in [start_date, end_date]; it falls back to the live API for
+            area2/ncs2 filters or start dates outside the synced range.
+        fetch_all: Fetch every page from page 1 (page is ignored) and return
+            all items in one response, prefetching pages concurrently
+        max_items: With fetch_all, stop after this many items
+            (default and maximum WORK24_FETCH_ALL_MAX_ITEMS)
+        fields: Only return these item fields (e.g. ['course_id', 'title'])
+        compact: Omit empty values and secondary fields (phone, title_link)
+            unless named in fields
+        prefetch: After a live page, warm the cache in the background with
+            the next page and the first courses' details
+            (WORK24_PREFETCH_ENABLED)
     
     Returns:
         Dictionary with total count and list of training courses with employment rates
+        (catalog mode adds 'source' and 'synced_at')
     """
+    if fetch_all:
+        return await collect_all(
+            lambda p: find_training_course(
+                start_date, end_date, p, page_size, area1, area2, ncs1, ncs2,
+                course_type, keyword, provider_name, source,
+                fields=fields, compact=compact,
+            ),
+            page_size,
+            max_items,
+        )
+
+    if source == "catalog" and not (area2 or ncs2):
+        local = _find_in_catalog(
+            start_date, end_date, page, page_size,
+            area1=area1, ncs1=ncs1, course_type=course_type,
+            keyword=keyword, provider_name=provider_name,
+            fields=fields, compact=compact,
+        )
+        if local is not None:
+            return local
+
     params = {
         "outType": "1",  # List type
         "pageNum": page,
@@ -75,33 +180,86 @@ async def find_training_course(
     srch_list = safe_get(root, "srchList", default={})
     course_list = ensure_list(safe_get(srch_list, "scn_list", default=[]))
     
-    items = []
-    for c in course_list:
-        item = {
-            "course_id": safe_get(c, "trprId", default=""),
-            "course_round": safe_get(c, "trprDegr", default="1"),
-            "title": safe_get(c, "title", default=""),  # 실제 필드명 수정
-            "provider_name": safe_get(c, "subTitle", default=""),  # 실제 필드명
-            "address": safe_get(c, "address", default=None),
-            "phone": safe_get(c, "telNo", default=None),
-            "start_date": safe_get(c, "traStartDate", default=None),  # 이미 포맷됨
-            "end_date": safe_get(c, "traEndDate", default=None),
-            "ncs_code": safe_get(c, "ncsCd", default=None),
-            "tuition": _parse_int(safe_get(c, "courseMan")),
-            "support_amount": _parse_int(safe_get(c, "realMan")),
-            "employment_rate_3m": safe_get(c, "eiEmplRate3", default=None),
-            "satisfaction_score": safe_get(c, "stdgScor", default=None),
-            "org_id": safe_get(c, "trainstCstId", default=None),
-            "train_target": safe_get(c, "trainTarget", default=None),
-            "title_link": safe_get(c, "titleLink", default=None),
+    map_item = projected(_map_training_item, fields, compact)
+    with observe_phase("callOpenApiSvcInfo310L01", "map"):
+        items = [map_item(c) for c in course_list]
+
+    if prefetch and prefetcher.enabled:
+        filters = {
+            "area1": area1, "area2": area2, "ncs1": ncs1, "ncs2": ncs2, "course_type": course_type,
+            "keyword": keyword, "provider_name": provider_name,
         }
-        items.append(item)
-    
-    return {
+        _prefetch_followups(start_date, end_date, page, page_size, total, filters, course_list)
+
+    result = {
         "total": total,
         "page": page,
         "page_size": page_size,
         "items": items,
+        **stale_info(data),
+    }
+    if source == "catalog":
+        result["source"] = "live"
+    return result
+
+
+def _prefetch_followups(
+    start_date: str,
+    end_date: str,
+    page: int,
+    page_size: int,
+    total: int,
+    filters: dict[str, Any],
+    course_list: list[dict],
+) -> None:
+    """Schedule the next page and the first course details of a live search."""
+    def ready() -> bool:
+        return upstream_headroom(ApiType.TRAINING, prefetcher.reserve_tokens())
+
+    if page * page_size < total:
+        prefetcher.schedule(
+            f"310L01:list:{start_date}:{end_date}:{page + 1}:{page_size}:{filters!r}",
+            lambda: find_training_course(start_date, end_date, page + 1, page_size, **filters),
+            ready,
+        )
+    for course in course_list[:prefetcher.detail_count()]:
+        # 상세 조회 키는 목록 항목의 course_id / course_round / org_id 그대로
+        key = {
+            "course_id": course.get("trprId"),
+            "course_round": course.get("trprDegr") or "1",
+            "org_id": course.get("trainstCstId") or "",
+        }
+        if key["course_id"]:
+            prefetcher.schedule(
+                f"310L02:detail:{key['course_id']}:{key['course_round']}:{key['org_id']}",
+                lambda key=key: get_training_course_detail(**key),
+                ready,
+            )
+
+
+def _find_in_catalog(
+    start_date: str,
+    end_date: str,
+    page: int,
+    page_size: int,
+    fields: list[str] | None = None,
+    compact: bool = False,
+    **filters,
+) -> dict | None:
+    """Answer a search from the local catalog, or None if the window is not covered."""
+    lo, hi = date_key(start_date), date_key(end_date)
+    if lo is None or hi is None or not training_catalog.covers(lo, hi):
+        return None
+    matched = training_catalog.search(start_date, end_date, **filters)
+    offset = (page - 1) * page_size
+    pick = projected(_pick_training_item, fields, compact)
+    return {
+        "total": len(matched),
+        "page": page,
+        "page_size": page_size,
+        "items": [pick(item) for item in matched[offset:offset + page_size]],
+        "source": "catalog",
+        "synced_at": iso_timestamp(training_catalog.synced_at),
     }
 
 
@@ -109,6 +267,8 @@ async def get_training_course_detail(
     course_id: str,
     course_round: str = "1",
     org_id: str = "",
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
     """
     Get detailed information for a specific training course.
@@ -117,6 +277,9 @@ async def get_training_course_detail(
         course_id: Course ID (TRPR_ID) from find_training_course results
         course_round: Course round number
         org_id: Training organization ID
+        fields: Only return these fields (e.g. ['course_name', 'tuition'])
+        compact: Omit empty values and long/secondary fields (curriculum,
+            org_homepage, org_tel) unless named in fields
     
     Returns:
         Detailed course information including curriculum and organization details
@@ -136,45 +299,13 @@ async def get_training_course_detail(
     )
     
     root = safe_get(data, "HRDNet", default={})
-    inst_base = safe_get(root, "inst_base_info", default={})
-    inst_detail = safe_get(root, "inst_detail_info", default={})
-    
-    # Determine if K-Digital
-    course_type = safe_get(inst_base, "crseTracseSe", default="")
-    is_k_digital = "C0061" in str(course_type) if course_type else False
-    
-    return {
-        "course_id": course_id,
-        "course_round": course_round,
-        "course_name": safe_get(inst_base, "trprNm", default=""),
-        "org_name": safe_get(inst_base, "inoNm", default=""),
-        "org_homepage": safe_get(inst_base, "hpAddr", default=None),
-        "org_address": safe_get(inst_base, "addr", default=None),
-        "org_tel": safe_get(inst_base, "telNo", default=None),
-        "ncs_code": safe_get(inst_base, "ncsCd", default=None),
-        "ncs_name": safe_get(inst_base, "ncsNm", default=None),
-        "total_days": _parse_int(safe_get(inst_detail, "trDcnt")),
-        "total_hours": _parse_int(safe_get(inst_detail, "trtm")),
-        "tuition": _parse_int(safe_get(inst_detail, "courseMan")),
-        "support_amount": _parse_int(safe_get(inst_detail, "realMan")),
-        "target": safe_get(inst_detail, "trgtCat", default=None),
-        "is_k_digital": is_k_digital,
-        "curriculum": safe_get(inst_detail, "trainGoal", default=None),
-    }
-
 
-def _format_date(date_str: str | None) -> str | None:
-    """Format date string from YYYYMMDD to YYYY-MM-DD."""
-    if not date_str or len(date_str) != 8:
-        return date_str
-    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-
-
-def _parse_int(value) -> int | None:
-    """Parse integer from string, return None if not possible."""
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        return None
+    with observe_phase("callOpenApiSvcInfo310L02", "map"):
+        detail = {}
+        if wants(fields, "course_id"):
+            detail["course_id"] = course_id
+        if wants(fields, "course_round"):
+            detail["course_round"] = course_round
+        detail.update(projected(_map_training_detail, fields, compact)(root))
+        detail.update(stale_info(data))
+    return detail
@@ -3,34 +3,43 @@ Youth Program (청년 프로그램) MCP Tools
 로컬 JSON 기반 청년 프로그램 목록/매칭 도구
 """
 
-import json
-from pathlib import Path
-from models.youth_program import ProgramCategory
+from models.youth_program import YouthProgram
+from stores.youth_programs import iter_bits, youth_program_catalog
+from utils.mapping import Field, compile_mapper, projected
 
+# 프로그램 출력 필드 (model_dump 결과에서 projection)
+YOUTH_PROGRAM_FIELDS = tuple(
+    Field(name, name, verbose=name in ("description", "apply_channel", "related_api_id"))
+    for name in YouthProgram.model_fields
+)
 
-# Load youth programs data
-_DATA_PATH = Path(__file__).parent.parent / "data" / "youth_programs.json"
+_pick_program = compile_mapper(YOUTH_PROGRAM_FIELDS, "pick_youth_program")
 
 
-def _load_programs() -> list[dict]:
-    """Load youth programs from JSON file."""
-    if not _DATA_PATH.exists():
-        return []
-    with open(_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-async def list_youth_programs() -> dict:
+async def list_youth_programs(
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
     """
     List all available youth support programs.
     
+    Args:
+        fields: Only return these program fields (e.g. ['program_id', 'name'])
+        compact: Omit empty values and long fields (description,
+            apply_channel, related_api_id) unless named in fields
+    
     Returns:
         Dictionary with list of all youth programs with their details
     """
-    programs = _load_programs()
+    snap = youth_program_catalog.snapshot()
+    if fields is None and not compact:
+        items = list(snap.dumped)
+    else:
+        pick = projected(_pick_program, fields, compact)
+        items = [pick(program) for program in snap.dumped]
     return {
-        "total": len(programs),
-        "items": programs,
+        "total": len(snap.programs),
+        "items": items,
     }
 
 
@@ -40,6 +49,8 @@ async def match_youth_programs(
     education_status: str | None = None,
     preferences: list[str] | None = None,
     region: str | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
 ) -> dict:
     """
     Match youth programs based on user profile.
@@ -49,60 +60,62 @@ async def match_youth_programs(
         employment_status: Current status - '구직자', '재직자', '창업자', '학생'
         education_status: Education status - '재학', '휴학', '졸업', '중퇴'
         preferences: Preferred categories - 'employment', 'training', 'allowance', 'startup', 'housing', 'finance'
-        region: Preferred region code
+        region: Region name (e.g. '서울'); regional programs outside it are excluded,
+            nationwide programs (no regions) always match
+        fields: Only return these program fields (e.g. ['program_id', 'name'])
+        compact: Omit empty values, long program fields and match_reasons
     
     Returns:
         Dictionary with matched programs sorted by relevance score
     """
-    programs = _load_programs()
+    snap = youth_program_catalog.snapshot()
+
+    # 나이/취업상태(필수 조건)는 비트셋 교집합으로 후보를 한 번에 추림
+    age_mask = snap.by_age[age] if 0 <= age < len(snap.by_age) else 0
+    candidates = age_mask & (snap.by_employment.get(employment_status, 0) | snap.employment_open)
+    if region:
+        # 지역 지정 시 전국 프로그램 + 해당 지역 프로그램만
+        candidates &= snap.nationwide | snap.by_region.get(region, 0)
+
+    education_mask = (
+        snap.by_education.get(education_status, 0) | snap.education_open
+        if education_status else 0
+    )
+    preference_mask = 0
+    for category in preferences or ():
+        preference_mask |= snap.by_category.get(category, 0)
+
+    # projection 미요청 시 캐시된 model_dump 결과를 그대로 사용
+    pick = projected(_pick_program, fields, compact) if fields is not None or compact else None
     matched = []
-    
-    for prog in programs:
-        score = 0.0
-        reasons = []
-        
-        # Age matching
-        age_min = prog.get("target_age_min", 0)
-        age_max = prog.get("target_age_max", 100)
-        if age_min <= age <= age_max:
+    for i in iter_bits(candidates):
+        prog = snap.programs[i]
+        bit = 1 << i
+        score = 0.3 + 0.25  # 나이 + 취업상태
+        reasons = [
+            f"Age {age} within range {prog.target_age_min}-{prog.target_age_max}",
+            f"Matches employment status: {employment_status}",
+        ]
+        if education_mask & bit:
+            score += 0.15
+            reasons.append(f"Matches education status: {education_status}")
+        if preference_mask & bit:
             score += 0.3
-            reasons.append(f"Age {age} within range {age_min}-{age_max}")
-        else:
-            continue  # Skip if age doesn't match
-        
-        # Employment status matching
-        target_status = prog.get("target_employment_status", [])
-        if employment_status in target_status or not target_status:
-            score += 0.25
-            reasons.append(f"Matches employment status: {employment_status}")
-        else:
-            continue  # Skip if status doesn't match
-        
-        # Education status matching (optional)
-        if education_status:
-            target_edu = prog.get("target_education_status", [])
-            if education_status in target_edu or not target_edu:
-                score += 0.15
-                reasons.append(f"Matches education status: {education_status}")
-        
-        # Preference matching
-        if preferences:
-            prog_category = prog.get("category", "")
-            if prog_category in preferences:
-                score += 0.3
-                reasons.append(f"Matches preferred category: {prog_category}")
-        
-        matched.append({
-            "program": prog,
-            "match_score": round(score, 2),
-            "match_reasons": reasons,
-        })
+            reasons.append(f"Matches preferred category: {prog.category.value}")
+        if region and prog.regions:
+            reasons.append(f"Available in region: {region}")
+
+        program = snap.dumped[i] if pick is None else pick(snap.dumped[i])
+        item = {"program": program, "match_score": round(score, 2)}
+        if not compact:
+            item["match_reasons"] = reasons
+        matched.append(item)
     
     # Sort by score descending
     matched.sort(key=lambda x: x["match_score"], reverse=True)
     
     return {
-        "total_programs": len(programs),
+        "total_programs": len(snap.programs),
         "matched_count": len(matched),
         "items": matched[:10],  # Top 10 matches
     }
@@ -0,0 +1,355 @@
+"""
+Work24 Response Cache
+엔드포인트 + 정규화된 파라미터 기준 인메모리 TTL/LRU 캐시
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Iterator
+from urllib.parse import urlencode
+
+from utils.config import env_bool, env_float, env_int
+from utils.endpoints import get_endpoint_spec
+from utils.shared_cache import SharedCache
+
+logger = logging.getLogger("work24_cache")
+
+# 캐시 키에서 제외할 파라미터 (인증키는 캐시 키/로그에 남기지 않음)
+_EXCLUDED_KEY_PARAMS = frozenset({"authKey"})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How call_work24_api uses the response cache in the current context.
+
+    allow_stale: serve an expired copy while refreshing (stale-while-
+        revalidate); background syncs turn this off so that they always
+        store fresh upstream data
+    store: cache upstream responses; background syncs turn this off so
+        that one-off crawl pages do not evict entries that real traffic
+        uses from the memory LRU. With several workers their pages still
+        go to the shared tier (see ResponseCache.peers()), so the workers
+        following one crawl fetch each page upstream only once
+    """
+    allow_stale: bool = True
+    store: bool = True
+
+
+_policy: contextvars.ContextVar[CachePolicy] = contextvars.ContextVar("work24_cache_policy", default=CachePolicy())
+
+
+def cache_policy() -> CachePolicy:
+    """Cache policy of the current context."""
+    return _policy.get()
+
+
+@contextmanager
+def use_cache_policy(**changes: Any) -> Iterator[CachePolicy]:
+    """Override cache policy fields for calls made inside the block."""
+    token = _policy.set(replace(_policy.get(), **changes))
+    try:
+        yield _policy.get()
+    finally:
+        _policy.reset(token)
+
+
+def make_cache_key(endpoint: str, params: dict[str, Any]) -> str:
+    """
+    Build a canonical cache key from endpoint and request params.
+
+    None values and authKey are dropped, keys are sorted and values are
+    stringified so that equivalent requests share a key.
+    """
+    canonical = sorted(
+        (k, str(v))
+        for k, v in params.items()
+        if v is not None and k not in _EXCLUDED_KEY_PARAMS
+    )
+    return f"{endpoint}?{urlencode(canonical)}"
+
+
+def classify_result(endpoint: str, result: Any) -> str:
+    """
+    Classify a parsed response for caching.
+
+    Returns:
+        'ok'          - normal response with items
+        'not_found'   - well-formed response without any item (negative cache)
+        'uncacheable' - unknown shape (e.g. error document), never cached
+    """
+    spec = get_endpoint_spec(endpoint)
+    if spec is None or not isinstance(result, dict):
+        return "uncacheable"
+
+    node: Any = result
+    for depth, key in enumerate(spec.item_path):
+        if not isinstance(node, dict) or key not in node:
+            # 루트 요소가 없으면 에러 응답 등 예상 밖 구조
+            return "uncacheable" if depth == 0 else "not_found"
+        node = node[key]
+    if node is None or node == [] or node == {}:
+        return "not_found"
+    return "ok"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    negative: bool
+    stored_at: float
+    # 만료 후에도 stale 응답으로 제공 가능한 시각
+    stale_until: float
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache with per-entry TTL.
+
+    An entry may also carry a stale window after its TTL: get() treats it
+    as a miss, but get_stale() still returns it until the window ends.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, _Entry] = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a fresh cached value, or default on miss/expiry."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            if entry.stale_until <= now:
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        if entry.negative:
+            self.negative_hits += 1
+        return entry.value
+
+    def get_stale(self, key: str) -> tuple[Any, float] | None:
+        """Return (value, age in seconds) of a fresh or stale entry, or None."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry.stale_until <= now:
+            del self._data[key]
+            self.expirations += 1
+            return None
+        return entry.value, now - entry.stored_at
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        negative: bool = False,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        """Store a value for ttl seconds, evicting least recently used entries."""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        now = time.monotonic()
+        self._data[key] = _Entry(value, now + ttl, negative, now, now + ttl + max(stale_ttl, 0.0))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class ResponseCache:
+    """
+    Work24 response cache with per-endpoint TTL and negative caching.
+
+    Normal responses stay available as stale fallbacks for
+    WORK24_CACHE_STALE_TTL seconds after they expire (see get_stale()).
+    With the disk tier enabled (see persistent_cache_enabled()), every
+    stored response is also written to a SQLite WAL file that is shared
+    by all worker processes and survives restarts; in-memory misses are
+    looked up there and warm() preloads the most used entries. get(),
+    get_stale() and store() are coroutines so that disk-tier work
+    (SQLite, zlib, json) runs in a worker thread, off the event loop.
+    Settings are read on first use so that values from .env apply.
+    """
+
+    def __init__(self):
+        self._cache: TTLCache | None = None
+        self.shared: SharedCache | None = None
+        self.enabled = True
+        self.negative_ttl = 60.0
+        self.stale_ttl = 3600.0
+
+    def _ensure(self) -> TTLCache:
+        if self._cache is None:
+            self.enabled = env_bool("WORK24_CACHE_ENABLED", True)
+            self.negative_ttl = env_float("WORK24_CACHE_NEGATIVE_TTL", 60.0)
+            self.stale_ttl = env_float("WORK24_CACHE_STALE_TTL", 3600.0)
+            if self.enabled and persistent_cache_enabled():
+                self.shared = SharedCache()
+            self._cache = TTLCache(env_int("WORK24_CACHE_MAX_ENTRIES", 1024))
+        return self._cache
+
+    async def get(self, key: str) -> Any:
+        """Return a cached parsed response, or None."""
+        cache = self._ensure()
+        if not self.enabled:
+            return None
+        value = cache.get(key)
+        if self.shared is None:
+            return value
+        if value is None:
+            entry = await asyncio.to_thread(self.shared.get, key)
+            if entry is not None and entry["expires_at"] > time.time():
+                # 다른 워커(또는 재시작 전)가 저장한 항목을 남은 TTL만큼 메모리에 올림
+                # (동기화 수집 페이지는 메모리에 올리지 않음)
+                if cache_policy().store:
+                    self._promote(key, entry)
+                value = entry["value"]
+        if value is not None and self.shared.touch(key):
+            await asyncio.to_thread(self.shared.flush_hits)
+        return value
+
+    async def get_stale(self, key: str) -> tuple[Any, float] | None:
+        """Return (last good response, age in seconds) even if expired, or None."""
+        cache = self._ensure()
+        if not self.enabled:
+            return None
+        stale = cache.get_stale(key)
+        if stale is None and self.shared is not None:
+            entry = await asyncio.to_thread(self.shared.get, key)
+            if entry is not None and not entry["negative"]:
+                stale = entry["value"], time.time() - entry["stored_at"]
+        return stale
+
+    def _promote(self, key: str, entry: dict[str, Any]) -> None:
+        remaining = entry["expires_at"] - time.time()
+        self._ensure().set(
+            key,
+            entry["value"],
+            remaining,
+            negative=entry["negative"],
+            stale_ttl=entry["stale_until"] - entry["expires_at"],
+        )
+
+    def peers(self) -> SharedCache | None:
+        """The disk tier when it is shared with other workers, else None."""
+        self._ensure()
+        return self.shared if shared_cache_enabled() else None
+
+    async def store(self, key: str, endpoint: str, result: Any, ttl: float, memory: bool = True) -> None:
+        """
+        Cache a parsed response according to its classification
+        (memory=False: disk tier only).
+        """
+        cache = self._ensure()
+        if not self.enabled:
+            return
+        kind = classify_result(endpoint, result)
+        if kind == "uncacheable":
+            logger.debug("Not caching unexpected response shape for %s", endpoint)
+            return
+        negative = kind == "not_found"
+        if negative:
+            ttl, stale_ttl = min(ttl, self.negative_ttl), 0.0
+        else:
+            stale_ttl = self.stale_ttl
+        if memory:
+            cache.set(key, result, ttl, negative=negative, stale_ttl=stale_ttl)
+        if self.shared is not None:
+            # 압축/쓰기(주기적 크기 제한 검사 포함)는 스레드에서
+            await asyncio.to_thread(self.shared.set, key, endpoint, result, ttl, negative, stale_ttl)
+
+    def warm(self) -> int:
+        """
+        Load the most used fresh entries of the disk tier into memory
+        (WORK24_PERSISTENT_CACHE_WARM, default 500). Returns the number loaded.
+        """
+        cache = self._ensure()
+        if self.shared is None:
+            return 0
+        limit = min(env_int("WORK24_PERSISTENT_CACHE_WARM", 500), cache.max_entries)
+        self.shared.enforce_limits()
+        entries = self.shared.warm(limit)
+        # 사용 빈도가 높은 항목이 LRU 끝(가장 최근)에 오도록 역순으로 적재
+        for key, entry in reversed(entries):
+            self._promote(key, entry)
+        logger.info("Warmed %d cache entries from %s", len(entries), self.shared.path)
+        return len(entries)
+
+    def close(self) -> None:
+        """Flush pending usage counts of the disk tier (call on shutdown)."""
+        if self.shared is not None:
+            self.shared.close()
+
+    def clear(self) -> None:
+        self._ensure().clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> dict[str, Any]:
+        stats = {"enabled": self.enabled, **self._ensure().stats()}
+        if self.shared is not None:
+            stats["shared"] = self.shared.stats()
+        return stats
+
+
+def shared_cache_enabled() -> bool:
+    """
+    Whether the cross-process SQLite cache tier is on (WORK24_SHARED_CACHE).
+
+    Defaults to on when the server runs with more than one worker
+    (WORK24_WORKERS > 1), since per-worker memory caches alone would
+    multiply upstream calls.
+    """
+    return env_bool("WORK24_SHARED_CACHE", env_int("WORK24_WORKERS", 1) > 1)
+
+
+def persistent_cache_enabled() -> bool:
+    """
+    Whether responses are also kept on disk (WORK24_PERSISTENT_CACHE).
+
+    The shared multi-worker tier is the same SQLite file, so it is always
+    persistent; a single process can opt in to survive restarts warm.
+    """
+    return env_bool("WORK24_PERSISTENT_CACHE", False) or shared_cache_enabled()
+
+
+# 프로세스 전역 응답 캐시
+response_cache = ResponseCache()
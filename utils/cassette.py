@@ -0,0 +1,144 @@
+"""
+Work24 Record/Replay Cassette
+업스트림 원본 응답을 SQLite에 압축 저장(record)하고 네트워크 없이 재생(replay)
+
+    WORK24_CASSETTE_MODE=off|record|replay   (default: off)
+    WORK24_CASSETTE_PATH=data/cassette.db
+    WORK24_CASSETTE_LATENCY=0|recorded|<seconds>   (replay 시 지연 주입)
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from utils.config import env_str
+
+logger = logging.getLogger("work24_cassette")
+
+_DEFAULT_PATH = Path(__file__).parent.parent / "data" / "cassette.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    request_key TEXT PRIMARY KEY,
+    endpoint    TEXT NOT NULL,
+    body        BLOB NOT NULL,
+    elapsed     REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+"""
+
+MODES = ("off", "record", "replay")
+
+
+class Work24CassetteMiss(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+    def __init__(self, request_key: str):
+        super().__init__(f"No recorded response for {request_key} (WORK24_CASSETTE_MODE=replay)")
+        self.request_key = request_key
+
+
+class Cassette:
+    """
+    On-disk store of raw upstream responses keyed by request.
+
+    The key is the normalized request without authKey (the same key as the
+    response cache), so recordings never contain credentials and replay
+    needs no auth key. Bodies are zlib-compressed. Settings are read on
+    first use so that values from .env apply.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self._path = Path(path) if path else None
+        self._mode: str | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+    @property
+    def mode(self) -> str:
+        if self._mode is None:
+            mode = env_str("WORK24_CASSETTE_MODE", "off").lower()
+            if mode not in MODES:
+                logger.warning("Invalid WORK24_CASSETTE_MODE=%r, using 'off'", mode)
+                mode = "off"
+            self._mode = mode
+            if mode != "off":
+                logger.info("Cassette %s mode: %s", mode, self.path)
+        return self._mode
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(env_str("WORK24_CASSETTE_PATH", str(_DEFAULT_PATH)))
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(self, request_key: str, endpoint: str, body: bytes, elapsed: float) -> None:
+        """Save (or overwrite) the raw body of a successful response."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO interactions "
+                    "(request_key, endpoint, body, elapsed, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                    (request_key, endpoint, zlib.compress(body, 6), elapsed, time.time()),
+                )
+        self.recorded += 1
+
+    def load(self, request_key: str) -> tuple[bytes, float]:
+        """Return (raw body, recorded elapsed seconds) or raise Work24CassetteMiss."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body, elapsed FROM interactions WHERE request_key = ?", (request_key,)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            raise Work24CassetteMiss(request_key)
+        self.replayed += 1
+        return zlib.decompress(row[0]), row[1]
+
+    def replay_delay(self, recorded_elapsed: float) -> float:
+        """Latency to inject before serving a replayed response."""
+        setting = env_str("WORK24_CASSETTE_LATENCY", "0").lower()
+        if setting == "recorded":
+            return recorded_elapsed
+        try:
+            return max(float(setting), 0.0)
+        except ValueError:
+            logger.warning("Invalid WORK24_CASSETTE_LATENCY=%r, using 0", setting)
+            return 0.0
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"mode": self.mode}
+        if self.mode != "off":
+            with self._lock:
+                stats["entries"] = self._connect().execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+            stats.update(path=str(self.path), recorded=self.recorded, replayed=self.replayed, misses=self.misses)
+        return stats
+
+
+# 프로세스 전역 카세트
+cassette = Cassette()
@@ -0,0 +1,69 @@
+"""
+Environment configuration helpers
+환경변수 기반 설정값 파싱 (잘못된 값은 경고 후 기본값 사용)
+"""
+
+import os
+import logging
+
+logger = logging.getLogger("work24_config")
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """
+    Load .env into os.environ once.
+
+    Called on the first setting lookup rather than at import time, so
+    importing modules stays cheap and .env still applies to every setting.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logger.debug("dotenv loaded")
+
+
+def env_str(name: str, default: str | None = None) -> str | None:
+    """Read a string environment variable, treating blanks as unset."""
+    load_env()
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip()
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean environment variable ('1', 'true', 'yes', 'on')."""
+    value = env_str(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Invalid integer for %s=%r, using default %s", name, value, default)
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float environment variable."""
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Invalid float for %s=%r, using default %s", name, value, default)
+        return default
@@ -0,0 +1,96 @@
+"""
+Work24 Request Deadline
+도구 호출 단위 마감 시간(deadline)을 contextvar로 전달하고 초과 시 취소
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from utils.config import env_float
+
+logger = logging.getLogger("work24_deadline")
+
+T = TypeVar("T")
+
+# 현재 요청의 마감 시각 (event loop 시계 기준, 없으면 None)
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("work24_deadline", default=None)
+
+
+class Work24DeadlineExceeded(TimeoutError):
+    """Raised when a tool call runs out of its time budget (WORK24_TOOL_TIMEOUT)."""
+
+    def __init__(self, budget: float, where: str = "tool call"):
+        super().__init__(f"{where} exceeded its {budget:.1f}s deadline")
+        self.budget = budget
+        self.where = where
+
+
+def tool_budget() -> float:
+    """Per-call time budget in seconds; 0 disables the deadline."""
+    return env_float("WORK24_TOOL_TIMEOUT", 30.0)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+
+def check_deadline(where: str) -> None:
+    """Raise Work24DeadlineExceeded if the current deadline has already passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise Work24DeadlineExceeded(tool_budget(), where)
+
+
+def detached_context() -> contextvars.Context:
+    """
+    Copy of the current context without a deadline.
+
+    Used for work shared by several callers (single-flight upstream calls),
+    which must not be bounded by whichever caller happened to start it.
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    return context
+
+
+def with_deadline(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Decorator running an MCP tool under the WORK24_TOOL_TIMEOUT budget.
+
+    The deadline is visible to everything the tool awaits (remaining(),
+    check_deadline()), and the tool is cancelled when it passes, which
+    propagates into call_work24_api and abandons upstream calls nobody
+    else is waiting for. Client disconnects cancel the same way.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        budget = tool_budget()
+        if budget <= 0:
+            return await fn(*args, **kwargs)
+        deadline = asyncio.get_running_loop().time() + budget
+        # 중첩 호출 시 바깥 마감 시간이 더 이르면 그대로 유지
+        outer = _deadline.get()
+        if outer is not None:
+            deadline = min(deadline, outer)
+        token = _deadline.set(deadline)
+        try:
+            async with asyncio.timeout_at(deadline) as scope:
+                return await fn(*args, **kwargs)
+        except TimeoutError as e:
+            if scope.expired():
+                logger.warning("%s exceeded its %.1fs deadline", name, budget)
+                raise Work24DeadlineExceeded(budget, name) from e
+            raise
+        finally:
+            _deadline.reset(token)
+
+    return wrapper
@@ -0,0 +1,97 @@
+"""
+Work24 Endpoint Registry
+엔드포인트별 응답 구조(루트/항목 경로)와 캐시 TTL 정의
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from utils.config import env_float
+
+
+@dataclass(frozen=True)
+class EndpointSpec:
+    """Static description of one Work24 OPEN API endpoint."""
+    endpoint: str                  # e.g. 'callOpenApiSvcInfo210L21'
+    short_name: str                # e.g. '210L21'
+    item_path: tuple[str, ...]     # 문서 루트부터 항목 요소까지의 경로
+    list_ttl: float                # 목록 조회 캐시 TTL (초)
+    detail_ttl: float              # 상세 조회 캐시 TTL (초)
+
+    @property
+    def root_tag(self) -> str:
+        return self.item_path[0]
+
+    @property
+    def item_tag(self) -> str:
+        return self.item_path[-1]
+
+
+ENDPOINTS: dict[str, EndpointSpec] = {
+    spec.endpoint: spec
+    for spec in (
+        # 공채속보: 목록(callTp=L)은 자주 바뀌고, 상세(callTp=D)는 거의 바뀌지 않음
+        EndpointSpec(
+            endpoint="callOpenApiSvcInfo210L21",
+            short_name="210L21",
+            item_path=("dhsOpenEmpInfoList", "dhsOpenEmpInfo"),
+            list_ttl=60.0,
+            detail_ttl=1800.0,
+        ),
+        # 강소기업/공채기업
+        EndpointSpec(
+            endpoint="callOpenApiSvcInfo210L31",
+            short_name="210L31",
+            item_path=("dhsOpenEmpHireInfoList", "dhsOpenEmpHireInfo"),
+            list_ttl=3600.0,
+            detail_ttl=3600.0,
+        ),
+        # 훈련과정 목록
+        EndpointSpec(
+            endpoint="callOpenApiSvcInfo310L01",
+            short_name="310L01",
+            item_path=("HRDNet", "srchList", "scn_list"),
+            list_ttl=600.0,
+            detail_ttl=600.0,
+        ),
+        # 훈련과정 상세
+        EndpointSpec(
+            endpoint="callOpenApiSvcInfo310L02",
+            short_name="310L02",
+            item_path=("HRDNet", "inst_base_info"),
+            list_ttl=3600.0,
+            detail_ttl=3600.0,
+        ),
+    )
+}
+
+
+def get_endpoint_spec(endpoint: str) -> EndpointSpec | None:
+    """Look up the registry entry for an endpoint name."""
+    return ENDPOINTS.get(endpoint)
+
+
+def short_name(endpoint: str) -> str:
+    """Short endpoint label (e.g. '210L21'), falling back to the raw name."""
+    spec = ENDPOINTS.get(endpoint)
+    return spec.short_name if spec else endpoint
+
+
+def is_detail_call(params: dict[str, Any]) -> bool:
+    """Whether the request is a detail lookup (callTp=D or outType=2)."""
+    return params.get("callTp") == "D" or str(params.get("outType")) == "2"
+
+
+def cache_ttl(endpoint: str, params: dict[str, Any]) -> float:
+    """
+    Resolve the cache TTL for a request.
+
+    Defaults come from the registry and can be overridden with
+    WORK24_CACHE_TTL_<SHORT> / WORK24_CACHE_TTL_<SHORT>_DETAIL (seconds).
+    """
+    spec = ENDPOINTS.get(endpoint)
+    if spec is None:
+        return env_float("WORK24_CACHE_TTL_DEFAULT", 60.0)
+    if is_detail_call(params):
+        return env_float(f"WORK24_CACHE_TTL_{spec.short_name}_DETAIL", spec.detail_ttl)
+    return env_float(f"WORK24_CACHE_TTL_{spec.short_name}", spec.list_ttl)
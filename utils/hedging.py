@@ -0,0 +1,167 @@
+"""
+Work24 Request Hedging
+응답이 지연 분위수(p95 등)를 넘기면 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Any
+
+from utils.config import env_bool, env_float, env_int, env_str
+from utils.endpoints import short_name
+
+logger = logging.getLogger("work24_hedging")
+
+
+class LatencyWindow:
+    """
+    Sliding window of the most recent latencies of one endpoint.
+
+    The quantile is computed from a sorted copy of the window, cached until
+    the next observation (a few hundred floats, so sorting is cheap next to
+    an upstream call).
+    """
+
+    def __init__(self, size: int = 256):
+        self._samples: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def quantile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        index = min(len(self._sorted) - 1, max(0, math.ceil(q * len(self._sorted)) - 1))
+        return self._sorted[index]
+
+
+class HedgeBudget:
+    """
+    Caps hedges at `ratio` of primary requests.
+
+    Every primary request earns `ratio` tokens (up to `burst`) and every
+    hedge spends one, so at most ratio x 100% extra upstream requests are
+    sent over time, with short bursts of up to `burst` hedges.
+    """
+
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+
+    def credit(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        # 0.05씩 20번 적립해도 부동소수점 오차로 1.0 미만이 되지 않도록 허용 오차
+        if self.tokens < 1.0 - 1e-9:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class Hedger:
+    """
+    Decides when to send a backup (hedged) request per endpoint.
+
+    A request is hedged once it has been outstanding longer than the
+    endpoint's WORK24_HEDGE_QUANTILE latency (tracked over recent requests)
+    and the hedge budget allows it. Settings are read on first use so that
+    values from .env apply:
+        WORK24_HEDGE_ENABLED       (default: false)
+        WORK24_HEDGE_QUANTILE      (default: 0.95)
+        WORK24_HEDGE_MIN_DELAY     (default: 0.2s, floor of the hedge delay)
+        WORK24_HEDGE_MIN_SAMPLES   (default: 20, no hedging before this)
+        WORK24_HEDGE_BUDGET        (default: 0.05 = at most 5% extra requests)
+        WORK24_HEDGE_BURST         (default: 5)
+        WORK24_HEDGE_ENDPOINTS     (default: all, e.g. '310L01,210L21')
+    """
+
+    def __init__(self):
+        self._windows: dict[str, LatencyWindow] = {}
+        self._budget: HedgeBudget | None = None
+        self._endpoints: frozenset[str] | None = None
+        self.hedged: dict[str, int] = {}
+        self.won: dict[str, int] = {}
+        self.denied = 0
+
+    @property
+    def enabled(self) -> bool:
+        return env_bool("WORK24_HEDGE_ENABLED", False)
+
+    @property
+    def budget(self) -> HedgeBudget:
+        if self._budget is None:
+            self._budget = HedgeBudget(
+                ratio=env_float("WORK24_HEDGE_BUDGET", 0.05),
+                burst=env_float("WORK24_HEDGE_BURST", 5.0),
+            )
+        return self._budget
+
+    def _window(self, endpoint: str) -> LatencyWindow:
+        window = self._windows.get(endpoint)
+        if window is None:
+            window = self._windows[endpoint] = LatencyWindow()
+        return window
+
+    def _hedgeable(self, endpoint: str) -> bool:
+        if self._endpoints is None:
+            names = env_str("WORK24_HEDGE_ENDPOINTS", "")
+            self._endpoints = frozenset(n.strip() for n in names.split(",") if n.strip())
+        return not self._endpoints or short_name(endpoint) in self._endpoints
+
+    def delay(self, endpoint: str) -> float | None:
+        """
+        Seconds to wait before hedging a new request to endpoint, or None
+        when it should not be hedged (disabled, too few samples).
+        Counts the request towards the hedge budget.
+        """
+        if not self.enabled or not self._hedgeable(endpoint):
+            return None
+        self.budget.credit()
+        window = self._window(endpoint)
+        if len(window) < env_int("WORK24_HEDGE_MIN_SAMPLES", 20):
+            return None
+        quantile = window.quantile(env_float("WORK24_HEDGE_QUANTILE", 0.95))
+        return max(quantile or 0.0, env_float("WORK24_HEDGE_MIN_DELAY", 0.2))
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        self._window(endpoint).observe(seconds)
+
+    def try_hedge(self, endpoint: str) -> bool:
+        """Take one hedge from the budget."""
+        if not self.budget.try_spend():
+            self.denied += 1
+            return False
+        self.hedged[endpoint] = self.hedged.get(endpoint, 0) + 1
+        return True
+
+    def record_win(self, endpoint: str) -> None:
+        """The hedged request answered before the original one."""
+        self.won[endpoint] = self.won.get(endpoint, 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        quantile = env_float("WORK24_HEDGE_QUANTILE", 0.95)
+        return {
+            "enabled": self.enabled,
+            "budget_tokens": round(self.budget.tokens, 2),
+            "denied": self.denied,
+            "endpoints": {
+                endpoint: {
+                    "samples": len(window),
+                    "hedge_after": window.quantile(quantile),
+                    "hedged": self.hedged.get(endpoint, 0),
+                    "won": self.won.get(endpoint, 0),
+                }
+                for endpoint, window in self._windows.items()
+            },
+        }
@@ -3,27 +3,44 @@ Work24 OPEN API HTTP Client
 Shared utility for calling Work24 APIs and parsing XML responses.
 """
 
+import asyncio
+import json
 import os
-import sys
+import re
+import time
 import logging
 import traceback
-from typing import Any
+from typing import Any, Awaitable, Callable
 from enum import Enum
 import httpx
 import xmltodict
-from dotenv import load_dotenv
 
-# stderr로 로깅 설정 (MCP는 stdout을 JSON-RPC로 사용하므로 stderr 필수)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
+from utils.cache import cache_policy, make_cache_key, response_cache
+from utils.cassette import cassette
+from utils.config import env_bool, env_float, load_env
+from utils.deadline import Work24DeadlineExceeded, check_deadline
+from utils.endpoints import cache_ttl, get_endpoint_spec, short_name
+from utils.hedging import Hedger
+from utils.http_pool import http_pool
+from utils.metrics import (
+    format_samples,
+    observe_phase,
+    record_cache_lookup,
+    record_phase,
+    record_response,
+    record_retry,
+    record_stale,
+    registry,
+    track_upstream,
 )
-logger = logging.getLogger("work24_http_client")
+from utils.prefetch import prefetcher
+from utils.rate_limit import RateLimiter
+from utils.resilience import CircuitBreakers, RetryPolicy, Work24CircuitOpen
+from utils.singleflight import SingleFlight
+from utils.xml_stream import StreamingItemParser
 
-# 환경변수 로드
-load_dotenv()
-logger.info("dotenv loaded")
+# 로깅 설정(stderr)은 실행 진입점(server.py)에서 담당
+logger = logging.getLogger("work24_http_client")
 
 # Base URLs for Work24 APIs
 WORK24_BASE_URL = "https://www.work24.go.kr/cm/openApi/call"
@@ -33,6 +50,38 @@ WORK24_HR_BASE = f"{WORK24_BASE_URL}/hr"  # 훈련
 
 logger.info("Base URLs - WK: %s, HR: %s", WORK24_WK_BASE, WORK24_HR_BASE)
 
+# 동일 요청 병합용 (엔드포인트 + 정규화 파라미터 키)
+_single_flight = SingleFlight()
+
+
+def _is_overload(exc: BaseException) -> bool:
+    """429/5xx responses and timeouts signal upstream overload."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TimeoutException)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Transient failures worth retrying (overload and transport errors)."""
+    return _is_overload(exc) or isinstance(exc, httpx.TransportError)
+
+
+# 인증키(ApiType)별 호출량/동시성 제한
+_rate_limiter = RateLimiter(is_overload=_is_overload)
+
+# 엔드포인트별 서킷 브레이커
+_breakers = CircuitBreakers()
+
+# 꼬리 지연 대비 hedged request (WORK24_HEDGE_ENABLED)
+_hedger = Hedger()
+
+# stale 응답 표시용 키 (파싱된 문서 최상위에 추가, 캐시 원본은 변경하지 않음)
+_STALE_KEY = "_work24_stale"
+
+# 다른 워커의 결과를 기다릴 때 공유 캐시 확인 간격 (초)
+_PEER_POLL_INTERVAL = 0.05
+
 
 class ApiType(str, Enum):
     """API types with corresponding environment variable names."""
@@ -45,6 +94,8 @@ def get_auth_key(api_type: ApiType) -> str:
     Get Work24 API authentication key for specific API type.
     """
     logger.debug("get_auth_key called for api_type=%s", api_type)
+    # .env는 import 시점이 아니라 첫 설정 조회 시 로드
+    load_env()
     key = os.getenv(api_type.value)
     if not key:
         error_msg = f"{api_type.value} environment variable is not set"
@@ -54,6 +105,17 @@ def get_auth_key(api_type: ApiType) -> str:
     return key
 
 
+def upstream_headroom(api_type: ApiType, reserve_tokens: float = 0.0) -> bool:
+    """
+    Whether a request for api_type could be sent right away while leaving
+    reserve_tokens of the rate limit for other callers (used to run
+    low-priority work such as prefetching only when upstream is idle).
+    """
+    if not env_bool("WORK24_RATE_LIMIT_ENABLED", True):
+        return True
+    return _rate_limiter.has_headroom(api_type.name, reserve_tokens)
+
+
 async def call_work24_api(
     endpoint: str,
     params: dict[str, Any],
@@ -63,6 +125,20 @@ async def call_work24_api(
 ) -> dict[str, Any]:
     """
     Call Work24 OPEN API and parse response.
+
+    Responses are served from the in-process cache when fresh, and
+    concurrent identical requests share a single upstream call. Once a
+    response has expired, the last good copy is returned immediately,
+    marked stale (see stale_info()), while a refresh runs in the
+    background or while the endpoint's circuit breaker is open. Callers
+    that need fresh data (background syncs) disable stale serving with
+    use_cache_policy(allow_stale=False), and store=False keeps their crawl
+    pages out of the memory cache (see CachePolicy).
+
+    Runs within the caller's deadline (utils.deadline): an expired
+    deadline raises Work24DeadlineExceeded before any upstream work, and
+    cancelling the caller abandons the upstream call unless other callers
+    are still waiting for it.
     """
     logger.info("=" * 50)
     logger.info("call_work24_api START")
@@ -73,58 +149,41 @@ async def call_work24_api(
     logger.info("  return_type: %s", return_type)
 
     try:
-        url = f"{base_url}/{endpoint}.do"
-        logger.info("  Full URL (without params): %s", url)
-
-        # Add common parameters with API-specific auth key
-        auth_key = get_auth_key(api_type)
-        request_params: dict[str, Any] = {
-            "authKey": auth_key,
-            "returnType": return_type,
-            **params,
-        }
+        check_deadline(short_name(endpoint))
 
         # Remove None values
-        request_params = {k: v for k, v in request_params.items() if v is not None}
-        
-        # authKey 마스킹하여 로깅
-        log_params = {k: (v[:8] + "..." if k == "authKey" else v) for k, v in request_params.items()}
-        logger.info("  Request params (masked): %s", log_params)
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logger.info("  Sending HTTP GET request...")
-            response = await client.get(url, params=request_params)
-            
-            # 최종 호출 URL 로깅 (authKey 포함된 실제 URL)
-            final_url = str(response.request.url)
-            # authKey 마스킹
-            if "authKey=" in final_url:
-                import re
-                masked_url = re.sub(r'authKey=[^&]+', 'authKey=***MASKED***', final_url)
-                logger.info("  Final URL (masked): %s", masked_url)
-            
-            logger.info("  Response status: %d", response.status_code)
-            logger.debug("  Response headers: %s", dict(response.headers))
-            
-            response.raise_for_status()
-            
-            response_text = response.text
-            # 디버깅: XML 응답 전체 출력
-            logger.info("  Response XML (first 1000 chars):\n%s", response_text[:1000])
-            
-            if return_type == "XML":
-                result = xmltodict.parse(response_text)
-                logger.info("  XML parsed successfully")
-                # 디버깅: 파싱된 결과의 키 출력
-                logger.info("  Parsed result: %s", result)
-            else:
-                result = response.json()
-                logger.info("  JSON parsed successfully")
-            
-            logger.info("call_work24_api END - SUCCESS")
+        query = {k: v for k, v in {"returnType": return_type, **params}.items() if v is not None}
+
+        # 캐시 조회 (authKey 제외한 정규화 파라미터 기준)
+        cache_key = make_cache_key(endpoint, query)
+        cached = await response_cache.get(cache_key)
+        record_cache_lookup(endpoint, cached is not None)
+        if cached is not None:
+            logger.info("call_work24_api END - CACHE HIT (%s)", cache_key)
+            logger.info("=" * 50)
+            return cached
+
+        def fetch():
+            return _fetch_work24(endpoint, query, api_type, base_url, return_type, cache_key)
+
+        # 만료된 정상 응답이 있으면 stale-while-revalidate (동기화 작업은 제외)
+        stale = await response_cache.get_stale(cache_key) if cache_policy().allow_stale else None
+        if stale is not None:
+            result = _serve_stale(endpoint, cache_key, stale, fetch)
+            logger.info("call_work24_api END - STALE (%s)", result[_STALE_KEY]["reason"])
             logger.info("=" * 50)
             return result
-            
+
+        # 동일 요청이 이미 진행 중이면 그 결과를 함께 기다림
+        result = await _single_flight.do(cache_key, fetch)
+
+        logger.info("call_work24_api END - SUCCESS")
+        logger.info("=" * 50)
+        return result
+
+    except (Work24CircuitOpen, Work24DeadlineExceeded) as e:
+        logger.warning("%s", e)
+        raise
     except httpx.HTTPStatusError as e:
         logger.error("HTTP Error: %s", e)
         logger.error("Response body: %s", e.response.text[:500] if e.response else "N/A")
@@ -135,6 +194,428 @@ async def call_work24_api(
         raise
 
 
+async def _fetch_work24(
+    endpoint: str,
+    query: dict[str, Any],
+    api_type: ApiType,
+    base_url: str,
+    return_type: str,
+    cache_key: str,
+) -> dict[str, Any]:
+    """Perform the upstream GET, parse the body and populate the cache."""
+    # 멀티 워커: 같은 요청은 리스를 잡은 워커 하나만 업스트림 호출
+    shared = response_cache.shared
+    leased = False
+    if shared is not None:
+        # SQLite 잠금 대기(최대 5초)가 이벤트 루프를 막지 않도록 스레드에서
+        leased = await asyncio.to_thread(shared.try_lease, cache_key)
+        if not leased:
+            result = await _wait_for_peer(cache_key)
+            if result is not None:
+                logger.info("  Served by peer worker (%s)", cache_key)
+                return result
+            # 리스 만료/해제 후에도 결과가 없으면 직접 호출
+            leased = await asyncio.to_thread(shared.try_lease, cache_key)
+
+    try:
+        breaker = _breakers.get(endpoint)
+        if not breaker.allow():
+            raise Work24CircuitOpen(endpoint, breaker.retry_after())
+        try:
+            with track_upstream(endpoint):
+                result = await _fetch_work24_tracked(endpoint, query, api_type, base_url, return_type, cache_key)
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception as e:
+            # 4xx/파싱 오류 등은 업스트림 장애로 보지 않음
+            if _is_retryable(e):
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
+            logger.warning("Upstream call to %s failed: %s", endpoint, e)
+            raise
+        breaker.record_success()
+        return result
+    finally:
+        if leased:
+            await asyncio.to_thread(shared.release_lease, cache_key)
+
+
+async def _wait_for_peer(cache_key: str) -> dict[str, Any] | None:
+    """
+    Wait for the worker holding the lease on cache_key to publish its result.
+
+    Returns the shared-cache entry once it appears, or None when the peer
+    gives up the lease without one (failure/crash) or WORK24_SHARED_LEASE_WAIT
+    seconds pass.
+    """
+    shared = response_cache.shared
+    deadline = time.monotonic() + env_float("WORK24_SHARED_LEASE_WAIT", 10.0)
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_PEER_POLL_INTERVAL)
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not await asyncio.to_thread(shared.lease_held, cache_key):
+            return await response_cache.get(cache_key)
+    return None
+
+
+def _serve_stale(
+    endpoint: str,
+    cache_key: str,
+    stale: tuple[dict[str, Any], float],
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Return the stale copy marked with why/how old, starting a refresh if allowed."""
+    value, age = stale
+    breaker = _breakers.get(endpoint)
+    if breaker.state == "open" and breaker.retry_after() > 0:
+        reason = "circuit_open"
+    else:
+        reason = "refreshing"
+        # 백그라운드 갱신 (동일 키 갱신이 이미 진행 중이면 합류)
+        _single_flight.start(cache_key, fetch, detached=True)
+    record_stale(endpoint, reason)
+    return {**value, _STALE_KEY: {"reason": reason, "age_seconds": round(age, 1)}}
+
+
+def stale_info(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Stale marker for tool responses.
+
+    Returns {} for fresh data, otherwise stale=True with stale_reason
+    ('refreshing' or 'circuit_open') and stale_age_seconds.
+    """
+    marker = data.get(_STALE_KEY) if isinstance(data, dict) else None
+    if not marker:
+        return {}
+    return {"stale": True, "stale_reason": marker["reason"], "stale_age_seconds": marker["age_seconds"]}
+
+
+async def _fetch_work24_tracked(
+    endpoint: str,
+    query: dict[str, Any],
+    api_type: ApiType,
+    base_url: str,
+    return_type: str,
+    cache_key: str,
+) -> dict[str, Any]:
+    url = f"{base_url}/{endpoint}.do"
+    logger.info("  Full URL (without params): %s", url)
+
+    spec = get_endpoint_spec(endpoint)
+    streamed = return_type == "XML" and spec is not None and env_bool("WORK24_STREAM_PARSE", True)
+    item_path = spec.item_path if streamed else None
+
+    # 재생 모드: 녹화된 응답으로 응답 (네트워크/인증키 불필요)
+    if cassette.replaying:
+        result = await _replay(endpoint, cache_key, return_type, item_path)
+        if cache_policy().store:
+            await response_cache.store(cache_key, endpoint, result, cache_ttl(endpoint, query))
+        return result
+
+    # Add common parameters with API-specific auth key
+    auth_key = get_auth_key(api_type)
+    request_params: dict[str, Any] = {"authKey": auth_key, **query}
+
+    # authKey 마스킹하여 로깅
+    log_params = {k: (v[:8] + "..." if k == "authKey" else v) for k, v in request_params.items()}
+    logger.info("  Request params (masked): %s", log_params)
+
+    # 공유 keep-alive 풀 사용 (요청마다 TCP/TLS 핸드셰이크 방지)
+    client = await http_pool.get_client(base_url)
+    async def send() -> tuple[dict[str, Any], float, list[bytes] | None]:
+        # 녹화 모드: 원본 본문을 모아 성공 시 카세트에 저장
+        sink: list[bytes] | None = [] if cassette.recording else None
+        # 인증키 쿼터 보호: 토큰 버킷 + 적응형 동시성 슬롯을 잡은 상태에서만 요청
+        async with _rate_limiter.limit(api_type.name):
+            start = time.perf_counter()
+            if streamed:
+                result = await _get_streamed(client, endpoint, url, request_params, base_url, item_path, sink)
+            else:
+                result = await _get_buffered(client, endpoint, url, request_params, base_url, return_type, sink)
+            return result, time.perf_counter() - start, sink
+
+    policy = RetryPolicy.from_env()
+    for attempt in range(policy.attempts):
+        try:
+            result, elapsed, sink = await _send_hedged(endpoint, api_type, send)
+            break
+        except Exception as e:
+            # GET은 멱등이므로 일시적 실패는 지터 백오프 후 재시도
+            if attempt + 1 >= policy.attempts or not _is_retryable(e):
+                raise
+            delay = policy.backoff(attempt)
+            record_retry(endpoint)
+            logger.warning(
+                "  Attempt %d/%d failed (%s), retrying in %.2fs",
+                attempt + 1, policy.attempts, e, delay,
+            )
+            await asyncio.sleep(delay)
+    if sink is not None:
+        await asyncio.to_thread(cassette.record, cache_key, endpoint, b"".join(sink), elapsed)
+    # 디버깅: 파싱된 결과 출력
+    logger.debug("  Parsed result: %s", result)
+
+    # 백그라운드 동기화의 수집 페이지는 메모리 캐시에 적재하지 않음
+    # (멀티 워커: 같은 수집을 따라 하는 다른 워커가 재사용하도록 공유 계층에만 저장)
+    if cache_policy().store:
+        await response_cache.store(cache_key, endpoint, result, cache_ttl(endpoint, query))
+    elif response_cache.peers() is not None:
+        await response_cache.store(cache_key, endpoint, result, cache_ttl(endpoint, query), memory=False)
+    return result
+
+
+async def _send_hedged(
+    endpoint: str,
+    api_type: ApiType,
+    send: Callable[[], Awaitable[tuple[dict[str, Any], float, list[bytes] | None]]],
+) -> tuple[dict[str, Any], float, list[bytes] | None]:
+    """
+    Run send(), and if it is still outstanding after the endpoint's hedge
+    delay, a second identical send(); the first success wins and the other
+    is cancelled. Hedges are skipped when the hedge budget is spent or the
+    API key has no free concurrency slot (the copy would only queue).
+    """
+    delay = _hedger.delay(endpoint)
+    if delay is None:
+        outcome = await send()
+        _hedger.observe(endpoint, outcome[1])
+        return outcome
+
+    primary = asyncio.create_task(send())
+    pending = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if not done and _rate_limiter.has_headroom(api_type.name) and _hedger.try_hedge(endpoint):
+            logger.info("  No response after %.2fs, sending hedged request", delay)
+            pending.add(asyncio.create_task(send()))
+        error: BaseException | None = None
+        while pending or done:
+            for task in done:
+                if task.exception() is None:
+                    outcome = task.result()
+                    _hedger.observe(endpoint, outcome[1])
+                    if task is not primary:
+                        _hedger.record_win(endpoint)
+                    return outcome
+                error = error or task.exception()
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        raise error
+    finally:
+        # 늦은 쪽 요청은 취소 (커넥션/동시성 슬롯 반환)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _replay(
+    endpoint: str,
+    cache_key: str,
+    return_type: str,
+    item_path: tuple[str, ...] | None,
+) -> dict[str, Any]:
+    """Serve a recorded response, parsed exactly like a live one."""
+    body, recorded_elapsed = await asyncio.to_thread(cassette.load, cache_key)
+    delay = cassette.replay_delay(recorded_elapsed)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    logger.info("  Replayed recorded response (%d bytes, %.3fs injected)", len(body), delay)
+    with observe_phase(endpoint, "parse"):
+        if item_path is not None:
+            parser = StreamingItemParser(item_path)
+            parser.feed(body)
+            return parser.close()
+        if return_type == "XML":
+            return xmltodict.parse(body)
+        return json.loads(body)
+
+
+def _log_response(response: httpx.Response) -> None:
+    """Log final URL (authKey masked), status and headers."""
+    final_url = str(response.request.url)
+    if "authKey=" in final_url:
+        masked_url = re.sub(r'authKey=[^&]+', 'authKey=***MASKED***', final_url)
+        logger.info("  Final URL (masked): %s", masked_url)
+
+    logger.info("  Response status: %d", response.status_code)
+    logger.debug("  Response headers: %s", dict(response.headers))
+
+
+async def _get_buffered(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    url: str,
+    request_params: dict[str, Any],
+    base_url: str,
+    return_type: str,
+    sink: list[bytes] | None = None,
+) -> dict[str, Any]:
+    """GET the whole body, then parse it with xmltodict (or as JSON)."""
+    logger.info("  Sending HTTP GET request...")
+    with observe_phase(endpoint, "network"):
+        response = await client.get(
+            url,
+            params=request_params,
+            extensions={"trace": http_pool.trace(base_url)},
+        )
+    record_response(endpoint, response.status_code, len(response.content))
+    _log_response(response)
+
+    response.raise_for_status()
+    if sink is not None:
+        sink.append(response.content)
+
+    response_text = response.text
+    # 디버깅: XML 응답 앞부분 출력
+    logger.info("  Response XML (first 1000 chars):\n%s", response_text[:1000])
+
+    with observe_phase(endpoint, "parse"):
+        if return_type == "XML":
+            result = xmltodict.parse(response_text)
+            logger.info("  XML parsed successfully")
+        else:
+            result = response.json()
+            logger.info("  JSON parsed successfully")
+    return result
+
+
+async def _get_streamed(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    url: str,
+    request_params: dict[str, Any],
+    base_url: str,
+    item_path: tuple[str, ...],
+    sink: list[bytes] | None = None,
+) -> dict[str, Any]:
+    """
+    GET the body as a stream and parse it incrementally.
+
+    Item elements are turned into flat records as soon as they are complete,
+    so the full body text and element tree are never held in memory.
+    """
+    logger.info("  Sending HTTP GET request (streaming)...")
+    start = time.perf_counter()
+    parse_seconds = 0.0
+    size = 0
+    async with client.stream(
+        "GET",
+        url,
+        params=request_params,
+        extensions={"trace": http_pool.trace(base_url)},
+    ) as response:
+        _log_response(response)
+        if response.is_error:
+            await response.aread()
+            record_response(endpoint, response.status_code, len(response.content))
+            response.raise_for_status()
+
+        parser = StreamingItemParser(item_path)
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if sink is not None:
+                sink.append(chunk)
+            chunk_start = time.perf_counter()
+            parser.feed(chunk)
+            parse_seconds += time.perf_counter() - chunk_start
+        chunk_start = time.perf_counter()
+        result = parser.close()
+        parse_seconds += time.perf_counter() - chunk_start
+
+    record_response(endpoint, response.status_code, size)
+    record_phase(endpoint, "network", time.perf_counter() - start - parse_seconds)
+    record_phase(endpoint, "parse", parse_seconds)
+    logger.info("  XML stream parsed successfully (%d items, %d bytes)", parser.items_parsed, size)
+    return result
+
+
+def client_stats() -> dict[str, Any]:
+    """Runtime statistics of the upstream client layers (pool, cache, coalescing, limits)."""
+    return {
+        "http_pool": http_pool.stats(),
+        "cache": response_cache.stats(),
+        "single_flight": _single_flight.stats(),
+        "rate_limit": _rate_limiter.stats(),
+        "circuit_breakers": _breakers.stats(),
+        "hedging": _hedger.stats(),
+        "prefetch": prefetcher.stats(),
+        "cassette": cassette.stats(),
+    }
+
+
+def _collect_client_metrics() -> list[str]:
+    """Expose pool, cache and coalescing counters on /metrics."""
+    stats = client_stats()
+    pool = stats["http_pool"]["base_urls"]
+    cache = stats["cache"]
+    flight = stats["single_flight"]
+    lines: list[str] = []
+    lines += format_samples(
+        "work24_http_connections_opened_total", "counter", "TCP connections opened per base URL.",
+        [({"base_url": url}, s["connections_opened"]) for url, s in pool.items()],
+    )
+    lines += format_samples(
+        "work24_http_connections_reused_total", "counter", "Requests served on a pooled connection.",
+        [({"base_url": url}, s["connections_reused"]) for url, s in pool.items()],
+    )
+    lines += format_samples(
+        "work24_cache_entries", "gauge", "Response cache entries.", [({}, cache["size"])],
+    )
+    lines += format_samples(
+        "work24_cache_evictions_total", "counter", "Response cache LRU evictions.", [({}, cache["evictions"])],
+    )
+    lines += format_samples(
+        "work24_single_flight_coalesced_total", "counter", "Requests coalesced onto an in-flight call.",
+        [({}, flight["coalesced"])],
+    )
+    lines += format_samples(
+        "work24_single_flight_abandoned_total", "counter", "Upstream calls cancelled after every caller gave up.",
+        [({}, flight["abandoned"])],
+    )
+    limits = stats["rate_limit"]
+    lines += format_samples(
+        "work24_concurrency_limit", "gauge", "Adaptive upstream concurrency limit per API key type.",
+        [({"api_type": key}, s["limit"]) for key, s in limits.items()],
+    )
+    lines += format_samples(
+        "work24_rate_limit_waiting", "gauge", "Requests queued for an upstream concurrency slot.",
+        [({"api_type": key}, s["waiting"]) for key, s in limits.items()],
+    )
+    lines += format_samples(
+        "work24_rate_limit_throttled_seconds_total", "counter", "Time spent waiting for rate/concurrency limits.",
+        [({"api_type": key}, s["throttled_seconds"]) for key, s in limits.items()],
+    )
+    breakers = stats["circuit_breakers"]
+    lines += format_samples(
+        "work24_circuit_open", "gauge", "1 while an endpoint's circuit breaker is open.",
+        [({"endpoint": short_name(endpoint)}, 1 if s["state"] == "open" else 0) for endpoint, s in breakers.items()],
+    )
+    hedging = stats["hedging"]["endpoints"]
+    lines += format_samples(
+        "work24_hedged_requests_total", "counter", "Backup requests sent after the hedge delay.",
+        [({"endpoint": short_name(endpoint)}, s["hedged"]) for endpoint, s in hedging.items()],
+    )
+    lines += format_samples(
+        "work24_hedge_wins_total", "counter", "Hedged requests that answered first.",
+        [({"endpoint": short_name(endpoint)}, s["won"]) for endpoint, s in hedging.items()],
+    )
+    prefetch = stats["prefetch"]
+    lines += format_samples(
+        "work24_prefetch_total", "counter", "Background prefetches by outcome.",
+        [({"outcome": outcome}, prefetch[outcome]) for outcome in ("completed", "failed", "dropped", "expired")],
+    )
+    return lines
+
+
+registry.add_collector(_collect_client_metrics)
+
+
 def safe_get(data: dict, *keys, default: Any = None) -> Any:
     """Safely get nested dictionary value."""
     result = data
@@ -155,3 +636,8 @@ def ensure_list(value: Any) -> list:
     if isinstance(value, list):
         return value
     return [value]
+
+
+def error_info(e: Exception) -> dict[str, str]:
+    """Error payload for one failed lookup inside a multi-part result."""
+    return {"type": type(e).__name__, "message": str(e) or repr(e)}
@@ -0,0 +1,199 @@
+"""
+Work24 HTTP Connection Pool
+프로세스 단위로 공유되는 httpx.AsyncClient 관리 (base URL별 keep-alive 풀)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from utils.config import env_bool, env_float, env_int
+
+logger = logging.getLogger("work24_http_pool")
+
+# httpcore trace 이벤트: 요청 헤더 전송 시점 (HTTP/1.1, HTTP/2)
+_SEND_HEADERS_EVENTS = (
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings (overridable via WORK24_HTTP_* env vars)."""
+    http2: bool = False
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Build pool settings from environment variables."""
+        return cls(
+            http2=env_bool("WORK24_HTTP2", cls.http2),
+            max_connections=env_int("WORK24_HTTP_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=env_int(
+                "WORK24_HTTP_MAX_KEEPALIVE", cls.max_keepalive_connections
+            ),
+            keepalive_expiry=env_float("WORK24_HTTP_KEEPALIVE_EXPIRY", cls.keepalive_expiry),
+            connect_timeout=env_float("WORK24_HTTP_CONNECT_TIMEOUT", cls.connect_timeout),
+            read_timeout=env_float("WORK24_HTTP_READ_TIMEOUT", cls.read_timeout),
+            write_timeout=env_float("WORK24_HTTP_WRITE_TIMEOUT", cls.write_timeout),
+            pool_timeout=env_float("WORK24_HTTP_POOL_TIMEOUT", cls.pool_timeout),
+        )
+
+
+@dataclass
+class _BaseUrlStats:
+    """Per base URL connection counters."""
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+
+
+def _http2_available() -> bool:
+    """Check whether the optional 'h2' package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class Work24ClientPool:
+    """
+    Long-lived httpx.AsyncClient per base URL.
+
+    Clients are created lazily on first use so that scripts (test_api.py)
+    work without a lifespan. When running under the MCP server, the app
+    lifespan calls acquire()/release(); the last release closes all clients.
+    """
+
+    def __init__(self, config: PoolConfig | None = None):
+        self._config = config
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, _BaseUrlStats] = {}
+        self._lock = asyncio.Lock()
+        self._users = 0
+
+    @property
+    def config(self) -> PoolConfig:
+        if self._config is None:
+            self._config = PoolConfig.from_env()
+        return self._config
+
+    def _create_client(self, base_url: str) -> httpx.AsyncClient:
+        config = self.config
+        http2 = config.http2
+        if http2 and not _http2_available():
+            logger.warning("WORK24_HTTP2 is set but 'h2' is not installed; falling back to HTTP/1.1")
+            http2 = False
+
+        logger.info(
+            "Opening HTTP client for %s (http2=%s, max_connections=%d, keepalive=%d)",
+            base_url, http2, config.max_connections, config.max_keepalive_connections,
+        )
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=config.connect_timeout,
+                read=config.read_timeout,
+                write=config.write_timeout,
+                pool=config.pool_timeout,
+            ),
+        )
+
+    async def get_client(self, base_url: str) -> httpx.AsyncClient:
+        """Return the shared client for a base URL, creating it if needed."""
+        client = self._clients.get(base_url)
+        if client is not None and not client.is_closed:
+            return client
+        async with self._lock:
+            client = self._clients.get(base_url)
+            if client is None or client.is_closed:
+                client = self._create_client(base_url)
+                self._clients[base_url] = client
+                self._stats.setdefault(base_url, _BaseUrlStats())
+            return client
+
+    def trace(self, base_url: str) -> Callable[[str, dict], Awaitable[None]]:
+        """
+        Build an httpcore trace hook for one request.
+
+        A request that triggers a TCP connect counts as a newly opened
+        connection; every other request was served on a pooled connection.
+        """
+        stats = self._stats.setdefault(base_url, _BaseUrlStats())
+        stats.requests += 1
+        opened = False
+
+        async def _trace(event_name: str, info: dict) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+                stats.connections_opened += 1
+            elif event_name in _SEND_HEADERS_EVENTS:
+                if not opened:
+                    stats.connections_reused += 1
+
+        return _trace
+
+    async def acquire(self) -> None:
+        """Register a lifespan user (server startup)."""
+        async with self._lock:
+            self._users += 1
+            # 설정을 시작 시점에 확정
+            config = self.config
+        logger.info("HTTP pool acquired (users=%d, http2=%s)", self._users, config.http2)
+
+    async def release(self) -> None:
+        """Unregister a lifespan user; the last one closes all clients."""
+        async with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users:
+                return
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        async with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for base_url, client in clients:
+            logger.info("Closing HTTP client for %s", base_url)
+            await client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection reuse statistics per base URL."""
+        per_base: dict[str, Any] = {}
+        for base_url, s in self._stats.items():
+            client = self._clients.get(base_url)
+            per_base[base_url] = {
+                "open": client is not None and not client.is_closed,
+                "requests": s.requests,
+                "connections_opened": s.connections_opened,
+                "connections_reused": s.connections_reused,
+                "reuse_ratio": round(s.connections_reused / s.requests, 3) if s.requests else None,
+            }
+        return {
+            "http2": self.config.http2,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "base_urls": per_base,
+        }
+
+
+# 프로세스 전역 풀
+http_pool = Work24ClientPool()
@@ -0,0 +1,267 @@
+"""
+Declarative Field Mapping
+엔드포인트별 필드 매핑 명세를 import 시점에 한 번 컴파일하여 빠른 추출 함수 생성
+(+ 로컬 스토어에 보관하는 __slots__ 레코드 클래스)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence
+
+Mapper = Callable[[Any], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    One output field of a mapping spec.
+
+    Args:
+        name: Output key
+        source: Upstream key, or a key path for nested sections
+            (e.g. ('inst_base_info', 'trprNm'))
+        default: Value used when the upstream value is missing (None)
+        convert: Optional converter applied after the default
+        verbose: Long text / secondary URL left out in compact mode
+            unless requested by name
+    """
+    name: str
+    source: str | tuple[str, ...]
+    default: Any = None
+    convert: Callable[[Any], Any] | None = None
+    verbose: bool = False
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        return (self.source,) if isinstance(self.source, str) else tuple(self.source)
+
+
+# ------------------------------------------------------------
+# 공통 변환 함수
+# ------------------------------------------------------------
+def format_date(date_str: str | None) -> str | None:
+    """Format date string from YYYYMMDD to YYYY-MM-DD."""
+    if not date_str or len(date_str) != 8:
+        return date_str
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+
+
+def parse_int(value) -> int | None:
+    """Parse integer from string, return None if not possible."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_float(value) -> float | None:
+    """Parse float from string, return None if not possible."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# ------------------------------------------------------------
+# 레코드 (로컬 스토어 보관용)
+# ------------------------------------------------------------
+class Record:
+    """
+    Base of slotted records generated by compile_record().
+
+    Records keep one mapped item in __slots__ instead of a per-item dict
+    (no per-instance hash table), which matters for stores that hold
+    thousands of items. Read access is dict-like (get, [], keys, **) so
+    code written against mapped dicts keeps working.
+    """
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self._field_set:
+            return getattr(self, name)
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._field_set:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def keys(self) -> tuple[str, ...]:
+        return self._fields
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self._fields)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def compile_record(fields: Sequence[Field], name: str) -> type[Record]:
+    """
+    Build a Record subclass with one slot per output field of a spec.
+
+    from_dict() is generated like a mapper (one dict.get() per field) and
+    converts a mapped item into a record.
+    """
+    names = tuple(f.name for f in fields)
+    args = ", ".join(names)
+    lines = [f"def __init__(self, {args}):"] + [f"    self.{n} = {n}" for n in names]
+    lines += ["@classmethod", "def from_dict(cls, item):"]
+    lines.append("    return cls(" + ", ".join(f"item.get({n!r})" for n in names) + ")")
+    namespace: dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<record {name}>", "exec"), namespace)
+    return type(name, (Record,), {
+        "__slots__": names,
+        "_fields": names,
+        "_field_set": frozenset(names),
+        "__init__": namespace["__init__"],
+        "from_dict": namespace["from_dict"],
+    })
+
+
+def validate_spec(fields: Sequence[Field], model: Any) -> None:
+    """
+    Check once (at import) that every output name of a spec is declared on
+    the pydantic model describing it, so models and mappers cannot drift.
+    """
+    declared = set(model.model_fields)
+    undeclared = [f.name for f in fields if f.name not in declared]
+    if undeclared:
+        raise TypeError(f"{model.__name__} does not declare mapped fields: {', '.join(undeclared)}")
+
+
+# ------------------------------------------------------------
+# 컴파일러
+# ------------------------------------------------------------
+# 도구 호출별 fields 조합이 무한히 쌓이지 않도록 매퍼당 변형 캐시 상한
+_MAX_VARIANTS = 64
+
+
+def compile_mapper(
+    fields: Sequence[Field],
+    name: str = "mapper",
+    compact: bool = False,
+    model: Any = None,
+) -> Mapper:
+    """
+    Compile a mapping spec into a single generated function.
+
+    The generated function performs one dict.get() per field (plus one
+    per nested section), applies defaults and converters inline and builds
+    the output dict in a single literal, avoiding per-field safe_get()
+    calls in the per-item loop. Non-dict input maps to all defaults, like
+    safe_get() does; Record input is read through Record.get(). With
+    compact=True, empty values (None, "", []) are left out of the output.
+    When a pydantic model is given, the spec is validated against it once
+    here (validate_spec()), never per item.
+    """
+    if model is not None:
+        validate_spec(fields, model)
+    namespace: dict[str, Any] = {"_dict": dict, "_mapping": (dict, Record), "_EMPTY": {}}
+    lines = [f"def {name}(rec):", "    if not isinstance(rec, _mapping):", "        rec = _EMPTY"]
+
+    # 중첩 섹션(예: inst_base_info)은 한 번만 조회
+    sections: dict[tuple[str, ...], str] = {(): "rec"}
+    for field in fields:
+        path = field.path
+        for depth in range(1, len(path)):
+            prefix = path[:depth]
+            if prefix in sections:
+                continue
+            var = f"s{len(sections)}"
+            parent = sections[prefix[:-1]]
+            lines.append(f"    {var} = {parent}.get({prefix[-1]!r})")
+            lines.append(f"    if not isinstance({var}, _dict):")
+            lines.append(f"        {var} = _EMPTY")
+            sections[prefix] = var
+
+    entries = []
+    if compact:
+        lines.append("    out = {}")
+    for i, field in enumerate(fields):
+        path = field.path
+        lines.append(f"    v{i} = {sections[path[:-1]]}.get({path[-1]!r})")
+        if field.default is not None:
+            namespace[f"d{i}"] = field.default
+            lines.append(f"    if v{i} is None:")
+            lines.append(f"        v{i} = d{i}")
+        expr = f"v{i}"
+        if field.convert is not None:
+            namespace[f"c{i}"] = field.convert
+            expr = f"c{i}(v{i})"
+        if compact:
+            if expr != f"v{i}":
+                lines.append(f"    v{i} = {expr}")
+            lines.append(f"    if v{i} is not None and v{i} != '' and v{i} != []:")
+            lines.append(f"        out[{field.name!r}] = v{i}")
+        else:
+            entries.append(f"        {field.name!r}: {expr},")
+
+    if compact:
+        lines.append("    return out")
+    else:
+        lines.append("    return {")
+        lines.extend(entries)
+        lines.append("    }")
+
+    exec(compile("\n".join(lines), f"<mapper {name}>", "exec"), namespace)
+    mapper = namespace[name]
+    mapper.fields = tuple(fields)
+    mapper.variants = {}
+    return mapper
+
+
+def compile_picker(fields: Sequence[Field], name: str = "picker") -> Mapper:
+    """
+    Mapper over already-mapped records (local stores) with the same output
+    names and verbose flags as `fields`, so projected() works on them too.
+    """
+    return compile_mapper(
+        tuple(Field(f.name, f.name, verbose=f.verbose) for f in fields),
+        name,
+    )
+
+
+def projected(mapper: Mapper, fields: Iterable[str] | None = None, compact: bool = False) -> Mapper:
+    """
+    Variant of a compiled mapper that only builds the requested output.
+
+    Args:
+        mapper: Mapper from compile_mapper()/compile_picker()
+        fields: Output names to keep, in spec order (unknown names are ignored)
+        compact: Leave out empty values, and verbose fields unless they
+            are named in `fields`
+
+    Variants are compiled on first use and cached on the mapper per
+    (fields, compact), so projection costs nothing per item.
+    """
+    if fields is None and not compact:
+        return mapper
+    wanted = frozenset(fields) if fields is not None else None
+    key = (wanted, compact)
+    variant = mapper.variants.get(key)
+    if variant is None:
+        if wanted is not None:
+            spec = tuple(f for f in mapper.fields if f.name in wanted)
+        else:
+            spec = tuple(f for f in mapper.fields if not f.verbose)
+        variant = compile_mapper(spec, mapper.__name__, compact=compact)
+        if len(mapper.variants) >= _MAX_VARIANTS:
+            mapper.variants.clear()
+        mapper.variants[key] = variant
+    return variant
+
+
+def wants(fields: Iterable[str] | None, name: str) -> bool:
+    """Whether a tool-level key (not produced by a mapper) is in the projection."""
+    return fields is None or name in fields
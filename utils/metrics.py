@@ -0,0 +1,312 @@
+"""
+Work24 Metrics
+Prometheus 텍스트 포맷 메트릭 (도구/업스트림 지연 히스토그램, 카운터, 게이지)
+"""
+
+import functools
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from utils.endpoints import short_name
+
+T = TypeVar("T")
+
+# 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 응답 크기 버킷 (바이트)
+SIZE_BUCKETS = (1_000, 5_000, 20_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = labels
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.label_names)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Cumulative bucket histogram."""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., sum, count]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = [0.0] * (len(self.buckets) + 2)
+            self._values[key] = state
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, state in sorted(self._values.items()):
+            for i, bound in enumerate(self.buckets):
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {_format_value(state[i])}"
+                )
+            inf = 'le="+Inf"'
+            lines.append(
+                f"{self.name}_bucket{_format_labels(self.label_names, key, inf)} {_format_value(state[-1])}"
+            )
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {_format_value(state[-1])}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics plus callbacks for externally held counters."""
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], list[str]]] = []
+
+    def register(self, metric: _Metric) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], list[str]]) -> None:
+        """Register a callback returning pre-formatted exposition lines."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ------------------------------------------------------------
+# MCP 도구 메트릭
+# ------------------------------------------------------------
+TOOL_CALLS = registry.register(Counter(
+    "work24_tool_calls_total", "MCP tool calls by outcome.", ("tool", "status"),
+))
+TOOL_ERRORS = registry.register(Counter(
+    "work24_tool_errors_total", "MCP tool failures by error class.", ("tool", "error_class"),
+))
+TOOL_DURATION = registry.register(Histogram(
+    "work24_tool_duration_seconds", "MCP tool latency.", ("tool",),
+))
+TOOL_IN_FLIGHT = registry.register(Gauge(
+    "work24_tool_in_flight", "MCP tool calls currently running.", ("tool",),
+))
+
+# ------------------------------------------------------------
+# 업스트림(Work24) 메트릭
+# ------------------------------------------------------------
+UPSTREAM_REQUESTS = registry.register(Counter(
+    "work24_upstream_requests_total", "Upstream HTTP requests by status code.", ("endpoint", "status_code"),
+))
+UPSTREAM_ERRORS = registry.register(Counter(
+    "work24_upstream_errors_total", "Upstream failures by error class.", ("endpoint", "error_class"),
+))
+UPSTREAM_PHASE = registry.register(Histogram(
+    "work24_upstream_phase_seconds",
+    "Upstream call time split by phase (network, parse, map).",
+    ("endpoint", "phase"),
+))
+UPSTREAM_RESPONSE_BYTES = registry.register(Histogram(
+    "work24_upstream_response_bytes", "Upstream response body size.", ("endpoint",),
+    buckets=SIZE_BUCKETS,
+))
+UPSTREAM_IN_FLIGHT = registry.register(Gauge(
+    "work24_upstream_in_flight", "Upstream requests currently running.", ("endpoint",),
+))
+UPSTREAM_CACHE = registry.register(Counter(
+    "work24_upstream_cache_lookups_total", "Response cache lookups by result.", ("endpoint", "result"),
+))
+UPSTREAM_RETRIES = registry.register(Counter(
+    "work24_upstream_retries_total", "Upstream requests retried after a transient failure.", ("endpoint",),
+))
+UPSTREAM_STALE = registry.register(Counter(
+    "work24_upstream_stale_served_total", "Stale cached responses served by reason.", ("endpoint", "reason"),
+))
+
+
+def instrument_tool(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorator recording count, latency, errors and in-flight gauge of an MCP tool."""
+    tool = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        TOOL_IN_FLIGHT.inc(tool=tool)
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await fn(*args, **kwargs)
+        except BaseException as e:
+            status = "error"
+            TOOL_ERRORS.inc(tool=tool, error_class=type(e).__name__)
+            raise
+        finally:
+            TOOL_DURATION.observe(time.perf_counter() - start, tool=tool)
+            TOOL_CALLS.inc(tool=tool, status=status)
+            TOOL_IN_FLIGHT.dec(tool=tool)
+
+    return wrapper
+
+
+@contextmanager
+def observe_phase(endpoint: str, phase: str) -> Iterator[None]:
+    """Time one phase (network/parse/map) of an upstream call."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        UPSTREAM_PHASE.observe(time.perf_counter() - start, endpoint=short_name(endpoint), phase=phase)
+
+
+def record_phase(endpoint: str, phase: str, seconds: float) -> None:
+    """Record an already measured phase duration."""
+    UPSTREAM_PHASE.observe(seconds, endpoint=short_name(endpoint), phase=phase)
+
+
+@contextmanager
+def track_upstream(endpoint: str) -> Iterator[None]:
+    """Track in-flight gauge and error class of one upstream request."""
+    label = short_name(endpoint)
+    UPSTREAM_IN_FLIGHT.inc(endpoint=label)
+    try:
+        yield
+    except BaseException as e:
+        UPSTREAM_ERRORS.inc(endpoint=label, error_class=type(e).__name__)
+        raise
+    finally:
+        UPSTREAM_IN_FLIGHT.dec(endpoint=label)
+
+
+def record_response(endpoint: str, status_code: int, size: int) -> None:
+    """Record status code and body size of an upstream response."""
+    label = short_name(endpoint)
+    UPSTREAM_REQUESTS.inc(endpoint=label, status_code=str(status_code))
+    UPSTREAM_RESPONSE_BYTES.observe(size, endpoint=label)
+
+
+def record_cache_lookup(endpoint: str, hit: bool) -> None:
+    """Count a response cache hit or miss."""
+    UPSTREAM_CACHE.inc(endpoint=short_name(endpoint), result="hit" if hit else "miss")
+
+
+def record_retry(endpoint: str) -> None:
+    """Count one retried upstream request."""
+    UPSTREAM_RETRIES.inc(endpoint=short_name(endpoint))
+
+
+def record_stale(endpoint: str, reason: str) -> None:
+    """Count a stale response served instead of waiting for upstream."""
+    UPSTREAM_STALE.inc(endpoint=short_name(endpoint), reason=reason)
+
+
+def format_samples(
+    name: str,
+    type_name: str,
+    help_text: str,
+    samples: list[tuple[dict[str, str], float]],
+) -> list[str]:
+    """Format externally held values (used by registry collectors)."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {type_name}"]
+    for labels, value in samples:
+        names = tuple(labels)
+        lines.append(f"{name}{_format_labels(names, tuple(labels[n] for n in names))} {_format_value(value)}")
+    return lines
+
+
+def render_metrics() -> str:
+    """Render all metrics in Prometheus text exposition format."""
+    return registry.render()
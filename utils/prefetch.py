@@ -0,0 +1,179 @@
+"""
+Work24 Predictive Prefetch
+목록 조회 직후 다음 페이지/상위 N건 상세를 낮은 우선순위로 미리 조회해 응답 캐시에 적재
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from utils.config import env_bool, env_float, env_int
+from utils.deadline import detached_context
+from utils.rate_limit import TokenBucket
+
+logger = logging.getLogger("work24_prefetch")
+
+# 업스트림 여유가 없을 때 다시 확인하는 간격 (초)
+_HEADROOM_POLL = 0.25
+
+
+@dataclass
+class _Job:
+    key: str
+    fetch: Callable[[], Awaitable[Any]]
+    ready: Callable[[], bool]
+    queued_at: float
+
+
+class Prefetcher:
+    """
+    Background queue of speculative fetches that warm the response cache.
+
+    Tools schedule the calls an agent is likely to make next (next page,
+    details of the first items); a single worker runs them through the
+    normal tool functions, so results land in the cache under the same keys
+    and a real call arriving meanwhile joins the in-flight request.
+
+    Prefetching never competes with real traffic: jobs wait while ready()
+    reports no upstream headroom, are paced by WORK24_PREFETCH_RPS, and are
+    dropped once older than WORK24_PREFETCH_MAX_AGE seconds or when the
+    queue is full (newest first: the latest listing is the likeliest to be
+    followed up). Settings (read on first use):
+        WORK24_PREFETCH_ENABLED       (default: false)
+        WORK24_PREFETCH_DETAILS       (default: 3, details per list page)
+        WORK24_PREFETCH_RPS           (default: 2)
+        WORK24_PREFETCH_CONCURRENCY   (default: 2)
+        WORK24_PREFETCH_MAX_PENDING   (default: 32)
+        WORK24_PREFETCH_MAX_AGE       (default: 10)
+        WORK24_PREFETCH_RESERVE_TOKENS (default: 5, rate tokens left for real calls)
+    """
+
+    def __init__(self):
+        self._jobs: deque[_Job] = deque()
+        self._keys: set[str] = set()
+        self._worker: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._bucket: TokenBucket | None = None
+        self.scheduled = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.expired = 0
+
+    @property
+    def enabled(self) -> bool:
+        return env_bool("WORK24_PREFETCH_ENABLED", False)
+
+    def detail_count(self) -> int:
+        return env_int("WORK24_PREFETCH_DETAILS", 3)
+
+    def reserve_tokens(self) -> float:
+        return env_float("WORK24_PREFETCH_RESERVE_TOKENS", 5.0)
+
+    def schedule(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ready: Callable[[], bool] = lambda: True,
+    ) -> bool:
+        """
+        Queue fetch() under key unless prefetching is disabled or the same
+        key is already queued or running. Must be called from the event loop.
+        """
+        if not self.enabled or key in self._keys:
+            return False
+        max_pending = env_int("WORK24_PREFETCH_MAX_PENDING", 32)
+        while self._jobs and len(self._jobs) >= max_pending:
+            # 가장 오래된 예측부터 버림
+            old = self._jobs.popleft()
+            self._keys.discard(old.key)
+            self.dropped += 1
+        self._jobs.append(_Job(key, fetch, ready, time.monotonic()))
+        self._keys.add(key)
+        self.scheduled += 1
+        if self._worker is None or self._worker.done():
+            # 요청한 도구 호출의 마감 시간과 무관하게 실행
+            self._worker = asyncio.get_running_loop().create_task(
+                self._run(), name="work24-prefetch", context=detached_context()
+            )
+        return True
+
+    async def _run(self) -> None:
+        if self._bucket is None:
+            self._bucket = TokenBucket(env_float("WORK24_PREFETCH_RPS", 2.0), 1.0)
+        slots = asyncio.Semaphore(max(env_int("WORK24_PREFETCH_CONCURRENCY", 2), 1))
+        max_age = env_float("WORK24_PREFETCH_MAX_AGE", 10.0)
+        while self._jobs:
+            await slots.acquire()
+            job = self._take(max_age)
+            if job is None:
+                slots.release()
+                if self._jobs:
+                    # 일반 요청이 대기 중이거나 토큰이 부족하면 잠시 뒤 다시 확인
+                    await asyncio.sleep(_HEADROOM_POLL)
+                continue
+            await self._bucket.acquire()
+            task = asyncio.create_task(self._execute(job, slots))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _take(self, max_age: float) -> _Job | None:
+        """Newest queued job whose API has headroom, dropping expired ones."""
+        now = time.monotonic()
+        while self._jobs and now - self._jobs[0].queued_at > max_age:
+            self._keys.discard(self._jobs.popleft().key)
+            self.expired += 1
+        for job in reversed(self._jobs):
+            if job.ready():
+                self._jobs.remove(job)
+                return job
+        return None
+
+    async def _execute(self, job: _Job, slots: asyncio.Semaphore) -> None:
+        try:
+            await job.fetch()
+            self.completed += 1
+        except Exception as e:
+            self.failed += 1
+            logger.debug("Prefetch %s failed: %s", job.key, e)
+        finally:
+            self._keys.discard(job.key)
+            slots.release()
+
+    def cancel_all(self) -> None:
+        """
+        Drop queued jobs and cancel running ones; their upstream calls are
+        abandoned unless a real request is waiting on them.
+        """
+        self._jobs.clear()
+        self._keys.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+        for task in self._running:
+            task.cancel()
+
+    async def close(self) -> None:
+        tasks = [*self._running, *([self._worker] if self._worker else [])]
+        self.cancel_all()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "pending": len(self._jobs),
+            "running": len(self._running),
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "expired": self.expired,
+        }
+
+
+# 프로세스 전역 prefetcher
+prefetcher = Prefetcher()
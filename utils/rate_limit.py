@@ -0,0 +1,263 @@
+"""
+Work24 Rate Limiting
+인증키(ApiType)별 토큰 버킷 + AIMD 적응형 동시성 제한 (대기열은 FIFO)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable
+
+from utils.config import env_bool, env_float, env_int
+
+logger = logging.getLogger("work24_rate_limit")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/s up to `burst` tokens.
+
+    Waiters queue on an asyncio.Lock, which wakes them in arrival order,
+    so a burst of callers is admitted first-come first-served.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting if necessary. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+        return time.monotonic() - start
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit driven by upstream latency and overload signals.
+
+    Every healthy completion raises the limit by 1/limit (about +1 per
+    round of `limit` requests). An overloaded completion (429/5xx/timeout)
+    or a short-term latency average above `latency_tolerance` x the
+    long-term baseline multiplies the limit by `backoff`, at most once per
+    baseline latency so one burst of failures counts as one signal.
+    Waiters are admitted strictly in FIFO order.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._short_latency: float | None = None
+        self._baseline_latency: float | None = None
+        self._last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(int(self.limit), self.min_limit)
+
+    def has_headroom(self) -> bool:
+        """Whether a new request would get a slot without queueing."""
+        return not self._waiters and self._has_capacity()
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._has_capacity():
+            self.in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 다음 대기자에게 넘김
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(fut)
+            raise
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        self.in_flight -= 1
+        if overloaded:
+            self._decrease("upstream overload")
+        elif latency >= 0:
+            self._observe_latency(latency)
+        self._wake()
+
+    def _observe_latency(self, latency: float) -> None:
+        if self._short_latency is None:
+            self._short_latency = self._baseline_latency = latency
+        else:
+            self._short_latency += 0.2 * (latency - self._short_latency)
+            self._baseline_latency += 0.02 * (latency - self._baseline_latency)
+        if self._short_latency > self._baseline_latency * self.latency_tolerance:
+            self._decrease("latency %.3fs > baseline %.3fs" % (self._short_latency, self._baseline_latency))
+        elif self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.increases += 1
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline_latency or 0.0):
+            return
+        self._last_decrease = now
+        new_limit = max(float(self.min_limit), self.limit * self.backoff)
+        if new_limit < self.limit:
+            logger.warning("Concurrency limit %.1f -> %.1f (%s)", self.limit, new_limit, reason)
+            self.limit = new_limit
+            self.decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_capacity():
+            fut = self._waiters.popleft()
+            if fut.done():
+                continue
+            self.in_flight += 1
+            fut.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "latency_short": self._short_latency,
+            "latency_baseline": self._baseline_latency,
+        }
+
+
+@dataclass
+class _KeyLimiter:
+    bucket: TokenBucket
+    concurrency: AdaptiveConcurrency
+    throttled_seconds: float = 0.0
+
+
+class RateLimiter:
+    """
+    Per-key (auth key / ApiType) token bucket plus adaptive concurrency.
+
+    Limiters are created lazily on first use so that settings are read
+    after .env is loaded. Environment (per key overrides use the key name,
+    e.g. WORK24_RATE_LIMIT_RECRUIT_RPS):
+        WORK24_RATE_LIMIT_ENABLED          (default: true)
+        WORK24_RATE_LIMIT_[<KEY>_]RPS      (default: 10, 0 = unlimited)
+        WORK24_RATE_LIMIT_[<KEY>_]BURST    (default: 20)
+        WORK24_CONCURRENCY_INITIAL / _MIN / _MAX   (default: 8 / 1 / 32)
+        WORK24_CONCURRENCY_LATENCY_TOLERANCE       (default: 2.0)
+
+    RPS and BURST are per server: each of WORK24_WORKERS worker processes
+    gets an equal share, so the workers together stay within the quota.
+    """
+
+    def __init__(self, is_overload: Callable[[BaseException], bool] = lambda e: False):
+        self.is_overload = is_overload
+        self._limiters: dict[str, _KeyLimiter] = {}
+
+    def _get(self, key: str) -> _KeyLimiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            prefix = f"WORK24_RATE_LIMIT_{key.upper()}"
+            # 워커마다 버킷이 따로 있으므로 서버 전체 한도를 워커 수로 나눔
+            workers = max(env_int("WORK24_WORKERS", 1), 1)
+            rate = env_float(f"{prefix}_RPS", env_float("WORK24_RATE_LIMIT_RPS", 10.0)) / workers
+            burst = env_float(f"{prefix}_BURST", env_float("WORK24_RATE_LIMIT_BURST", 20.0)) / workers
+            limiter = _KeyLimiter(
+                bucket=TokenBucket(rate, max(burst, 1.0)),
+                concurrency=AdaptiveConcurrency(
+                    initial=env_int("WORK24_CONCURRENCY_INITIAL", 8),
+                    min_limit=env_int("WORK24_CONCURRENCY_MIN", 1),
+                    max_limit=env_int("WORK24_CONCURRENCY_MAX", 32),
+                    latency_tolerance=env_float("WORK24_CONCURRENCY_LATENCY_TOLERANCE", 2.0),
+                ),
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def has_headroom(self, key: str, min_tokens: float = 0.0) -> bool:
+        """
+        Whether key has a free concurrency slot, no queued requests and at
+        least min_tokens rate tokens left.
+        """
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            return True
+        if limiter.bucket.rate > 0 and limiter.bucket.tokens < min_tokens:
+            return False
+        return limiter.concurrency.has_headroom()
+
+    @asynccontextmanager
+    async def limit(self, key: str) -> AsyncIterator[None]:
+        """Hold one concurrency slot and one token for the duration of a request."""
+        if not env_bool("WORK24_RATE_LIMIT_ENABLED", True):
+            yield
+            return
+        limiter = self._get(key)
+        start = time.monotonic()
+        await limiter.concurrency.acquire()
+        try:
+            await limiter.bucket.acquire()
+        except BaseException:
+            limiter.concurrency.release(-1.0, overloaded=False)
+            raise
+        limiter.throttled_seconds += time.monotonic() - start
+        sent = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # 취소는 업스트림 상태와 무관 (지연 시간 미반영)
+            limiter.concurrency.release(-1.0, overloaded=False)
+            raise
+        except BaseException as e:
+            limiter.concurrency.release(time.monotonic() - sent, overloaded=self.is_overload(e))
+            raise
+        else:
+            limiter.concurrency.release(time.monotonic() - sent, overloaded=False)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            key: {
+                **limiter.concurrency.stats(),
+                "rate": limiter.bucket.rate,
+                "tokens": round(limiter.bucket.tokens, 2),
+                "throttled_seconds": round(limiter.throttled_seconds, 3),
+            }
+            for key, limiter in self._limiters.items()
+        }
@@ -0,0 +1,50 @@
+"""
+Work24 Region Codes (시도 코드)
+지역명/주소 앞부분을 고용24 API 지역 코드로 변환
+"""
+
+# 주소 앞부분 -> 시도 코드 (행정표준 법정동 시도 코드 앞 2자리)
+# 강원/전북은 특별자치도 전환 전후 코드를 모두 포함 (현재 코드가 마지막)
+_SIDO_PREFIXES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("서울", ("11",)), ("부산", ("26",)), ("대구", ("27",)), ("인천", ("28",)),
+    ("광주", ("29",)), ("대전", ("30",)), ("울산", ("31",)), ("세종", ("36",)),
+    ("경기", ("41",)), ("강원", ("42", "51")),
+    ("충북", ("43",)), ("충청북", ("43",)), ("충남", ("44",)), ("충청남", ("44",)),
+    ("전북", ("45", "52")), ("전라북", ("45", "52")), ("전남", ("46",)), ("전라남", ("46",)),
+    ("경북", ("47",)), ("경상북", ("47",)), ("경남", ("48",)), ("경상남", ("48",)),
+    ("제주", ("50",)),
+)
+
+
+def sido_codes(address: str | None) -> tuple[str, ...]:
+    """Every 시도 code (old and current) for a region name or address."""
+    if not address:
+        return ()
+    head = address.strip()
+    for prefix, codes in _SIDO_PREFIXES:
+        if head.startswith(prefix):
+            return codes
+    return ()
+
+
+def recruit_region_code(region: str | None) -> str | None:
+    """
+    `region` code for 공채속보 (210L21), e.g. '서울' -> '11'.
+
+    210L21 takes the 2-digit 시도 code (see find_recruit_notice); for
+    강원/전북 the current special self-governing province code is used.
+    """
+    codes = sido_codes(region)
+    return codes[-1] if codes else None
+
+
+def training_area_code(region: str | None) -> str | None:
+    """
+    `srchTraArea1` code for 훈련과정 (310L01), e.g. '서울' -> '11'.
+
+    310L01 uses the same 2-digit 시도 code set as 210L21; the catalog
+    indexes both old and current codes of 강원/전북 (see sido_codes), so the
+    current code matches live and catalog searches alike.
+    """
+    codes = sido_codes(region)
+    return codes[-1] if codes else None
@@ -0,0 +1,134 @@
+"""
+Upstream Resilience
+지터가 적용된 지수 백오프 재시도 + 엔드포인트별 서킷 브레이커
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from utils.config import env_float, env_int
+
+logger = logging.getLogger("work24_resilience")
+
+
+class Work24CircuitOpen(Exception):
+    """Raised when an endpoint's circuit is open and no stale response is available."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"{endpoint} is temporarily unavailable (circuit open, retry in {retry_after:.0f}s)")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for idempotent GETs.
+
+    Attempt n (0-based) waits uniform(0, min(max_delay, base_delay * 2**n))
+    before the next try, so synchronized clients spread out instead of
+    retrying in lockstep.
+    """
+    attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            attempts=max(env_int("WORK24_RETRY_ATTEMPTS", 3), 1),
+            base_delay=env_float("WORK24_RETRY_BASE_DELAY", 0.2),
+            max_delay=env_float("WORK24_RETRY_MAX_DELAY", 2.0),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed    - requests flow; `failure_threshold` consecutive failures open it
+    open      - requests are rejected until `reset_timeout` has passed
+    half_open - one probe request is let through; success closes the
+                circuit, failure re-opens it for another reset_timeout
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    def retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (may move open -> half_open)."""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and self.retry_after() <= 0:
+            self.state = "half_open"
+            self._probing = False
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            logger.info("Circuit closed after successful probe")
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Outcome says nothing about upstream health (e.g. cancelled, 4xx)."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": round(self.retry_after(), 1) if self.state == "open" else None,
+        }
+
+
+class CircuitBreakers:
+    """Per-endpoint circuit breakers, created on first use."""
+
+    def __init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=env_int("WORK24_CIRCUIT_FAILURE_THRESHOLD", 5),
+                reset_timeout=env_float("WORK24_CIRCUIT_RESET_TIMEOUT", 30.0),
+            )
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def stats(self) -> dict[str, Any]:
+        return {endpoint: b.stats() for endpoint, b in self._breakers.items()}
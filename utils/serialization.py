@@ -0,0 +1,31 @@
+"""
+Work24 Result Serialization
+도구 결과를 MCP 텍스트 콘텐츠로 직렬화 (compact JSON, 단일 인코더)
+"""
+
+from typing import Any
+
+from pydantic_core import to_json
+
+from utils.mapping import Record
+
+
+def _fallback(value: Any) -> Any:
+    # 로컬 스토어 레코드는 dict로, 그 외 알 수 없는 타입은 문자열로
+    if isinstance(value, Record):
+        return value.to_dict()
+    return str(value)
+
+
+def encode_result(data: Any) -> str:
+    """
+    Tool result as compact JSON text.
+
+    Used as the FastMCP tool_serializer: one pass through pydantic-core's
+    Rust encoder without indentation (the default pretty-prints with
+    indent=2, which adds whitespace to every line of large item lists).
+    Strings are passed through unchanged.
+    """
+    if isinstance(data, str):
+        return data
+    return to_json(data, fallback=_fallback).decode("utf-8")
@@ -0,0 +1,345 @@
+"""
+Work24 Shared Cache (프로세스 간 공유 + 재시작 후에도 유지되는 디스크 캐시)
+SQLite WAL 파일 하나를 여러 워커가 함께 사용하는 응답 캐시 + 요청 리스(lease)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from utils.config import env_float, env_int, env_str
+
+logger = logging.getLogger("work24_shared_cache")
+
+_DEFAULT_PATH = Path(__file__).parent.parent / "data" / "shared_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key         TEXT PRIMARY KEY,
+    endpoint    TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    negative    INTEGER NOT NULL,
+    stored_at   REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    stale_until REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_stale_until ON entries (stale_until);
+CREATE TABLE IF NOT EXISTS leases (
+    key        TEXT PRIMARY KEY,
+    owner      TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_runs (
+    name       TEXT PRIMARY KEY,
+    started_at REAL NOT NULL
+);
+"""
+
+# 이전 버전 DB에는 없는 컬럼 (사용 빈도/크기 기반 eviction, warm-load용)
+_ADDED_COLUMNS = {
+    "hits": "INTEGER NOT NULL DEFAULT 0",
+    "last_used": "REAL NOT NULL DEFAULT 0",
+    "size": "INTEGER NOT NULL DEFAULT 0",
+}
+
+# 사용 횟수는 메모리에 모았다가 이 개수마다 한 번에 기록
+_HIT_FLUSH_THRESHOLD = 256
+
+# 크기 제한 검사 주기 (쓰기 횟수)
+_ENFORCE_EVERY = 64
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 1)
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+class SharedCache:
+    """
+    Response cache tier stored in a SQLite WAL database.
+
+    Every worker process opens the same file, so an entry written by one
+    worker is visible to all, and entries survive restarts. Times are
+    wall-clock (time.time()) because monotonic clocks are not comparable
+    across processes.
+
+    All methods block on SQLite (and zlib/json for values); async callers
+    run them through asyncio.to_thread (see ResponseCache).
+
+    Each entry counts how often it was used (touch()), which drives both
+    eviction when the file exceeds max_entries / max_bytes (least used
+    first) and warm() at startup (most used first).
+
+    Leases give cross-process single-flight: the worker that wins
+    try_lease(key) calls upstream, the others wait for its entry to appear.
+    A lease expires after lease_ttl seconds so a crashed worker cannot
+    block a key forever. Background syncs use the same leases (with their
+    own ttl) to elect the one worker that runs them, and sync_runs to let
+    the other workers follow its runs (see stores.sync.PeriodicSync).
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path or env_str("WORK24_SHARED_CACHE_PATH", str(_DEFAULT_PATH)))
+        self.lease_ttl = env_float("WORK24_SHARED_LEASE_TTL", 30.0)
+        self.max_entries = env_int("WORK24_PERSISTENT_CACHE_MAX_ENTRIES", 20000)
+        self.max_bytes = env_int("WORK24_PERSISTENT_CACHE_MAX_MB", 256) * 1024 * 1024
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # 사용 횟수는 이벤트 루프에서 모으고 기록은 스레드에서 하므로 별도 잠금
+        self._hits_lock = threading.Lock()
+        self._pending_hits: Counter[str] = Counter()
+        self._writes_since_enforce = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.leases_won = 0
+        self.leases_lost = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # isolation_level=None: 자동 트랜잭션 없이 문장 단위 커밋
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # 여러 워커가 동시에 열어도 마이그레이션은 한 번만 (쓰기 잠금 안에서 컬럼 확인)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+                for name, ddl in _ADDED_COLUMNS.items():
+                    if name not in columns:
+                        conn.execute(f"ALTER TABLE entries ADD COLUMN {name} {ddl}")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_hotness ON entries (hits, last_used)")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        self.flush_hits()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------
+    # 캐시 항목
+    # ------------------------------------------------------------
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the entry for key (fresh or within its stale window) as
+        {value, negative, stored_at, expires_at, stale_until}, or None.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, negative, stored_at, expires_at, stale_until FROM entries "
+                "WHERE key = ? AND stale_until > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _row_entry(row)
+
+    def set(self, key: str, endpoint: str, value: Any, ttl: float, negative: bool, stale_ttl: float) -> None:
+        if ttl <= 0:
+            return
+        now = time.time()
+        blob = _encode(value)
+        with self._lock:
+            # 갱신 시에도 사용 횟수(hits)는 유지
+            self._connect().execute(
+                "INSERT INTO entries "
+                "(key, endpoint, value, negative, stored_at, expires_at, stale_until, last_used, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET endpoint = excluded.endpoint, value = excluded.value, "
+                "negative = excluded.negative, stored_at = excluded.stored_at, "
+                "expires_at = excluded.expires_at, stale_until = excluded.stale_until, "
+                "last_used = excluded.last_used, size = excluded.size",
+                (key, endpoint, blob, int(negative), now, now + ttl, now + ttl + max(stale_ttl, 0.0), now, len(blob)),
+            )
+        self.writes += 1
+        self._writes_since_enforce += 1
+        if self._writes_since_enforce >= _ENFORCE_EVERY:
+            self.enforce_limits()
+
+    def touch(self, key: str) -> bool:
+        """
+        Count a use of key (memory or disk hit) without touching the file.
+        Returns True once enough uses are pending for flush_hits() to run.
+        """
+        with self._hits_lock:
+            self._pending_hits[key] += 1
+            return len(self._pending_hits) >= _HIT_FLUSH_THRESHOLD
+
+    def flush_hits(self) -> None:
+        """Write pending use counts in one batch."""
+        with self._hits_lock:
+            if not self._pending_hits:
+                return
+            pending, self._pending_hits = self._pending_hits, Counter()
+        now = time.time()
+        with self._lock:
+            self._connect().executemany(
+                "UPDATE entries SET hits = hits + ?, last_used = ? WHERE key = ?",
+                [(count, now, key) for key, count in pending.items()],
+            )
+
+    def purge_expired(self) -> int:
+        """Delete entries past their stale window. Returns the number removed."""
+        with self._lock:
+            return self._connect().execute(
+                "DELETE FROM entries WHERE stale_until <= ?", (time.time(),)
+            ).rowcount
+
+    def enforce_limits(self) -> int:
+        """
+        Drop expired entries, then the least used ones until the file is
+        within max_entries and max_bytes. Returns the number evicted.
+        """
+        self._writes_since_enforce = 0
+        self.flush_hits()
+        self.purge_expired()
+        with self._lock:
+            conn = self._connect()
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if count <= self.max_entries and total <= self.max_bytes:
+                return 0
+            victims = []
+            for key, size in conn.execute("SELECT key, size FROM entries ORDER BY hits, last_used").fetchall():
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                victims.append((key,))
+                count -= 1
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.evictions += len(victims)
+        logger.info("Evicted %d persistent cache entries (size cap)", len(victims))
+        return len(victims)
+
+    def warm(self, limit: int) -> list[tuple[str, dict[str, Any]]]:
+        """Most used fresh entries as (key, entry), for loading into memory at startup."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value, negative, stored_at, expires_at, stale_until FROM entries "
+                "WHERE expires_at > ? ORDER BY hits DESC, last_used DESC LIMIT ?",
+                (time.time(), limit),
+            ).fetchall()
+        return [(row[0], _row_entry(row[1:])) for row in rows]
+
+    def clear(self) -> None:
+        with self._hits_lock:
+            self._pending_hits.clear()
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    # ------------------------------------------------------------
+    # 요청 리스 (프로세스 간 single-flight)
+    # ------------------------------------------------------------
+    def try_lease(self, key: str, ttl: float | None = None) -> bool:
+        """
+        Take the lease for key if it is free, expired or already ours (which
+        extends it). Held for ttl seconds (default lease_ttl).
+        """
+        now = time.time()
+        ttl = self.lease_ttl if ttl is None else ttl
+        with self._lock:
+            cursor = self._connect().execute(
+                "INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.expires_at <= ? OR leases.owner = excluded.owner",
+                (key, self.owner, now + ttl, now),
+            )
+        won = cursor.rowcount > 0
+        if won:
+            self.leases_won += 1
+        else:
+            self.leases_lost += 1
+        return won
+
+    def lease_held(self, key: str) -> bool:
+        """Whether another worker currently holds a live lease for key."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM leases WHERE key = ? AND expires_at > ? AND owner != ?",
+                (key, time.time(), self.owner),
+            ).fetchone()
+        return row is not None
+
+    def release_lease(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM leases WHERE key = ? AND owner = ?", (key, self.owner)
+            )
+
+    # ------------------------------------------------------------
+    # 백그라운드 동기화 실행 기록 (리더 워커의 실행 시작을 다른 워커가 따라감)
+    # ------------------------------------------------------------
+    def mark_sync_start(self, name: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO sync_runs (name, started_at) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET started_at = excluded.started_at",
+                (name, time.time()),
+            )
+
+    def sync_started_at(self, name: str) -> float | None:
+        """When the latest run of sync name started on any worker."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT started_at FROM sync_runs WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            leases = conn.execute("SELECT COUNT(*) FROM leases WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "active_leases": leases,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "leases_won": self.leases_won,
+            "leases_lost": self.leases_lost,
+        }
+
+
+def _row_entry(row: tuple) -> dict[str, Any]:
+    return {
+        "value": _decode(row[0]),
+        "negative": bool(row[1]),
+        "stored_at": row[2],
+        "expires_at": row[3],
+        "stale_until": row[4],
+    }
@@ -0,0 +1,100 @@
+"""
+Single-flight Request Coalescing
+동일 키의 동시 요청을 하나의 업스트림 호출로 합치기
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from utils.deadline import detached_context
+
+logger = logging.getLogger("work24_singleflight")
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    The first caller (leader) starts the call as a separate task; every
+    caller, the leader included, awaits it through asyncio.shield() so that
+    cancelling one caller never cancels the shared call for the others.
+    Once the last waiting caller is gone (deadline, client disconnect) the
+    shared call is cancelled too, so abandoned requests stop holding
+    connections and rate-limit tokens. Detached calls (background
+    refreshes) run to completion regardless.
+
+    The shared task runs without the leader's deadline (detached_context),
+    since callers that join later may have more time left.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._detached: set[asyncio.Task] = set()
+        self.leaders = 0
+        self.shared = 0
+        self.abandoned = 0
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for key is currently running."""
+        return key in self._calls
+
+    def start(self, key: str, fn: Callable[[], Awaitable[T]], detached: bool = False) -> "asyncio.Task[T]":
+        """
+        Return the in-flight task for key, starting fn() if there is none.
+
+        With detached=True the call is never cancelled for lack of waiters.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(fn(), context=detached_context())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.leaders += 1
+        else:
+            self.shared += 1
+            logger.debug("Joining in-flight call for %s", key)
+        if detached:
+            self._detached.add(task)
+        return task
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() once per key at a time and return its result to all callers."""
+        task = self.start(key, fn)
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._leave(key, task)
+
+    def _leave(self, key: str, task: asyncio.Task) -> None:
+        waiters = self._waiters.pop(task) - 1
+        if waiters > 0:
+            self._waiters[task] = waiters
+        elif not task.done() and task not in self._detached:
+            # 기다리는 호출자가 없으면 업스트림 호출도 중단
+            logger.info("Cancelling abandoned call for %s", key)
+            self.abandoned += 1
+            # 취소가 끝나기 전에 들어온 호출자는 취소된 task가 아닌 새 호출을 시작
+            if self._calls.get(key) is task:
+                del self._calls[key]
+            task.cancel()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        self._detached.discard(task)
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.shared,
+            "abandoned": self.abandoned,
+        }
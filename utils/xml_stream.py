@@ -0,0 +1,134 @@
+"""
+Streaming XML Item Parser
+응답 본문을 청크 단위로 파싱하여 항목(item) 요소마다 평탄한 레코드를 생성
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any
+
+
+def _strip_tag(tag: str) -> str:
+    """Drop an XML namespace prefix ('{ns}tag' -> 'tag')."""
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+
+def _add_value(target: dict[str, Any], key: str, value: Any) -> None:
+    """Insert a child value, turning repeated keys into lists (xmltodict style)."""
+    if key in target:
+        existing = target[key]
+        if isinstance(existing, list):
+            existing.append(value)
+        else:
+            target[key] = [existing, value]
+    else:
+        target[key] = value
+
+
+def element_to_value(elem: ET.Element) -> Any:
+    """
+    Convert an element to the same shape xmltodict.parse() would produce.
+
+    Leaf text is stripped ('' -> None), attributes become '@name' keys and
+    repeated child tags become lists.
+    """
+    text = elem.text.strip() if elem.text else ""
+    if len(elem) == 0 and not elem.attrib:
+        return text or None
+
+    value: dict[str, Any] = {f"@{k}": v for k, v in elem.attrib.items()}
+    for child in elem:
+        _add_value(value, _strip_tag(child.tag), element_to_value(child))
+    if text:
+        value["#text"] = text
+    return value
+
+
+class StreamingItemParser:
+    """
+    Incremental parser for Work24 list/detail documents.
+
+    Feed raw body chunks as they arrive. Every element at item_path
+    (e.g. HRDNet > srchList > scn_list) is converted to a flat record and
+    released from the tree immediately, so only one item's element tree is
+    held at a time. close() returns a dict shaped like xmltodict.parse()
+    output, so existing tool mapping code works unchanged.
+    """
+
+    def __init__(self, item_path: tuple[str, ...]):
+        self.item_path = item_path
+        self.items_parsed = 0
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+        self._path: list[str] = []
+        # item_path 접두 경로의 컨테이너 dict (경로 튜플 -> dict)
+        self._containers: dict[tuple[str, ...], dict[str, Any]] = {}
+        self._result: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed one chunk of the response body."""
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> dict[str, Any]:
+        """Finish parsing and return the xmltodict-shaped document."""
+        self._parser.close()
+        self._drain()
+        # 단일 항목은 xmltodict와 동일하게 리스트가 아닌 dict로 반환
+        item_tag = self.item_path[-1]
+        for container in self._containers.values():
+            items = container.get(item_tag)
+            if isinstance(items, list) and len(items) == 1:
+                container[item_tag] = items[0]
+        return self._result
+
+    def _is_container_path(self, path: tuple[str, ...]) -> bool:
+        return len(path) < len(self.item_path) and path == self.item_path[:len(path)]
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._on_start(elem)
+            else:
+                self._on_end(elem)
+
+    def _on_start(self, elem: ET.Element) -> None:
+        self._stack.append(elem)
+        self._path.append(_strip_tag(elem.tag))
+        path = tuple(self._path)
+        if self._is_container_path(path):
+            container: dict[str, Any] = {f"@{k}": v for k, v in elem.attrib.items()}
+            parent = self._containers.get(path[:-1], self._result)
+            _add_value(parent, path[-1], container)
+            self._containers[path] = container
+
+    def _on_end(self, elem: ET.Element) -> None:
+        path = tuple(self._path)
+        self._stack.pop()
+        self._path.pop()
+        parent_path = path[:-1]
+        parent_container = self._containers.get(parent_path)
+        if not parent_path:
+            parent_container = self._result
+
+        if path == self.item_path:
+            record = element_to_value(elem)
+            container = self._containers[parent_path]
+            items = container.setdefault(path[-1], [])
+            items.append(record)
+            self.items_parsed += 1
+        elif self._is_container_path(path):
+            text = elem.text.strip() if elem.text else ""
+            if text:
+                self._containers[path]["#text"] = text
+        elif parent_container is not None and (not parent_path or self._is_container_path(parent_path)):
+            # 컨테이너 바로 아래의 스칼라/기타 요소 (total, scn_cnt, 에러 문서 등)
+            _add_value(parent_container, path[-1], element_to_value(elem))
+        else:
+            # 항목 내부 요소는 항목 종료 시 함께 변환
+            return
+
+        # 변환이 끝난 요소는 트리에서 제거하여 메모리 해제
+        elem.clear()
+        if self._stack:
+            self._stack[-1].remove(elem)
+